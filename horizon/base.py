@@ -25,12 +25,14 @@ import copy
 import inspect
 import logging
 import os
+import threading
 
 from django.conf import settings
 from django.conf.urls import include
 from django.conf.urls import patterns
 from django.conf.urls import url
 from django.core.exceptions import ImproperlyConfigured  # noqa
+from django.core import urlresolvers
 from django.core.urlresolvers import reverse
 from django.utils.encoding import python_2_unicode_compatible
 from django.utils.functional import SimpleLazyObject  # noqa
@@ -78,6 +80,18 @@ def access_cached(func):
     return inner
 
 
+def cacheable_nav(func):
+    """Marks a ``nav`` callable as safe to cache.
+
+    The sidebar is cached per role set, project, region and enabled services
+    (see the ``nav_cache_timeout`` setting). A callable ``nav`` is assumed to
+    depend on more than that, e.g. on the current dashboard, and is called
+    on every request unless it is decorated with this.
+    """
+    func.nav_cacheable = True
+    return func
+
+
 class NotRegistered(Exception):
     pass
 
@@ -279,6 +293,8 @@ class Panel(HorizonComponent):
     urls = None
     nav = True
     index_url_name = "index"
+    # The URL patterns of the panel while they are loaded lazily.
+    _lazy_urlpatterns = None
 
     def __repr__(self):
         return "<Panel: %s>" % self.slug
@@ -289,6 +305,12 @@ class Panel(HorizonComponent):
         The default URL is defined as the URL pattern with ``name="index"`` in
         the URLconf for this panel.
         """
+        if (self._lazy_urlpatterns is not None and
+                not self._lazy_urlpatterns.loaded and
+                self.index_url_name == "index"):
+            # Linking to a panel shouldn't load its URLconf; by convention
+            # its index view is served at the root of the panel.
+            return self._url_prefix()
         try:
             return reverse('horizon:%s:%s:%s' % (self._registered_with.slug,
                                                  self.slug,
@@ -299,6 +321,15 @@ class Panel(HorizonComponent):
             LOG.info("Error reversing absolute URL for %s: %s" % (self, exc))
             raise
 
+    def _url_prefix(self):
+        """Returns the path the URLconf of this panel is included at."""
+        resolver = urlresolvers.get_resolver(urlresolvers.get_urlconf())
+        prefix = [urlresolvers.get_script_prefix()]
+        for namespace in ('horizon', self._registered_with.slug, self.slug):
+            pattern, resolver = resolver.namespace_dict[namespace]
+            prefix.append(pattern)
+        return ''.join(prefix)
+
     @property
     def _decorated_urls(self):
         urlpatterns = self._get_default_urlpatterns()
@@ -517,6 +548,10 @@ class Dashboard(Registry, HorizonComponent):
     @property
     def _decorated_urls(self):
         urlpatterns = self._get_default_urlpatterns()
+        lazy = conf.HORIZON_CONFIG.get('lazy_panels', False)
+        if lazy:
+            # The views of each panel are decorated when they are loaded.
+            self._decorate_urls(urlpatterns)
 
         default_panel = None
 
@@ -528,15 +563,23 @@ class Dashboard(Registry, HorizonComponent):
             url_slug = panel.slug.replace('.', '/')
             urlpatterns += patterns('',
                                     url(r'^%s/' % url_slug,
-                                        include(panel._decorated_urls)))
+                                        self._include_panel(panel, lazy)))
         # Now the default view, which should come last
         if not default_panel:
             raise NotRegistered('The default panel "%s" is not registered.'
                                 % self.default_panel)
         urlpatterns += patterns('',
                                 url(r'',
-                                    include(default_panel._decorated_urls)))
+                                    self._include_panel(default_panel,
+                                                        lazy)))
+
+        if not lazy:
+            self._decorate_urls(urlpatterns)
 
+        # Return the three arguments to django.conf.urls.include
+        return urlpatterns, self.slug, self.slug
+
+    def _decorate_urls(self, urlpatterns):
         # Require login if not public.
         if not self.public:
             _decorate_urlconf(urlpatterns, require_auth)
@@ -545,8 +588,27 @@ class Dashboard(Registry, HorizonComponent):
         _decorate_urlconf(urlpatterns, require_perms, permissions)
         _decorate_urlconf(urlpatterns, _current_component, dashboard=self)
 
-        # Return the three arguments to django.conf.urls.include
-        return urlpatterns, self.slug, self.slug
+    def _include_panel(self, panel, lazy=False):
+        """Returns the ``include`` of the views of a panel.
+
+        When ``lazy`` is ``True``, the URLconf of the panel (and so its
+        views) is only imported once a URL of the panel is first resolved
+        or reversed.
+        """
+        if not lazy:
+            panel._lazy_urlpatterns = None
+            return include(panel._decorated_urls)
+
+        def url_patterns():
+            LOG.debug("Loading the URLconf of the %s panel.", panel.slug)
+            urlpatterns = panel._decorated_urls[0]
+            self._decorate_urls(urlpatterns)
+            return urlpatterns
+
+        panel._lazy_urlpatterns = LazyURLPattern(url_patterns)
+        # Not passed through include(), which would load the patterns to
+        # check them.
+        return panel._lazy_urlpatterns, panel.slug, panel.slug
 
     def _autodiscover(self):
         """Discovers panels to register from the current dashboard module."""
@@ -649,6 +711,25 @@ except ImportError:
 
 
 class LazyURLPattern(SimpleLazyObject):
+    _setup_lock = threading.RLock()
+
+    @property
+    def loaded(self):
+        return self._wrapped is not empty
+
+    @property
+    def __class__(self):
+        # Checking the type of the patterns, as RegexURLResolver does,
+        # shouldn't load them.
+        return type(self)
+
+    def _setup(self):
+        # URL patterns are decorated in place when they are built, so only
+        # build them once even if concurrent requests need them.
+        with self._setup_lock:
+            if self._wrapped is empty:
+                super(LazyURLPattern, self)._setup()
+
     def __iter__(self):
         if self._wrapped is empty:
             self._setup()
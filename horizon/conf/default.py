@@ -43,5 +43,20 @@ HORIZON_CONFIG = {
     'password_autocomplete': 'off',
 
     # Enable or disable simplified floating IP address management.
-    'simple_ip_management': True
+    'simple_ip_management': True,
+
+    # How long, in seconds, the navigation computed for a given role set,
+    # project and region is cached. 0 disables caching.
+    'nav_cache_timeout': 300,
+
+    # Whether to import the URLconf and views of each panel only once a URL
+    # of the panel is first requested rather than when the URLconf is built.
+    'lazy_panels': False,
+
+    # Batch table actions: how many objects to act on at the same time, how
+    # long to wait for each of them (in seconds) and from how many selected
+    # objects to act in the background. See BatchAction.
+    'batch_action_workers': 1,
+    'batch_action_timeout': None,
+    'batch_action_background_threshold': None
 }
@@ -0,0 +1,70 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from optparse import make_option  # noqa
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand  # noqa
+from django.core.management.base import CommandError  # noqa
+
+from horizon.utils import import_profiler
+
+
+# Runs the profiler as a script, so that it's installed before anything
+# else is imported.
+BOOTSTRAP = "import runpy; runpy.run_path(%r, run_name='__main__')"
+
+
+class Command(BaseCommand):
+    args = "[path path ...]"
+    help = ("Reports the time and memory taken to import each module when "
+            "the dashboard starts up in a new process, then resolves the "
+            "given URL paths as the first requests for them would.")
+    option_list = BaseCommand.option_list + (
+        make_option('--limit',
+                    dest='limit',
+                    type='int',
+                    default=30,
+                    help='How many modules to report. Defaults to 30.'),
+        make_option('--sort',
+                    dest='sort',
+                    choices=sorted(import_profiler.SORT_KEYS),
+                    default='cumulative',
+                    help='Sort the modules by "cumulative" or "self" import '
+                         'time, or by "memory". Defaults to "cumulative".'),
+        make_option('--tracemalloc',
+                    dest='tracemalloc',
+                    action='store_true',
+                    default=False,
+                    help='Measure the memory allocated by Python (on Python '
+                         '3) rather than the resident set size of the '
+                         'process. Slower, but more accurate.'),
+    )
+
+    def handle(self, *paths, **options):
+        script = os.path.splitext(import_profiler.__file__)[0] + '.py'
+        argv = [sys.executable, '-c', BOOTSTRAP % script,
+                '--settings', settings.SETTINGS_MODULE,
+                '--limit', str(options['limit']),
+                '--sort', options['sort']]
+        if options['tracemalloc']:
+            argv.append('--tracemalloc')
+        argv.extend(paths)
+        # The profiled process imports the project as this one does.
+        env = dict(os.environ,
+                   PYTHONPATH=os.pathsep.join(p or os.curdir
+                                              for p in sys.path))
+        if subprocess.call(argv, env=env):
+            raise CommandError("Profiling the startup failed.")
@@ -38,11 +38,22 @@ from openstack_auth import views as auth_views
 import six
 
 from horizon import exceptions
+from horizon.utils import call_profiler
 from horizon.utils import functions as utils
+from horizon.utils import metrics
 
 
 LOG = logging.getLogger(__name__)
 
+REQUEST_DURATION = metrics.Histogram(
+    'horizon_request_duration_seconds',
+    "Duration of the requests, by dashboard and panel.",
+    ['dashboard', 'panel'])
+SESSION_COOKIE_SIZE = metrics.Histogram(
+    'horizon_session_cookie_bytes',
+    "Total size of the cookies of the requests, with cookie-based sessions.",
+    buckets=(512, 1024, 2048, 3072, 4096, 6144, 8192))
+
 
 class HorizonMiddleware(object):
     """The main Horizon middleware class. Required for use of Horizon."""
@@ -90,6 +101,8 @@ class HorizonMiddleware(object):
         request.horizon = {'dashboard': None,
                            'panel': None,
                            'async_messages': []}
+        request._horizon_start = time.time()
+        call_profiler.start(request)
         if not hasattr(request, "user") or not request.user.is_authenticated():
             # proceed no further if the current request is already known
             # not to be authenticated
@@ -120,12 +133,15 @@ class HorizonMiddleware(object):
             session_cookie_name = getattr(
                 settings, 'SESSION_COOKIE_NAME', None)
             session_key = request.COOKIES.get(session_cookie_name)
-            if max_cookie_size is not None and session_key is not None:
+            if session_key is not None and (
+                    max_cookie_size is not None or metrics.enabled()):
                 cookie_size = sum((
                     len(key) + len(value)
                     for key, value in six.iteritems(request.COOKIES)
                 ))
-                if cookie_size >= max_cookie_size:
+                SESSION_COOKIE_SIZE.observe(cookie_size)
+                if (max_cookie_size is not None and
+                        cookie_size >= max_cookie_size):
                     LOG.error(
                         'Total Cookie size for user_id: %(user_id)s is '
                         '%(cookie_size)sB >= %(max_cookie_size)sB. '
@@ -185,6 +201,18 @@ class HorizonMiddleware(object):
         """Convert HttpResponseRedirect to HttpResponse if request is via ajax
         to allow ajax request to redirect url
         """
+        profile = call_profiler.finish()
+        if profile is not None:
+            response['Server-Timing'] = profile.server_timing()
+        start = getattr(request, '_horizon_start', None)
+        if start is not None and metrics.enabled():
+            horizon = getattr(request, 'horizon', {})
+            REQUEST_DURATION.observe(
+                time.time() - start,
+                dashboard=getattr(horizon.get('dashboard'), 'slug', ''),
+                panel=getattr(horizon.get('panel'), 'slug', ''))
+            metrics.maybe_dump()
+
         if request.is_ajax() and hasattr(request, 'horizon'):
             queued_msgs = request.horizon['async_messages']
             if type(response) == http.HttpResponseRedirect:
@@ -26,7 +26,10 @@ from horizon.test.jasmine import jasmine
 
 urlpatterns = patterns(
     'horizon.views',
-    url(r'^home/$', 'user_home', name='user_home')
+    url(r'^home/$', 'user_home', name='user_home'),
+    url(r'^batch_action/(?P<job_id>[0-9a-f]+)/$', 'batch_action_status',
+        name='batch_action_status'),
+    url(r'^metrics$', 'metrics', name='metrics')
 )
 
 # Client-side i18n URLconf.
@@ -0,0 +1,53 @@
+/* Shows the progress of the local image uploads in the images table.
+ *
+ * The rows of the images uploaded through the dashboard carry a
+ * data-upload-status-url attribute, pointing to a JSON view of the status
+ * of the upload. It is polled until the upload is over, and the progress
+ * is written into the ".upload-progress" element of the row's status cell.
+ * The row itself is still updated by horizon.datatables.update.
+ */
+horizon.images = {
+  poll_interval: 2500,
+  // The URLs of the uploads polled, or done polling, on this page.
+  polled_urls: {},
+
+  poll_uploads: function () {
+    $('tr[data-upload-status-url]').each(function () {
+      var url = $(this).attr('data-upload-status-url');
+      if (!horizon.images.polled_urls[url]) {
+        horizon.images.polled_urls[url] = true;
+        horizon.images.poll_upload(this.id, url);
+      }
+    });
+  },
+
+  poll_upload: function (row_id, url) {
+    $.ajax(url, {
+      type: 'GET',
+      dataType: 'json',
+      success: function (status) {
+        // The row may have been replaced by a row update since.
+        var $progress = $(document.getElementById(row_id))
+          .find('.upload-progress');
+        if (status.status === 'uploading' && status.total_bytes) {
+          $progress.text('(' + status.progress + '%)');
+        } else if (status.status === 'error') {
+          $progress.text('(' + gettext('Upload failed') + ')');
+        }
+        if (status.status === 'queued' || status.status === 'uploading') {
+          setTimeout(function () {
+            horizon.images.poll_upload(row_id, url);
+          }, horizon.images.poll_interval);
+        }
+      }
+      // An error means the upload is unknown to the dashboard, for
+      // instance because it ended long ago; there is nothing to show.
+    });
+  }
+};
+
+horizon.addInitFunction(horizon.images.init = function () {
+  horizon.images.poll_uploads();
+  // Rows are added to the tables by their ajax updates.
+  $(document).on('update', 'table', horizon.images.poll_uploads);
+});
@@ -289,10 +289,15 @@ horizon.membership = {
       // Example value: members step_slug_members
       // Pick the class name that contains the step_slug
       var filter = $.grep(css_class.split(' '), function(val){ return val.indexOf(step_slug) !== -1; })[0];
+      // The available list of a searchable step is filled by searching.
+      var searchable = filter === "available_" + step_slug &&
+        $("." + step_slug + "_membership").data('search-url');
 
       if (!$('.' + filter).children('ul').length) {
         $('#no_' + filter).show();
-        $("input[id='" + filter + "']").attr('disabled', 'disabled');
+        if (!searchable) {
+          $("input[id='" + filter + "']").attr('disabled', 'disabled');
+        }
       }
       else {
         $('#no_' + filter).hide();
@@ -366,6 +371,59 @@ horizon.membership = {
     $(add_member_el).find("label, .input").addClass("add_" + step_slug + "_btn");
   },
 
+  /*
+   * Searches for the available items matching the text typed in the filter
+   * of the available list, for the steps which don't embed all of them.
+   **/
+  init_search: function(step_slug, search_url) {
+    var timeout;
+    var separator = search_url.indexOf('?') === -1 ? '?' : '&';
+    // Bound to the container: list_filtering() unbinds the inputs' events.
+    $("." + step_slug + "_membership").on('keyup', "input[id='available_" + step_slug + "']", function () {
+      var query = $.trim($(this).val());
+      window.clearTimeout(timeout);
+      if (query.length === 0) {
+        return;
+      }
+      timeout = window.setTimeout(function () {
+        $.getJSON(search_url + separator + 'q=' + encodeURIComponent(query), function (response) {
+          if (response.error) {
+            horizon.clearErrorMessages();
+            horizon.alert('error', response.error);
+          }
+          horizon.membership.add_search_results(step_slug, response.items);
+        });
+      }, 300);
+    });
+  },
+
+  /*
+   * Adds the items found by a search to the available list and to the
+   * hidden role lists.
+   **/
+  add_search_results: function(step_slug, items) {
+    var data = horizon.membership.data[step_slug];
+    var added = false;
+    angular.forEach(items, function (item) {
+      if (data.hasOwnProperty(item.id)) {
+        return;
+      }
+      data[item.id] = item.name;
+      horizon.membership.get_role_element(step_slug, "").append(
+        $("<option>").attr("value", item.id).text(item.name)
+      );
+      var member_el = horizon.membership.generate_member_element(step_slug, item.name, item.id, [], "+");
+      member_el.find(".role_options").hide();
+      $(".available_" + step_slug).append(member_el);
+      added = true;
+    });
+    if (added) {
+      // Re-apply the current filter to the new items.
+      horizon.membership.list_filtering(step_slug);
+      horizon.membership.detect_no_results(step_slug);
+    }
+  },
+
   /*
    * Fixes the striping of the fake table upon modification of the lists.
    **/
@@ -480,6 +538,11 @@ horizon.membership = {
       horizon.membership.list_filtering(step_slug);
       horizon.membership.detect_no_results(step_slug);
 
+      var search_url = $form.find('.' + step_slug + '_membership').data('search-url');
+      if (search_url) {
+        horizon.membership.init_search(step_slug, search_url);
+      }
+
       // fix initial striping of rows
       $form.find('.fake_' + step_slug + '_table').each( function () {
         var filter = "." + $(this).attr('id');
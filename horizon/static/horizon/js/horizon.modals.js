@@ -61,6 +61,21 @@ horizon.modals.modal_spinner = function (text) {
   horizon.modals.spinner.find(".modal-body").spin(horizon.conf.spinner_options.modal);
 };
 
+/* Loads the contents of the workflow steps which were not rendered with
+ * the workflow, so that the first step is displayed without waiting on
+ * the others. */
+horizon.modals.load_workflow_steps = function (el) {
+  $(el).find(".workflow fieldset[data-loaded='false']").each(function () {
+    var $fieldset = $(this);
+    $fieldset.attr("data-loaded", "loading");
+    $fieldset.spin(horizon.conf.spinner_options.inline);
+    $fieldset.load($fieldset.attr("data-url"), function () {
+      $fieldset.attr("data-loaded", "true");
+      horizon.modals.initModal($fieldset);
+    });
+  });
+};
+
 horizon.modals.init_wizard = function () {
   // If workflow is in wizard mode, initialize wizard.
   var _max_visited_step = 0;
@@ -297,6 +312,11 @@ horizon.addInitFunction(horizon.modals.init = function() {
     });
   });
 
+  // Load the workflow steps which aren't rendered with the workflow, both
+  // in modals and on workflow pages.
+  horizon.modals.addModalInitFunction(horizon.modals.load_workflow_steps);
+  horizon.modals.load_workflow_steps(document);
+
   // Focus the first usable form field in the modal for accessibility.
   horizon.modals.addModalInitFunction(function (modal) {
     $(modal).find(":text, select, textarea").filter(":visible:first").focus();
@@ -0,0 +1,42 @@
+describe("Images (horizon.images.js)", function () {
+   var $row;
+
+   beforeEach(function () {
+      $row = $('<tr id="images__row__1" ' +
+               'data-upload-status-url="/images/1/upload_status/">' +
+               '<td class="status_unknown">Saving ' +
+               '<span class="upload-progress"></span></td></tr>');
+      $('#jasmine-fixture').append($row);
+      horizon.images.polled_urls = {};
+      spyOn(window, 'setTimeout');
+   });
+
+   afterEach(function () {
+      $row.remove();
+   });
+
+   it("Shows the progress of an upload and polls it again", function () {
+      spyOn($, 'ajax').and.callFake(function (url, options) {
+         options.success({status: 'uploading', total_bytes: 1024,
+                          progress: 50});
+      });
+      horizon.images.poll_uploads();
+      expect($.ajax.calls.count()).toEqual(1);
+      expect($.ajax.calls.argsFor(0)[0]).toEqual('/images/1/upload_status/');
+      expect($row.find('.upload-progress').text()).toEqual('(50%)');
+      expect(window.setTimeout).toHaveBeenCalled();
+
+      // A row polled already isn't polled twice.
+      horizon.images.poll_uploads();
+      expect($.ajax.calls.count()).toEqual(1);
+   });
+
+   it("Stops polling a finished upload", function () {
+      spyOn($, 'ajax').and.callFake(function (url, options) {
+         options.success({status: 'active', total_bytes: 1024,
+                          progress: 100});
+      });
+      horizon.images.poll_uploads();
+      expect(window.setTimeout).not.toHaveBeenCalled();
+   });
+});
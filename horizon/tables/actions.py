@@ -14,7 +14,11 @@
 
 from collections import defaultdict
 from collections import OrderedDict
+import copy
+import functools
 import logging
+import threading
+import time
 import types
 import warnings
 
@@ -22,14 +26,19 @@ from django.conf import settings
 from django.core import urlresolvers
 from django import shortcuts
 from django.template.loader import render_to_string  # noqa
+from django.utils.encoding import force_text
 from django.utils.functional import Promise  # noqa
+from django.utils.html import format_html
 from django.utils.http import urlencode  # noqa
 from django.utils.translation import pgettext_lazy
 from django.utils.translation import ugettext_lazy as _
 from django.utils.translation import ungettext_lazy
 import six
 
+from horizon import conf
 from horizon import messages
+from horizon.utils import batch
+from horizon.utils import concurrency
 from horizon.utils import functions
 from horizon.utils import html
 
@@ -39,6 +48,8 @@ LOG = logging.getLogger(__name__)
 # For Bootstrap integration; can be overridden in settings.
 ACTION_CSS_CLASSES = ("btn", "btn-default", "btn-sm")
 STRING_SEPARATOR = "__"
+# Marks the objects of a batch action which were never started.
+_CANCELLED = object()
 
 
 class BaseActionMetaClass(type):
@@ -649,9 +660,35 @@ class BatchAction(Action):
 
        Optional message for providing an appropriate help text for
        the horizon user.
+
+    .. attribute:: concurrent_workers
+
+       The number of objects the action is taken on at the same time.
+       Defaults to the ``batch_action_workers`` key of ``HORIZON_CONFIG``;
+       ``1`` takes the action on one object after the other.
+
+    .. attribute:: item_timeout
+
+       When taking the action concurrently, how long to wait for each
+       object from when the action on it started, in seconds. An object the
+       action didn't complete on in time is reported as possibly still in
+       progress, and the action isn't started on the objects still waiting
+       for a worker. Defaults to the ``batch_action_timeout`` key of
+       ``HORIZON_CONFIG``.
+
+    .. attribute:: background_threshold
+
+       The number of selected objects from which the action is taken in the
+       background, after the response has been returned. The progress of the
+       job can then be followed at the ``horizon:batch_action_status`` URL.
+       Defaults to the ``batch_action_background_threshold`` key of
+       ``HORIZON_CONFIG``; ``None`` never takes the action in the background.
     """
 
     help_text = _("This action cannot be undone.")
+    concurrent_workers = None
+    item_timeout = None
+    background_threshold = None
 
     def __init__(self, **kwargs):
         super(BatchAction, self).__init__(**kwargs)
@@ -803,7 +840,28 @@ class BatchAction(Action):
         attrs.update({'data-batch-action': 'true'})
         return attrs
 
+    def get_concurrent_workers(self):
+        if self.concurrent_workers is not None:
+            return self.concurrent_workers
+        return conf.HORIZON_CONFIG.get('batch_action_workers') or 1
+
+    def get_item_timeout(self):
+        if self.item_timeout is not None:
+            return self.item_timeout
+        return conf.HORIZON_CONFIG.get('batch_action_timeout')
+
+    def get_background_threshold(self):
+        if self.background_threshold is not None:
+            return self.background_threshold
+        return conf.HORIZON_CONFIG.get('batch_action_background_threshold')
+
     def handle(self, table, request, obj_ids):
+        threshold = self.get_background_threshold()
+        if threshold and len(obj_ids) >= threshold:
+            return self.handle_in_background(table, request, obj_ids)
+        if self.get_concurrent_workers() > 1:
+            return self.handle_concurrently(table, request, obj_ids)
+
         action_success = []
         action_failure = []
         action_not_allowed = []
@@ -835,6 +893,224 @@ class BatchAction(Action):
                     'Action %(action)s Failed for %(reason)s', {
                         'action': action_description, 'reason': ex})
 
+        self._add_messages(request, action_success, action_failure,
+                           action_not_allowed)
+        return shortcuts.redirect(self.get_success_url(request))
+
+    def _prepare(self, table, request, obj_ids):
+        """Returns the objects the action is allowed on, and the other ones.
+
+        Each allowed object comes with its own copy of the action, as
+        ``allowed()`` may store state about the object that ``action()``
+        later relies on.
+        """
+        items = []
+        action_not_allowed = []
+        for datum_id in obj_ids:
+            datum = table.get_object_by_id(datum_id)
+            datum_display = table.get_object_display(datum) or datum_id
+            action = copy.copy(self)
+            if not table._filter_action(action, request, datum):
+                action_not_allowed.append(datum_display)
+                LOG.warning('Permission denied to %s: "%s"' %
+                            (self._get_action_name(past=True).lower(),
+                             datum_display))
+                continue
+            items.append((datum_id, datum, datum_display, action))
+        return items, action_not_allowed
+
+    def _wait_item(self, index, future, timeout, started, lock, timed_out):
+        """Waits for the action on the ``index``-th object of :meth:`_run`.
+
+        Returns True once the action completed on the object, and False if
+        it timed out or was never started.
+        """
+        if timeout is None:
+            return future.result() is not _CANCELLED
+        while True:
+            with lock:
+                start = started.get(index)
+                if start is None and timed_out:
+                    # Workers may be stuck on the objects timed out on.
+                    started[index] = _CANCELLED
+                    return False
+            if start is None:
+                remaining = timeout
+            else:
+                remaining = start + timeout - time.time()
+                if remaining <= 0:
+                    return future.done() and \
+                        future.result() is not _CANCELLED
+            try:
+                return future.result(remaining) is not _CANCELLED
+            except concurrency.TimeoutError:
+                continue
+
+    def _log_late(self, item, future):
+        """Logs the outcome of an action completing after timing out."""
+        try:
+            future.result()
+        except Exception as ex:
+            LOG.warning('Action %(action)s failed after timing out for '
+                        '%(reason)s', {'action': item[2], 'reason': ex})
+        else:
+            LOG.info('%s after timing out: "%s"' %
+                     (item[3]._get_action_name(past=True), item[2]))
+
+    def _record_outcome(self, request, item, future, done, cancelled,
+                        results):
+        """Adds an object of :meth:`_run` to the ``results`` it belongs to.
+
+        ``results`` holds the display names of the objects the action
+        succeeded on, failed on, and timed out on.
+        """
+        datum_id, datum, datum_display, action = item
+        action_success, action_failure, action_unknown = results
+        action_description = (action._get_action_name(past=True).lower(),
+                              datum_display)
+        if done:
+            # Call update to invoke changes if needed
+            action.update(request, datum)
+            action_success.append(datum_display)
+            self.success_ids.append(datum_id)
+            LOG.info('%s: "%s"' %
+                     (action._get_action_name(past=True), datum_display))
+        elif cancelled:
+            action_failure.append(datum_display)
+            LOG.warning('Action %(action)s not started after an earlier '
+                        'object timed out', {'action': action_description})
+        else:
+            action_unknown.append(datum_display)
+            future.add_done_callback(functools.partial(self._log_late, item))
+            LOG.warning('Action %(action)s timed out and may still be '
+                        'running', {'action': action_description})
+
+    def _run(self, request, items, progress=None):
+        """Takes the action on the prepared ``items`` concurrently.
+
+        Returns the display names of the objects the action succeeded on,
+        failed on, and timed out on, in the order of ``items``. The timeout
+        of an object runs from when the action on it started. Once an object
+        has timed out, the action isn't started on the objects still
+        waiting for a worker, which are reported as failures; the outcome
+        for the objects timed out on is unknown, as the calls to the service
+        may still complete.
+        """
+        action_success = []
+        action_failure = []
+        action_unknown = []
+        results = (action_success, action_failure, action_unknown)
+        workers = min(self.get_concurrent_workers(), len(items)) or 1
+        timeout = self.get_item_timeout()
+        pool = concurrency.ThreadPool(workers, name='batch-action',
+                                      inline=False)
+        lock = threading.Lock()
+        # The time the action started on each object, or _CANCELLED.
+        started = {}
+
+        def run(index, action, datum_id):
+            with lock:
+                if started.get(index) is _CANCELLED:
+                    return _CANCELLED
+                started[index] = time.time()
+            return action.action(request, datum_id)
+
+        futures = [(index, item, pool.submit(run, index, item[3], item[0]))
+                   for index, item in enumerate(items)]
+        try:
+            for index, item, future in futures:
+                try:
+                    done = self._wait_item(index, future, timeout, started,
+                                           lock, action_unknown)
+                except Exception as ex:
+                    datum_display, action = item[2:]
+                    action_failure.append(datum_display)
+                    action_description = (
+                        action._get_action_name(past=True).lower(),
+                        datum_display)
+                    LOG.warning(
+                        'Action %(action)s Failed for %(reason)s', {
+                            'action': action_description, 'reason': ex})
+                else:
+                    with lock:
+                        cancelled = started.get(index) is _CANCELLED
+                    self._record_outcome(request, item, future, done,
+                                         cancelled, results)
+                if progress is not None:
+                    progress(completed=len(action_success) +
+                             len(action_failure) + len(action_unknown),
+                             succeeded=[force_text(d) for d in action_success],
+                             failed=[force_text(d) for d in action_failure],
+                             unknown=[force_text(d) for d in action_unknown])
+        finally:
+            # Don't wait for the calls which timed out; the workers exit
+            # once they are done with them.
+            pool.shutdown(wait=False)
+        if items:
+            # Name the action after the last object, as done serially.
+            last_action = items[-1][3]
+            self.current_present_action = last_action.current_present_action
+            self.current_past_action = last_action.current_past_action
+        return action_success, action_failure, action_unknown
+
+    def handle_concurrently(self, table, request, obj_ids):
+        """Takes the action on the selected objects concurrently.
+
+        The outcome is reported as by :meth:`handle`.
+        """
+        items, action_not_allowed = self._prepare(table, request, obj_ids)
+        action_success, action_failure, action_unknown = self._run(request,
+                                                                   items)
+        self._add_messages(request, action_success, action_failure,
+                           action_not_allowed, action_unknown)
+        return shortcuts.redirect(self.get_success_url(request))
+
+    def handle_in_background(self, table, request, obj_ids):
+        """Takes the action on the selected objects in the background.
+
+        The objects the action isn't allowed on are reported right away;
+        the outcome for the other ones is recorded in the job's status.
+
+        The request has been answered by the time the job runs, so the
+        action is taken with a copy of it (see
+        :func:`horizon.utils.batch.detach_request`), which is also the
+        ``request`` of the table the action is bound to. The messages added
+        to it are logged.
+        """
+        items, action_not_allowed = self._prepare(table, request, obj_ids)
+        if action_not_allowed:
+            self._add_messages(request, [], [], action_not_allowed)
+        if items:
+            job_request = batch.detach_request(request)
+            job_table = copy.copy(table)
+            job_table.request = job_request
+            for item in items:
+                item[3].table = job_table
+
+            def job(progress):
+                try:
+                    self._run(job_request, items, progress)
+                finally:
+                    for message in job_request._messages:
+                        LOG.info('Batch action message: %s' % message)
+
+            job_id = batch.submit(
+                request, job, len(items),
+                action=force_text(self._get_action_name(items)),
+                not_allowed=[force_text(d) for d in action_not_allowed])
+            LOG.info('%s: %d objects queued as job %s' %
+                     (self._get_action_name(items), len(items), job_id))
+            msg = _('Started to %(action)s in the background.')
+            params = {"action": self._get_action_name(items).lower()}
+            url = urlresolvers.reverse('horizon:batch_action_status',
+                                       args=[job_id])
+            messages.info(request, format_html('{0} <a href="{1}">{2}</a>',
+                                               msg % params, url,
+                                               _('Show progress')))
+        return shortcuts.redirect(self.get_success_url(request))
+
+    def _add_messages(self, request, action_success, action_failure,
+                      action_not_allowed, action_unknown=()):
         # Begin with success message class, downgrade to info if problems.
         success_message_level = messages.success
         if action_not_allowed:
@@ -850,6 +1126,13 @@ class BatchAction(Action):
                       "objs": functions.lazy_join(", ", action_failure)}
             messages.error(request, msg % params)
             success_message_level = messages.info
+        if action_unknown:
+            msg = _('Timed out, %(action)s may still be in progress: '
+                    '%(objs)s')
+            params = {"action": self._get_action_name(action_unknown).lower(),
+                      "objs": functions.lazy_join(", ", action_unknown)}
+            messages.warning(request, msg % params)
+            success_message_level = messages.info
         if action_success:
             msg = _('%(action)s: %(objs)s')
             params = {"action":
@@ -857,8 +1140,6 @@ class BatchAction(Action):
                       "objs": functions.lazy_join(", ", action_success)}
             success_message_level(request, msg % params)
 
-        return shortcuts.redirect(self.get_success_url(request))
-
 
 class DeleteAction(BatchAction):
     """A table action used to perform delete operations on table data.
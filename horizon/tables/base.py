@@ -41,12 +41,19 @@ from horizon import messages
 from horizon.tables.actions import FilterAction  # noqa
 from horizon.tables.actions import LinkAction  # noqa
 from horizon.utils import html
+from horizon.utils import metrics
 
 
 LOG = logging.getLogger(__name__)
 PALETTE = termcolors.PALETTES[termcolors.DEFAULT_PALETTE]
 STRING_SEPARATOR = "__"
 
+ROW_UPDATES = metrics.Counter(
+    'horizon_table_row_updates_total',
+    "AJAX updates of the rows of the tables, by table and whether they "
+    "succeeded.",
+    ['table', 'result'])
+
 
 @six.python_2_unicode_compatible
 class Column(html.HTMLElement):
@@ -1531,6 +1538,8 @@ class DataTable(object):
                 except Exception:
                     datum = None
                     error = exceptions.handle(request, ignore=True)
+                ROW_UPDATES.inc(table=self.name,
+                                result='error' if error else 'ok')
                 if request.is_ajax():
                     if not error:
                         return HttpResponse(new_row.render())
@@ -15,9 +15,12 @@
 from __future__ import absolute_import
 
 from collections import OrderedDict
+import hashlib
+
 from horizon.contrib import bootstrap_datepicker
 
 from django.conf import settings
+from django.core.cache import cache
 from django import template
 from django.utils.encoding import force_text
 from django.utils import translation
@@ -25,6 +28,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from horizon.base import Horizon  # noqa
 from horizon import conf
+from horizon.utils import metrics
 
 
 register = template.Library()
@@ -44,6 +48,137 @@ def has_permissions_on_list(components, user):
             in components if has_permissions(user, component)]
 
 
+NAV_CACHE_PREFIX = 'horizon:nav:'
+
+SHOWN = 'shown'
+DYNAMIC = 'dynamic'
+
+
+def _nav_state(component, context):
+    """Returns the part of the visibility of ``component`` that can be cached.
+
+    That is ``SHOWN``, ``None`` if it is hidden, or ``DYNAMIC`` if it
+    depends on a ``nav`` callable which has to be called on every request.
+    """
+    nav = component.nav
+    if callable(nav) and not getattr(nav, 'nav_cacheable', False):
+        return DYNAMIC if component.can_access(context) else None
+    if callable(nav):
+        nav = nav(context)
+    if nav and component.can_access(context):
+        return SHOWN
+    return None
+
+
+def _is_shown(component, state, context):
+    if state == DYNAMIC:
+        return bool(component.nav(context))
+    return state == SHOWN
+
+
+def _nav_registry():
+    """Returns the registered dashboards, panel groups and panels, by slug."""
+    registry = []
+    for dash in Horizon.get_dashboards():
+        groups = [(group, list(group))
+                  for group in dash.get_panel_groups().values()]
+        registry.append((dash, groups))
+    return registry
+
+
+def _nav_cache_key(request, registry):
+    user = request.user
+    roles = getattr(user, 'roles', None)
+    if roles is None:
+        # Not a Keystone user: what it may see depends on the user itself.
+        identity = ('user', user.pk)
+    else:
+        identity = ('roles', sorted(role['name'] for role in roles))
+    services = sorted(
+        (service.get('type'),
+         sorted(set(endpoint.get('region') or endpoint.get('region_id')
+                    for endpoint in service.get('endpoints', []))))
+        for service in getattr(user, 'service_catalog', None) or [])
+    structure = [(dash.slug, [(group.slug, [panel.slug for panel in panels])
+                              for group, panels in groups])
+                 for dash, groups in registry]
+    key = repr((identity,
+                getattr(user, 'is_superuser', False),
+                getattr(user, 'project_id', None),
+                getattr(user, 'domain_id', None),
+                getattr(user, 'services_region', None),
+                services,
+                structure))
+    return NAV_CACHE_PREFIX + hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def _get_nav_states(context, registry):
+    """Returns the cacheable state of every registered navigation entry.
+
+    This is a list of ``(dashboard slug, state, groups)`` where ``groups``
+    is a list of ``(group slug, [(panel slug, state), ...])``. Hidden
+    panels and empty groups are left out.
+
+    Evaluating the access checks of every panel is the expensive part of
+    rendering the navigation, so the result is kept in the Django cache
+    for ``nav_cache_timeout`` seconds.
+    """
+    timeout = conf.HORIZON_CONFIG['nav_cache_timeout']
+    key = None
+    if timeout:
+        key = _nav_cache_key(context['request'], registry)
+        states = cache.get(key)
+        metrics.CACHE_LOOKUPS.inc(cache='nav',
+                                  result='miss' if states is None else 'hit')
+        if states is not None:
+            return states
+    states = []
+    for dash, groups in registry:
+        group_states = []
+        for group, panels in groups:
+            panel_states = [(panel.slug, state) for panel, state
+                            in ((panel, _nav_state(panel, context))
+                                for panel in panels)
+                            if state is not None]
+            if panel_states:
+                group_states.append((group.slug, panel_states))
+        states.append((dash.slug, _nav_state(dash, context), group_states))
+    if key is not None:
+        cache.set(key, states, timeout)
+    return states
+
+
+def _get_nav(context, dashboard=None, with_panels=True):
+    """Returns the navigation entries shown for the current request.
+
+    This is a list of ``(dashboard, [(group, [panel, ...]), ...])``; only
+    non-empty groups are included. If ``dashboard`` is given only its
+    entries are returned, whether the dashboard itself is shown or not.
+    """
+    registry = _nav_registry()
+    components = dict((dash.slug, (dash, dict(
+        (group.slug, (group, dict((panel.slug, panel) for panel in panels)))
+        for group, panels in groups))) for dash, groups in registry)
+    nav = []
+    for dash_slug, dash_state, group_states in _get_nav_states(context,
+                                                               registry):
+        dash, groups = components[dash_slug]
+        if dashboard is not None:
+            if dash != dashboard:
+                continue
+        elif not _is_shown(dash, dash_state, context):
+            continue
+        non_empty_groups = []
+        for group_slug, panel_states in group_states if with_panels else ():
+            group, panels = groups[group_slug]
+            allowed_panels = [panels[slug] for slug, state in panel_states
+                              if _is_shown(panels[slug], state, context)]
+            if allowed_panels:
+                non_empty_groups.append((group, allowed_panels))
+        nav.append((dash, non_empty_groups))
+    return nav
+
+
 @register.inclusion_tag('horizon/_sidebar.html', takes_context=True)
 def horizon_nav(context):
     if 'request' not in context:
@@ -51,29 +186,12 @@ def horizon_nav(context):
     current_dashboard = context['request'].horizon.get('dashboard', None)
     current_panel_group = None
     current_panel = context['request'].horizon.get('panel', None)
-    dashboards = []
-    for dash in Horizon.get_dashboards():
-        panel_groups = dash.get_panel_groups()
-        non_empty_groups = []
-        for group in panel_groups.values():
-            allowed_panels = []
-            for panel in group:
-                if (callable(panel.nav) and panel.nav(context) and
-                        panel.can_access(context)):
-                    allowed_panels.append(panel)
-                elif (not callable(panel.nav) and panel.nav and
-                        panel.can_access(context)):
-                    allowed_panels.append(panel)
-                if panel == current_panel:
-                    current_panel_group = group.slug
-            if allowed_panels:
-                non_empty_groups.append((group, allowed_panels))
-        if (callable(dash.nav) and dash.nav(context) and
-                dash.can_access(context)):
-            dashboards.append((dash, OrderedDict(non_empty_groups)))
-        elif (not callable(dash.nav) and dash.nav and
-                dash.can_access(context)):
-            dashboards.append((dash, OrderedDict(non_empty_groups)))
+    if current_dashboard is not None and current_panel is not None:
+        for group in current_dashboard.get_panel_groups().values():
+            if current_panel in group:
+                current_panel_group = group.slug
+    dashboards = [(dash, OrderedDict(groups))
+                  for dash, groups in _get_nav(context)]
     return {'components': dashboards,
             'user': context['request'].user,
             'current': current_dashboard,
@@ -88,13 +206,8 @@ def horizon_main_nav(context):
     if 'request' not in context:
         return {}
     current_dashboard = context['request'].horizon.get('dashboard', None)
-    dashboards = []
-    for dash in Horizon.get_dashboards():
-        if dash.can_access(context):
-            if callable(dash.nav) and dash.nav(context):
-                dashboards.append(dash)
-            elif dash.nav:
-                dashboards.append(dash)
+    dashboards = [dash for dash, groups
+                  in _get_nav(context, with_panels=False)]
     return {'components': dashboards,
             'user': context['request'].user,
             'current': current_dashboard,
@@ -107,19 +220,10 @@ def horizon_dashboard_nav(context):
     if 'request' not in context:
         return {}
     dashboard = context['request'].horizon['dashboard']
-    panel_groups = dashboard.get_panel_groups()
     non_empty_groups = []
 
-    for group in panel_groups.values():
-        allowed_panels = []
-        for panel in group:
-            if (callable(panel.nav) and panel.nav(context) and
-                    panel.can_access(context)):
-                allowed_panels.append(panel)
-            elif (not callable(panel.nav) and panel.nav and
-                    panel.can_access(context)):
-                allowed_panels.append(panel)
-        if allowed_panels:
+    for dash, groups in _get_nav(context, dashboard=dashboard):
+        for group, allowed_panels in groups:
             if group.name is None:
                 non_empty_groups.append((dashboard.name, allowed_panels))
             else:
@@ -55,6 +55,10 @@ DATABASES = {'default': {'ENGINE': 'django.db.backends.sqlite3'}}
 
 DEFAULT_EXCEPTION_REPORTER_FILTER = 'horizon.exceptions.HorizonReporterFilter'
 
+# Run concurrent API calls serially so that the order of mocked calls stays
+# predictable.
+CONCURRENT_API_WORKERS = 1
+
 INSTALLED_APPS = (
     'django.contrib.sessions',
     'django.contrib.staticfiles',
@@ -458,6 +458,59 @@ class CustomPermissionsTests(BaseHorizonTests):
         self.assertEqual(resp.status_code, 200)
 
 
+class LazyPanelTests(BaseHorizonTests):
+
+    """Test loading the URLconf of panels on their first request
+    using 'lazy_panels' in HORIZON_CONFIG.
+    """
+
+    def setUp(self):
+        settings.HORIZON_CONFIG['lazy_panels'] = True
+        # refresh config
+        conf.HORIZON_CONFIG._setup()
+        super(LazyPanelTests, self).setUp()
+        # The dashboards are added to the patterns of the site_urls module
+        # each time the URLconf is built, and the first ones win: start the
+        # URLconf used by the client from a fresh module.
+        site_urls = import_module("horizon.site_urls")
+        self._site_urlpatterns = site_urls.urlpatterns
+        moves.reload_module(site_urls)
+        urlresolvers.clear_url_caches()
+        moves.reload_module(import_module("horizon"))
+        moves.reload_module(import_module(settings.ROOT_URLCONF))
+
+    def tearDown(self):
+        import_module("horizon.site_urls").urlpatterns = \
+            self._site_urlpatterns
+        urlresolvers.clear_url_caches()
+        super(LazyPanelTests, self).tearDown()
+        settings.HORIZON_CONFIG.pop('lazy_panels')
+        # refresh config
+        conf.HORIZON_CONFIG._setup()
+
+    def test_lazy_panels(self):
+        cats = horizon.get_dashboard("cats")
+        tigers = cats.get_panel("tigers")
+        kittens = cats.get_panel("kittens")
+        self.assertFalse(tigers._lazy_urlpatterns.loaded)
+
+        self.assertEqual("/cats/tigers/", tigers.get_absolute_url())
+        self.assertEqual("/cats/", cats.get_absolute_url())
+        self.assertFalse(tigers._lazy_urlpatterns.loaded)
+        self.assertFalse(kittens._lazy_urlpatterns.loaded)
+
+        # The permissions of the panel still apply once it is loaded.
+        resp = self.client.get(tigers.get_absolute_url())
+        self.assertEqual(302, resp.status_code)
+        self.assertTrue(tigers._lazy_urlpatterns.loaded)
+        self.assertFalse(kittens._lazy_urlpatterns.loaded)
+
+        self.set_permissions(permissions=['test'])
+        resp = self.client.get(tigers.get_absolute_url())
+        self.assertEqual(200, resp.status_code)
+        self.assertEqual("/cats/tigers/", tigers.get_absolute_url())
+
+
 class RbacHorizonTests(test.TestCase):
 
     def setUp(self):
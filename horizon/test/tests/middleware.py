@@ -17,11 +17,18 @@ import time
 
 from django.conf import settings
 
+from django.http import HttpResponse  # noqa
 from django.http import HttpResponseRedirect  # noqa
 
 from horizon import exceptions
 from horizon import middleware
 from horizon.test import helpers as test
+from horizon.utils import call_profiler
+
+
+class Component(object):
+    def __init__(self, slug):
+        self.slug = slug
 
 
 class MiddlewareTests(test.TestCase):
@@ -64,3 +71,32 @@ class MiddlewareTests(test.TestCase):
         resp = mw.process_response(request, response)
         self.assertEqual(200, resp.status_code)
         self.assertEqual(url, resp['X-Horizon-Location'])
+
+    def test_process_response_server_timing(self):
+        mw = middleware.HorizonMiddleware()
+        request = self.factory.get('/')
+        with self.settings(API_CALL_PROFILER={'enabled': True}):
+            mw.process_request(request)
+            call_profiler.record('compute', 'GET', 'http://nova/servers',
+                                 200, 0, 0.01)
+            resp = mw.process_response(request, HttpResponse())
+        self.assertEqual('compute;dur=10.0;desc="1 calls", '
+                         'total;dur=10.0;desc="1 calls"',
+                         resp['Server-Timing'])
+        self.assertIsNone(call_profiler.get_profile())
+
+        resp = mw.process_response(request, HttpResponse())
+        self.assertNotIn('Server-Timing', resp)
+
+    def test_process_response_request_duration(self):
+        mw = middleware.HorizonMiddleware()
+        request = self.factory.get('/')
+        with self.settings(METRICS={'enabled': True}):
+            mw.process_request(request)
+            # Set by the views of the panels.
+            request.horizon['dashboard'] = Component('cats')
+            request.horizon['panel'] = Component('kittens')
+            mw.process_response(request, HttpResponse())
+        counts, total = middleware.REQUEST_DURATION.get_values()[
+            ('cats', 'kittens')]
+        self.assertGreaterEqual(sum(counts), 1)
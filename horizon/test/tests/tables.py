@@ -13,6 +13,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+import re
+import threading
+
 from django.core.urlresolvers import reverse
 from django import forms
 from django import http
@@ -22,10 +26,13 @@ from django.template import defaultfilters
 from mox3.mox import IsA  # noqa
 import six
 
+from horizon import messages
 from horizon import tables
 from horizon.tables import formset as table_formset
 from horizon.tables import views as table_views
 from horizon.test import helpers as test
+from horizon.utils import batch
+from horizon.utils import concurrency
 
 
 class FakeObject(object):
@@ -1259,6 +1266,147 @@ class DataTableTests(test.TestCase):
         self.assertEqual(u"Downed Item: 1",
                          list(req._messages)[0].message)
 
+    def test_batch_action_concurrent(self):
+        self.mox.stubs.Set(MyBatchAction, 'concurrent_workers', 3)
+        req = self.factory.post('/my_url/', {'action': 'my_table__batch',
+                                             'object_ids': [1, 2, 3]})
+        self.table = MyTable(req, TEST_DATA)
+        action = self.table.base_actions['batch']
+        self.mox.stubs.Set(action, 'success_ids', [])
+        handled = self.table.maybe_handle()
+
+        self.assertEqual(302, handled.status_code)
+        self.assertEqual(['1', '2', '3'], action.success_ids)
+        self.assertEqual(u"Batched Items: object_1, object_2, object_3",
+                         list(req._messages)[0].message)
+
+    def test_toggle_action_concurrent(self):
+        self.mox.stubs.Set(MyToggleAction, 'concurrent_workers', 2)
+        req = self.factory.post('/my_url/', {'action': 'my_table__toggle',
+                                             'object_ids': [1, 2]})
+        self.table = MyTable(req, TEST_DATA)
+        handled = self.table.maybe_handle()
+
+        self.assertEqual(302, handled.status_code)
+        # Each object was acted on with its own state: the last one was
+        # down, so the action is named after upping it.
+        self.assertEqual(u"Upped Items: object_1, object_2",
+                         list(req._messages)[0].message)
+
+    def test_batch_action_item_timeout(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+
+        def action(request, obj_id):
+            if obj_id == '2':
+                event.wait(5)
+
+        self.mox.stubs.Set(MyBatchAction, 'concurrent_workers', 2)
+        self.mox.stubs.Set(MyBatchAction, 'item_timeout', 0.1)
+        self.mox.stubs.Set(MyBatchAction, 'action',
+                           staticmethod(action))
+        req = self.factory.post('/my_url/', {'action': 'my_table__batch',
+                                             'object_ids': [1, 2]})
+        self.table = MyTable(req, TEST_DATA)
+        action = self.table.base_actions['batch']
+        self.mox.stubs.Set(action, 'success_ids', [])
+        handled = self.table.maybe_handle()
+
+        self.assertEqual(302, handled.status_code)
+        self.assertEqual(['1'], action.success_ids)
+        req_messages = [m.message for m in req._messages]
+        self.assertEqual([u"Timed out, batch item may still be in progress: "
+                          u"object_2",
+                          u"Batched Item: object_1"], req_messages)
+
+    def test_batch_action_item_timeout_cancels_waiting(self):
+        event = threading.Event()
+        self.addCleanup(event.set)
+        called = []
+
+        def action(request, obj_id):
+            called.append(obj_id)
+            if obj_id in ('2', '3'):
+                event.wait(5)
+
+        # Both workers get stuck, with object 1 waiting behind them.
+        self.mox.stubs.Set(MyBatchAction, 'concurrent_workers', 2)
+        self.mox.stubs.Set(MyBatchAction, 'item_timeout', 0.1)
+        self.mox.stubs.Set(MyBatchAction, 'action',
+                           staticmethod(action))
+        req = self.factory.post('/my_url/', {'action': 'my_table__batch',
+                                             'object_ids': [2, 3, 1]})
+        self.table = MyTable(req, TEST_DATA)
+        action = self.table.base_actions['batch']
+        self.mox.stubs.Set(action, 'success_ids', [])
+        handled = self.table.maybe_handle()
+        event.set()
+
+        self.assertEqual(302, handled.status_code)
+        self.assertEqual([], action.success_ids)
+        self.assertItemsEqual(['2', '3'], called)
+        req_messages = [m.message for m in req._messages]
+        self.assertEqual([u"Unable to batch item: object_1",
+                          u"Timed out, batch items may still be in "
+                          u"progress: object_2, object_3"], req_messages)
+
+    def test_batch_action_in_background(self):
+        self.mox.stubs.Set(batch, '_pool',
+                           concurrency.ThreadPool(inline=True))
+        self.mox.stubs.Set(MyBatchAction, 'background_threshold', 2)
+        req = self.factory.post('/my_url/', {'action': 'my_table__batch',
+                                             'object_ids': [1, 2, 3]})
+        req.user = self.user
+        self.table = MyTable(req, TEST_DATA)
+        handled = self.table.maybe_handle()
+
+        self.assertEqual(302, handled.status_code)
+        message = list(req._messages)[0].message
+        self.assertIn(u"Started to batch items in the background.", message)
+        url = re.search(r'href="([^"]+)"', message).group(1)
+
+        res = self.client.get(url)
+        self.assertEqual(200, res.status_code)
+        status = json.loads(res.content.decode('utf-8'))
+        self.assertEqual('finished', status['status'])
+        self.assertEqual(3, status['total'])
+        self.assertEqual(3, status['completed'])
+        self.assertEqual(['object_1', 'object_2', 'object_3'],
+                         status['succeeded'])
+        self.assertEqual([], status['failed'])
+
+    def test_batch_action_in_background_detached_request(self):
+        requests = []
+
+        def action(request, obj_id):
+            requests.append(request)
+            messages.error(request, "Not shown: %s" % obj_id)
+
+        self.mox.stubs.Set(batch, '_pool',
+                           concurrency.ThreadPool(inline=True))
+        self.mox.stubs.Set(MyBatchAction, 'background_threshold', 2)
+        self.mox.stubs.Set(MyBatchAction, 'action', staticmethod(action))
+        req = self.factory.post('/my_url/', {'action': 'my_table__batch',
+                                             'object_ids': [1, 2]})
+        req.user = self.user
+        self.table = MyTable(req, TEST_DATA)
+        self.table.maybe_handle()
+
+        self.assertEqual(2, len(requests))
+        self.assertIsNot(req, requests[0])
+        self.assertIs(self.user, requests[0].user)
+        self.assertEqual(1, len(list(req._messages)))
+        self.assertEqual(2, len(list(requests[0]._messages)))
+
+    def test_batch_action_status_not_found(self):
+        job_id = batch.submit(self.factory.get('/my_url/'),
+                              lambda progress: None, 1)
+        # The job belongs to another user.
+        url = reverse('horizon:batch_action_status', args=[job_id])
+        self.assertEqual(404, self.client.get(url).status_code)
+        url = reverse('horizon:batch_action_status', args=['0123abcd'])
+        self.assertEqual(404, self.client.get(url).status_code)
+
     def test_table_column_can_be_selected(self):
         self.table = MyTableSelectable(self.request, TEST_DATA_6)
         # non selectable row
@@ -19,10 +19,16 @@
 import re
 
 from django.conf import settings
+from django.core.cache import cache
 from django.template import Context  # noqa
 from django.template import Template  # noqa
 from django.utils.text import normalize_newlines  # noqa
 
+from mox3 import mox
+
+from horizon.base import cacheable_nav
+from horizon import conf
+from horizon.templatetags import horizon as horizon_tags
 from horizon.test import helpers as test
 from horizon.test.test_dashboards.cats.dashboard import Cats  # noqa
 from horizon.test.test_dashboards.cats.kittens.panel import Kittens  # noqa
@@ -128,3 +134,74 @@ class TemplateTagTests(test.TestCase):
                                             template_text=text,
                                             context={'request': self.request})
         self.assertEqual(single_line(rendered_str), single_line(expected))
+
+
+class NavCacheTests(test.TestCase):
+    def setUp(self):
+        super(NavCacheTests, self).setUp()
+        cache.clear()
+        self.dogs = horizon_tags.Horizon.get_dashboard('dogs')
+        # Loading the URLs completes the registration of the panels.
+        self.dogs.get_absolute_url()
+
+    def tearDown(self):
+        super(NavCacheTests, self).tearDown()
+        cache.clear()
+
+    def render_main_nav(self):
+        template = Template("{% load horizon %}{% horizon_main_nav %}")
+        return template.render(Context({'request': self.request}))
+
+    def test_access_checked_once(self):
+        self.mox.StubOutWithMock(self.dogs, 'can_access')
+        self.dogs.can_access(mox.IgnoreArg()).AndReturn(False)
+        self.mox.ReplayAll()
+
+        for i in range(2):
+            rendered_str = self.render_main_nav()
+            self.assertIn('/cats/', rendered_str)
+            self.assertNotIn('/dogs/', rendered_str)
+
+    def test_access_checked_per_user(self):
+        other_user = self.user.__class__.objects.create_user(
+            username='other', password='password')
+        self.mox.StubOutWithMock(self.dogs, 'can_access')
+        self.dogs.can_access(mox.IgnoreArg()).AndReturn(False)
+        self.dogs.can_access(mox.IgnoreArg()).AndReturn(True)
+        self.mox.ReplayAll()
+
+        self.assertNotIn('/dogs/', self.render_main_nav())
+        self.request.user = other_user
+        self.assertIn('/dogs/', self.render_main_nav())
+
+    def test_dynamic_nav_called_per_request(self):
+        shown = iter([False, True])
+        self.mox.stubs.Set(self.dogs, 'nav', lambda context: next(shown))
+        self.mox.StubOutWithMock(self.dogs, 'can_access')
+        self.dogs.can_access(mox.IgnoreArg()).AndReturn(True)
+        self.mox.ReplayAll()
+
+        self.assertNotIn('/dogs/', self.render_main_nav())
+        self.assertIn('/dogs/', self.render_main_nav())
+
+    def test_cacheable_nav(self):
+        shown = iter([False, True])
+        self.mox.stubs.Set(self.dogs, 'nav',
+                           cacheable_nav(lambda context: next(shown)))
+        self.mox.ReplayAll()
+
+        self.assertNotIn('/dogs/', self.render_main_nav())
+        self.assertNotIn('/dogs/', self.render_main_nav())
+
+    def test_cache_disabled(self):
+        conf.HORIZON_CONFIG['nav_cache_timeout']
+        self.mox.stubs.Set(conf.HORIZON_CONFIG, '_wrapped',
+                           dict(conf.HORIZON_CONFIG._wrapped,
+                                nav_cache_timeout=0))
+        self.mox.StubOutWithMock(self.dogs, 'can_access')
+        self.dogs.can_access(mox.IgnoreArg()).AndReturn(False)
+        self.dogs.can_access(mox.IgnoreArg()).AndReturn(True)
+        self.mox.ReplayAll()
+
+        self.assertNotIn('/dogs/', self.render_main_nav())
+        self.assertIn('/dogs/', self.render_main_nav())
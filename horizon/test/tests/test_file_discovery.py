@@ -10,6 +10,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import os
+import shutil
+import tempfile
+
 from django.utils import unittest
 from horizon.utils import file_discovery as fd
 
@@ -259,3 +263,66 @@ class FinderTests(unittest.TestCase):
 
         self.assertTrue(templates[0].endswith('.html'))
         self.assertTrue(templates[1].endswith('.html'))
+
+
+class StaticFilesManifestTests(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.base_path = os.path.join(self.root, 'static/')
+        self.manifest_path = os.path.join(self.root, 'manifest')
+        for root, files in test_structure:
+            dir_path = os.path.join(self.base_path, os.path.basename(root))
+            os.makedirs(dir_path)
+            for file_name in files:
+                open(os.path.join(dir_path, file_name), 'w').close()
+
+        self.discovered = []
+        discover_static_files = fd.discover_static_files
+
+        def counting_discover_static_files(*args, **kwargs):
+            self.discovered.append(args)
+            return discover_static_files(*args, **kwargs)
+
+        fd.discover_static_files = counting_discover_static_files
+        self.addCleanup(setattr, fd, 'discover_static_files',
+                        discover_static_files)
+
+    def _populate(self):
+        horizon_config = {}
+        manifest = fd.StaticFilesManifest(self.manifest_path)
+        fd.populate_horizon_config(horizon_config, self.base_path,
+                                   manifest=manifest)
+        return manifest, horizon_config
+
+    def test_manifest(self):
+        manifest, horizon_config = self._populate()
+        self.assertEqual(1, len(self.discovered))
+        manifest.save()
+
+        manifest, cached_config = self._populate()
+        self.assertEqual(1, len(self.discovered))
+        self.assertEqual(horizon_config, cached_config)
+        self.assertEqual(6, len(cached_config['js_files']))
+        self.assertTrue(cached_config['js_files'][0].endswith('a.module.js'))
+
+    def test_stale_manifest(self):
+        self._populate()[0].save()
+        # Make sure the directory gets a different modification time.
+        b_path = os.path.join(self.base_path, 'b')
+        os.utime(b_path, (0, 0))
+        open(os.path.join(b_path, 'c.module.js'), 'w').close()
+
+        manifest, horizon_config = self._populate()
+        self.assertEqual(2, len(self.discovered))
+        self.assertEqual(7, len(horizon_config['js_files']))
+
+    def test_missing_or_broken_manifest(self):
+        manifest, horizon_config = self._populate()
+        self.assertEqual({}, fd.StaticFilesManifest(self.manifest_path)
+                         .entries)
+        with open(self.manifest_path, 'w') as manifest_file:
+            manifest_file.write('{not json')
+        self.assertEqual({}, fd.StaticFilesManifest(self.manifest_path)
+                         .entries)
+        self.assertEqual(6, len(horizon_config['js_files']))
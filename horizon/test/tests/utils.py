@@ -13,19 +13,32 @@
 #    under the License.
 
 import datetime
+import json
 import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 
 from django.core.exceptions import ValidationError  # noqa
 import django.template
 from django.template import defaultfilters
+from django.test.utils import override_settings
+import six
 
 from horizon import forms
 from horizon.test import helpers as test
+from horizon.utils import call_profiler
+from horizon.utils import concurrency
 from horizon.utils import filters
 # we have to import the filter in order to register it
 from horizon.utils.filters import parse_isotime  # noqa
 from horizon.utils import functions
+from horizon.utils import import_profiler
 from horizon.utils import memoized
+from horizon.utils import metrics
 from horizon.utils import secret_key
 from horizon.utils import units
 from horizon.utils import validators
@@ -373,6 +386,261 @@ class MemoizedTests(test.TestCase):
         self.assertEqual(1, len(values_list))
 
 
+class ConcurrencyTests(test.TestCase):
+    def test_concurrent_map_keeps_order(self):
+        results = concurrency.concurrent_map(lambda x: x * 2, range(20),
+                                             max_workers=4)
+        self.assertEqual([x * 2 for x in range(20)], results)
+
+    def test_concurrent_map_reraises(self):
+        def fail(x):
+            if x == 3:
+                raise ValueError(x)
+            return x
+
+        self.assertRaises(ValueError, concurrency.concurrent_map, fail,
+                          range(5), max_workers=4)
+
+    def test_run_concurrently(self):
+        results = concurrency.run_concurrently(
+            [('a', lambda: 1), ('b', lambda: 2)], max_workers=2)
+        self.assertEqual([('a', 1), ('b', 2)], list(results.items()))
+
+    def test_run_concurrently_return_exceptions(self):
+        def fail():
+            raise ValueError()
+
+        results = concurrency.run_concurrently(
+            {'ok': lambda: 1, 'fail': fail}, max_workers=2,
+            return_exceptions=True)
+        self.assertEqual(1, results['ok'])
+        self.assertIsInstance(results['fail'], ValueError)
+
+    def test_single_worker_runs_inline(self):
+        pool = concurrency.ThreadPool(1)
+        future = pool.submit(lambda: 42)
+        self.assertTrue(future.done())
+        self.assertEqual(42, future.result())
+        self.assertEqual(0, pool.worker_count)
+
+    def test_shutdown_timeout(self):
+        release = threading.Event()
+        pool = concurrency.ThreadPool(3, inline=False)
+        self.addCleanup(release.set)
+        for _i in range(3):
+            pool.submit(release.wait)
+        start = time.time()
+        pool.shutdown(timeout=0.2)
+        # The timeout is for all the workers, not each of them.
+        self.assertLess(time.time() - start, 0.5)
+
+    def test_future_timeout(self):
+        future = concurrency.Future()
+        self.assertRaises(concurrency.TimeoutError, future.result, 0.01)
+
+
+class ImportProfilerTests(test.TestCase):
+    def test_records_imports(self):
+        sys.modules.pop('colorsys', None)
+        with import_profiler.ImportProfiler() as profiler:
+            import colorsys  # noqa
+        self.assertEqual(['colorsys'], [r.name for r in profiler.records])
+        record = profiler.records[0]
+        self.assertEqual(record.time, record.self_time)
+
+    def test_report(self):
+        records = [import_profiler.ImportRecord('a.b', 0.001, 0, 0.001, 0),
+                   import_profiler.ImportRecord('a', 0.003, 2048, 0.002,
+                                                2048)]
+        out = six.StringIO()
+        import_profiler.report(records, limit=1, out=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(3, len(lines))
+        self.assertEqual("2 modules imported in 0.003 s using 0.0 MiB",
+                         lines[0])
+        self.assertEqual(["3.0", "2.0", "2", "2", "a"], lines[2].split())
+
+
+class CallProfilerTests(test.TestCase):
+    def _profile(self):
+        profile = call_profiler.CallProfile()
+        previous = call_profiler.set_profile(profile)
+        self.addCleanup(call_profiler.set_profile, previous)
+        return profile
+
+    def test_url_template(self):
+        self.assertEqual(
+            '/v2/{id}/servers/{id}/action',
+            call_profiler.url_template(
+                'http://nova:8774/v2/6b7cbf8d1b1f4b1fa0ae6b41b4d38c12/servers/'
+                '2e6c1c3a-2c9b-4c6b-9b0e-95f3bd0c1f35/action?x=1'))
+        self.assertEqual('/v2.0/ports/{id}',
+                         call_profiler.url_template('http://q/v2.0/ports/42'))
+
+    def test_server_timing(self):
+        profile = self._profile()
+        call_profiler.record('compute', 'get', 'http://nova/servers', 200,
+                             10, 0.25)
+        call_profiler.record('image', 'GET', 'http://glance/images', 200,
+                             None, 0.1)
+        call_profiler.record('compute', 'GET', 'http://nova/servers', 200,
+                             10, 0.05)
+        call_profiler.record('compute', 'POST', 'http://nova/servers', 202,
+                             0, 0.1)
+
+        self.assertEqual({('compute', 'http://nova/servers'): 2},
+                         dict(profile.duplicates()))
+        self.assertEqual('compute;dur=400.0;desc="3 calls", '
+                         'image;dur=100.0;desc="1 calls", '
+                         'total;dur=500.0;desc="4 calls", '
+                         'duplicates;desc="1 calls"',
+                         profile.server_timing())
+        self.assertEqual(4, len(profile.summary()['calls']))
+
+    def test_nothing_recorded_without_profile(self):
+        previous = call_profiler.set_profile(None)
+        self.addCleanup(call_profiler.set_profile, previous)
+        call_profiler.record('compute', 'GET', 'http://nova/', 200, 0, 0.1)
+        self.assertIsNone(call_profiler.get_profile())
+
+    def test_start_sampling(self):
+        self.addCleanup(call_profiler.set_profile, None)
+        with self.settings(API_CALL_PROFILER={'enabled': True,
+                                              'sample_rate': 0}):
+            self.assertIsNone(call_profiler.start(None))
+        with self.settings(API_CALL_PROFILER={'enabled': True}):
+            profile = call_profiler.start(None)
+            self.assertIs(profile, call_profiler.get_profile())
+            self.assertIs(profile, call_profiler.finish())
+            self.assertIsNone(call_profiler.get_profile())
+
+    def test_bind(self):
+        profile = self._profile()
+        pool = concurrency.ThreadPool(2)
+        self.addCleanup(pool.shutdown)
+        future = pool.submit(call_profiler.record, 'compute', 'GET',
+                             'http://nova/', 200, 0, 0.1)
+        future.result(5)
+        self.assertEqual(1, len(profile.records))
+
+
+class MetricsTests(test.TestCase):
+    def setUp(self):
+        super(MetricsTests, self).setUp()
+        self.registry = metrics.Registry()
+        self.counter = metrics.Counter('calls_total', "Calls.", ['kind'],
+                                       registry=self.registry)
+        self.histogram = metrics.Histogram('duration_seconds', "Duration.",
+                                           buckets=(0.1, 1),
+                                           registry=self.registry)
+        self.gauge = metrics.Gauge('depth', "Depth.", ['pool'],
+                                   callback=lambda: {('a',): 3},
+                                   registry=self.registry)
+
+    def test_disabled(self):
+        self.counter.inc(kind='x')
+        self.histogram.observe(0.5)
+        self.assertEqual({}, self.counter.get_values())
+        self.assertEqual({}, self.histogram.get_values())
+
+    @override_settings(METRICS={'enabled': True})
+    def test_generate_text(self):
+        self.counter.inc(kind='a"b')
+        self.counter.inc(2, kind='a"b')
+        self.histogram.observe(0.05)
+        self.histogram.observe(0.5)
+        self.histogram.observe(5)
+        self.assertRaises(ValueError, self.counter.inc)
+
+        self.assertEqual(
+            '# HELP calls_total Calls.\n'
+            '# TYPE calls_total counter\n'
+            'calls_total{kind="a\\"b"} 3.0\n'
+            '# HELP duration_seconds Duration.\n'
+            '# TYPE duration_seconds histogram\n'
+            'duration_seconds_bucket{le="0.1"} 1.0\n'
+            'duration_seconds_bucket{le="1.0"} 2.0\n'
+            'duration_seconds_bucket{le="+Inf"} 3.0\n'
+            'duration_seconds_sum 5.55\n'
+            'duration_seconds_count 3.0\n'
+            '# HELP depth Depth.\n'
+            '# TYPE depth gauge\n'
+            'depth{pool="a"} 3.0\n',
+            metrics.generate_text(self.registry.get_metrics()))
+
+    @override_settings(METRICS={'enabled': True})
+    def test_collect(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.counter.inc(kind='a')
+        self.histogram.observe(0.5)
+        other = metrics.Registry()
+        metrics.Counter('calls_total', "Calls.", ['kind'],
+                        registry=other).merge(('a',), 2)
+        metrics.Histogram('duration_seconds', "Duration.", buckets=(0.1, 1),
+                          registry=other).merge((), [[1, 0, 0], 0.05])
+        data = {'pid': os.getppid(),
+                'metrics': [m.dump() for m in other.get_metrics()]}
+        with open(os.path.join(directory, 'metrics-1.json'), 'w') as f:
+            json.dump(data, f)
+
+        collected = dict((m.name, m) for m in
+                         metrics.collect(directory, registry=self.registry))
+
+        self.assertEqual({('a',): 3}, collected['calls_total'].get_values())
+        self.assertEqual({(): [[1, 1, 0], 0.55]},
+                         collected['duration_seconds'].get_values())
+        self.assertEqual({('a', str(os.getpid())): 3},
+                         collected['depth'].get_values())
+
+    @override_settings(METRICS={'enabled': True})
+    def test_collect_archives_exited_processes(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        process = subprocess.Popen(['true'])
+        process.wait()
+        other = metrics.Registry()
+        metrics.Counter('calls_total', "Calls.", ['kind'],
+                        registry=other).merge(('a',), 2)
+        metrics.Gauge('depth', "Depth.", ['pool'],
+                      registry=other).merge(('a',), 1)
+        dumped = [m.dump() for m in other.get_metrics()]
+        # An exited process, and one whose pid this process reuses.
+        for pid, start in ((process.pid, 1), (os.getpid(), 1)):
+            with open(metrics._dump_path(directory, pid, start), 'w') as f:
+                json.dump({'pid': pid, 'start': start, 'metrics': dumped}, f)
+
+        for _i in range(2):
+            collected = dict((m.name, m) for m in
+                             metrics.collect(directory,
+                                             registry=self.registry))
+            self.assertEqual({('a',): 4},
+                             collected['calls_total'].get_values())
+            self.assertEqual({('a', str(os.getpid())): 3},
+                             collected['depth'].get_values())
+        self.assertEqual(
+            sorted([metrics.ARCHIVE_FILE,
+                    os.path.basename(metrics._dump_path(
+                        directory, *metrics._process_id()))]),
+            sorted(name for name in os.listdir(directory)
+                   if not name.startswith('.')))
+
+    @override_settings(METRICS={'enabled': True})
+    def test_view(self):
+        res = self.client.get('/metrics')
+        self.assertEqual(200, res.status_code)
+        self.assertEqual(metrics.CONTENT_TYPE, res['Content-Type'])
+        self.assertIn(b'# TYPE horizon_memoized_calls_total counter',
+                      res.content)
+
+        res = self.client.get('/metrics', REMOTE_ADDR='10.0.0.1')
+        self.assertEqual(403, res.status_code)
+
+    def test_view_disabled(self):
+        res = self.client.get('/metrics')
+        self.assertEqual(404, res.status_code)
+
+
 class GetPageSizeTests(test.TestCase):
     def test_bad_session_value(self):
         requested_url = '/project/instances/'
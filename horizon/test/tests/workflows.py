@@ -111,6 +111,48 @@ class AdminStep(workflows.Step):
     before = TestStepTwo
 
 
+class PrefetchAction(workflows.Action):
+    flavor = forms.ChoiceField(label="Flavor")
+    zone = forms.ChoiceField(label="Zone", required=False)
+
+    calls = []
+
+    class Meta(object):
+        name = "Prefetch Action"
+        slug = "prefetch_action"
+
+    @classmethod
+    def get_prefetch_calls(cls, request, context):
+        def flavors():
+            cls.calls.append("flavors")
+            return [("small", "Small")]
+
+        def zones():
+            cls.calls.append("zones")
+            raise exceptions.NotFound()
+
+        return {"flavors": flavors, "zones": zones}
+
+    def populate_flavor_choices(self, request, context):
+        return self.get_prefetched("flavors")
+
+    def populate_zone_choices(self, request, context):
+        try:
+            return self.get_prefetched("zones")
+        except exceptions.NotFound:
+            return [("", "No zones")]
+
+    def handle(self, request, context):
+        return {}
+
+
+class PrefetchStep(workflows.Step):
+    action_class = PrefetchAction
+    contributes = ("flavor", "zone")
+    after = TestStepOne
+    before = TestStepTwo
+
+
 class TestWorkflow(workflows.Workflow):
     slug = "test_workflow"
     default_steps = (TestStepOne, TestStepTwo)
@@ -302,6 +344,111 @@ class WorkflowsTests(test.TestCase):
         flow = TestWorkflow(req, entry_point="test_action_two")
         self.assertEqual("test_action_two", flow.get_entry_point())
 
+    def test_prefetch(self):
+        PrefetchAction.calls = []
+        TestWorkflow.register(PrefetchStep)
+        flow = TestWorkflow(self.factory.get("/foo"))
+        step = flow.get_step("prefetch_action")
+
+        # Nothing is fetched until the first action is built.
+        self.assertEqual([], PrefetchAction.calls)
+        self.assertIsNone(step.prefetched)
+
+        flow.get_step("test_action_one").action
+        self.assertEqual(["flavors", "zones"], PrefetchAction.calls)
+        self.assertFalse(hasattr(step, "_action"))
+        self.assertEqual([("small", "Small")], step.prefetched["flavors"])
+        self.assertIsInstance(step.prefetched["zones"], exceptions.NotFound)
+
+        action = step.action
+        self.assertEqual(["flavors", "zones"], PrefetchAction.calls)
+        self.assertEqual([("small", "Small")],
+                         action.fields["flavor"].choices)
+        self.assertEqual([("", "No zones")], action.fields["zone"].choices)
+        # Steps which declare nothing don't receive anything.
+        self.assertEqual({}, flow.get_step("test_action_one").prefetched)
+
+    def test_prefetch_standalone_action(self):
+        PrefetchAction.calls = []
+        action = PrefetchAction(self.factory.get("/foo"), {})
+        # The choices are only populated when the fields are first used.
+        self.assertEqual([], PrefetchAction.calls)
+        self.assertEqual([("small", "Small")],
+                         action.fields["flavor"].choices)
+        self.assertEqual(["flavors", "zones"], PrefetchAction.calls)
+        self.assertEqual("fetched",
+                         action.get_prefetched("other", lambda: "fetched"))
+        with self.assertRaises(KeyError):
+            action.get_prefetched("other")
+
+    def test_step_not_allowed(self):
+        class DisallowedStep(PrefetchStep):
+            def allowed(self, request):
+                return False
+
+        PrefetchAction.calls = []
+        TestWorkflow.register(DisallowedStep)
+        flow = TestWorkflow(self.factory.get("/foo"))
+        self.assertQuerysetEqual(flow.steps,
+                                 ['<TestStepOne: test_action_one>',
+                                  '<TestStepTwo: test_action_two>'])
+        flow.render()
+        self.assertEqual([], PrefetchAction.calls)
+
+    def test_post_contributes_lazily(self):
+        seed = {"project_id": PROJECT_ID,
+                "user_id": self.user.id,
+                "instance_id": INSTANCE_ID}
+        req = self.factory.post("/", seed)
+        req.user = self.user
+        flow = TestWorkflow(req, context_seed={"project_id": PROJECT_ID})
+        step_one = flow.get_step("test_action_one")
+        step_two = flow.get_step("test_action_two")
+        self.assertFalse(hasattr(step_one, "_action"))
+        self.assertFalse(hasattr(step_two, "_action"))
+
+        # Building a step only requires the steps before it.
+        step_one.action
+        self.assertFalse(hasattr(step_two, "_action"))
+
+        self.assertEqual(INSTANCE_ID, flow.context["instance_id"])
+        self.assertEqual(PROJECT_ID, flow.context["project_id"])
+        self.assertTrue(hasattr(step_two, "_action"))
+        self.assertTrue(flow.is_valid())
+
+    def test_deferred_step_render(self):
+        class DeferredStep(PrefetchStep):
+            preload = False
+
+        PrefetchAction.calls = []
+        TestWorkflow.register(DeferredStep)
+        flow = TestWorkflow(self.factory.get("/foo"))
+        output = http.HttpResponse(flow.render())
+        self.assertContains(output, 'data-loaded="false"')
+        self.assertContains(output,
+                            'data-url="/foo?step_fragment=prefetch_action"')
+        self.assertNotContains(output, "id_flavor")
+        self.assertEqual([], PrefetchAction.calls)
+
+    def test_workflow_view_step_fragment(self):
+        class DeferredStep(PrefetchStep):
+            preload = False
+
+        PrefetchAction.calls = []
+        TestWorkflow.register(DeferredStep)
+        view = TestWorkflowView.as_view()
+        req = self.factory.get("/?step_fragment=prefetch_action",
+                               HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+        res = view(req)
+        self.assertContains(res, "id_flavor")
+        self.assertNotContains(res, "id_instance_id")
+        self.assertEqual(["flavors", "zones"], PrefetchAction.calls)
+
+        req = self.factory.get("/?step_fragment=missing",
+                               HTTP_X_REQUESTED_WITH="XMLHttpRequest")
+        with self.assertRaises(http.Http404):
+            view(req)
+
     def test_fullscreenworkflow_view(self):
         view = TestFullscreenWorkflowView.as_view()
         req = self.factory.get("/")
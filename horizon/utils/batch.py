@@ -0,0 +1,159 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Background jobs for batch table actions.
+
+Batch actions on very large selections are run on a process-wide pool of
+worker threads once the request that triggered them has returned. The state
+of every job is recorded in the Django cache, so that its progress can be
+queried from any WSGI process with :func:`get_status`.
+"""
+
+import logging
+import threading
+import uuid
+
+from django.contrib.messages.storage import base as messages_base
+from django.contrib.sessions.backends import base as sessions_base
+from django.core.cache import cache
+from django import http
+
+from horizon.utils import concurrency
+
+
+LOG = logging.getLogger(__name__)
+
+CACHE_KEY = 'horizon:batch_action:%s'
+# How long a job's status is kept around, in seconds.
+STATUS_TIMEOUT = 60 * 60
+
+_pool = None
+_lock = threading.Lock()
+
+
+def _get_pool():
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = concurrency.ThreadPool(name='batch-action-job',
+                                           inline=False)
+        return _pool
+
+
+class _JobSession(sessions_base.SessionBase):
+    """A copy of the session of a request which is never saved."""
+
+    def __init__(self, data):
+        super(_JobSession, self).__init__()
+        self._session_cache = dict(data)
+
+    def exists(self, session_key):
+        return False
+
+    def create(self):
+        pass
+
+    def save(self, must_create=False):
+        pass
+
+    def delete(self, session_key=None):
+        pass
+
+    def load(self):
+        return {}
+
+
+class _JobMessages(messages_base.BaseStorage):
+    """Keeps the messages added during a job, as no page will show them."""
+
+    def _get(self, *args, **kwargs):
+        return [], True
+
+    def _store(self, messages, response, *args, **kwargs):
+        return []
+
+
+def detach_request(request):
+    """Returns a copy of ``request`` for a job to make its calls with.
+
+    The request a job was submitted from has been answered by the time the
+    job runs, so the job must not use it. The copy has the same user and a
+    copy of the session, which is never saved. The messages added to it,
+    e.g. by ``horizon.exceptions.handle``, are kept in its ``_messages``.
+    """
+    detached = http.HttpRequest()
+    detached.method = request.method
+    detached.path = request.path
+    detached.path_info = request.path_info
+    detached.META = dict(request.META)
+    # Ajax requests queue their messages in request.horizon.
+    detached.META.pop('HTTP_X_REQUESTED_WITH', None)
+    detached.user = request.user
+    detached.session = _JobSession(getattr(request, 'session', {}))
+    detached.horizon = {'dashboard': None,
+                        'panel': None,
+                        'async_messages': []}
+    detached._messages = _JobMessages(detached)
+    return detached
+
+
+def get_status(job_id):
+    """Returns the status of a job, or ``None`` if it is unknown.
+
+    The status is a dictionary with the ``status`` (one of ``queued``,
+    ``running``, ``finished`` or ``error``), ``user_id``, ``total``,
+    ``completed``, ``succeeded``, ``failed``, ``unknown`` and
+    ``not_allowed`` keys. The last four list the display names of the
+    corresponding objects; ``unknown`` ones were still being acted on when
+    they timed out.
+    """
+    return cache.get(CACHE_KEY % job_id)
+
+
+def set_status(job_id, **values):
+    key = CACHE_KEY % job_id
+    status = cache.get(key) or {'job_id': job_id}
+    status.update(values)
+    cache.set(key, status, STATUS_TIMEOUT)
+    return status
+
+
+def submit(request, fn, total, **status):
+    """Queues ``fn`` and returns the id of its job.
+
+    ``fn`` is called with a callable taking the values to update the job's
+    status with as keyword arguments.
+    """
+    job_id = uuid.uuid4().hex
+    values = {'status': 'queued',
+              'user_id': request.user.id,
+              'total': total,
+              'completed': 0,
+              'succeeded': [],
+              'failed': [],
+              'unknown': [],
+              'not_allowed': []}
+    values.update(status)
+    set_status(job_id, **values)
+    _get_pool().submit(_run, job_id, fn)
+    return job_id
+
+
+def _run(job_id, fn):
+    set_status(job_id, status='running')
+    try:
+        fn(lambda **values: set_status(job_id, **values))
+    except Exception:
+        LOG.exception('Batch action job %s failed.', job_id)
+        set_status(job_id, status='error')
+    else:
+        set_status(job_id, status='finished')
@@ -0,0 +1,227 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Records the calls a request makes to the backend services.
+
+:class:`~horizon.middleware.HorizonMiddleware` starts a :class:`CallProfile`
+for a sampled share of the requests, as configured by the
+``API_CALL_PROFILER`` setting, and reports it in the ``Server-Timing``
+header of the response and optionally in a log line. The code making the
+calls records each of them with :func:`record`; calls made from another
+thread are recorded if that thread runs a function wrapped by :func:`bind`,
+as the :mod:`horizon.utils.concurrency` helpers do.
+"""
+
+import collections
+import json
+import logging
+import random
+import re
+import threading
+
+from django.conf import settings
+from six.moves.urllib import parse
+
+
+LOG = logging.getLogger(__name__)
+
+CallRecord = collections.namedtuple(
+    'CallRecord',
+    ['service', 'method', 'url', 'url_template', 'status', 'bytes',
+     'duration'])
+
+# Path segments replaced in the URL templates the calls are grouped by.
+ID_RE = re.compile(r'^([0-9a-fA-F-]{16,}|\d+)$')
+# The characters not allowed in a Server-Timing metric name.
+NON_TOKEN_RE = re.compile(r"[^A-Za-z0-9!#$%&'*+.^_`|~-]")
+
+_local = threading.local()
+
+
+def get_config():
+    config = {'enabled': False,
+              'sample_rate': 1.0,
+              'log': False}
+    config.update(getattr(settings, 'API_CALL_PROFILER', {}))
+    return config
+
+
+def url_template(url):
+    """Returns the path of ``url`` with the IDs in it replaced by "{id}"."""
+    path = parse.urlsplit(url).path
+    return '/'.join('{id}' if ID_RE.match(segment) else segment
+                    for segment in path.split('/'))
+
+
+class CallProfile(object):
+    """The backend calls made while handling a request."""
+
+    def __init__(self, request=None):
+        self.request = request
+        self.records = []
+        self._lock = threading.Lock()
+
+    def add(self, record):
+        with self._lock:
+            self.records.append(record)
+
+    def get_records(self):
+        with self._lock:
+            return list(self.records)
+
+    def by_service(self):
+        """Returns the number, duration and bytes of the calls per service.
+
+        The services are ordered by the first call made to them.
+        """
+        services = collections.OrderedDict()
+        for record in self.get_records():
+            calls, duration, size = services.get(record.service, (0, 0.0, 0))
+            services[record.service] = (calls + 1,
+                                        duration + record.duration,
+                                        size + (record.bytes or 0))
+        return services
+
+    def duplicates(self):
+        """Returns the GET calls made more than once, with their count.
+
+        Those usually show a value which could be fetched once and reused.
+        """
+        counts = collections.Counter(
+            (record.service, record.url) for record in self.get_records()
+            if record.method in ('GET', 'HEAD'))
+        return collections.OrderedDict(
+            (key, count) for key, count in counts.most_common()
+            if count > 1)
+
+    def server_timing(self):
+        """Returns the value of the ``Server-Timing`` header.
+
+        It holds one metric per service and a "total" one, each with the
+        time spent in the calls (in milliseconds) and their number.
+        """
+        metrics = []
+        total_calls = 0
+        total_duration = 0.0
+        for service, (calls, duration, size) in self.by_service().items():
+            metrics.append('%s;dur=%.1f;desc="%d calls"' %
+                           (NON_TOKEN_RE.sub('_', service), duration * 1000,
+                            calls))
+            total_calls += calls
+            total_duration += duration
+        metrics.append('total;dur=%.1f;desc="%d calls"' %
+                       (total_duration * 1000, total_calls))
+        duplicates = sum(count - 1 for count in self.duplicates().values())
+        if duplicates:
+            metrics.append('duplicates;desc="%d calls"' % duplicates)
+        return ', '.join(metrics)
+
+    def summary(self):
+        """Returns the calls as a dict, for logging."""
+        request = self.request
+        return {
+            'method': getattr(request, 'method', None),
+            'path': getattr(request, 'path', None),
+            'calls': [{'service': record.service,
+                       'method': record.method,
+                       'url': record.url_template,
+                       'status': record.status,
+                       'bytes': record.bytes,
+                       'duration_ms': round(record.duration * 1000, 1)}
+                      for record in self.get_records()],
+            'duplicates': [{'service': service, 'url': url, 'count': count}
+                           for (service, url), count
+                           in self.duplicates().items()],
+        }
+
+
+def get_profile():
+    """Returns the profile calls are recorded in by the current thread."""
+    return getattr(_local, 'profile', None)
+
+
+def set_profile(profile):
+    """Records the calls of the current thread in ``profile``.
+
+    Returns the profile they were recorded in until now.
+    """
+    previous = get_profile()
+    _local.profile = profile
+    return previous
+
+
+def get_request():
+    """Returns the request the current thread is making calls for."""
+    return getattr(_local, 'request', None)
+
+
+def start(request):
+    """Starts recording the calls made for ``request``, if it is sampled.
+
+    Returns the profile the calls are recorded in, or ``None``.
+    """
+    config = get_config()
+    profile = None
+    if config['enabled'] and random.random() < config['sample_rate']:
+        profile = CallProfile(request)
+    _local.request = request
+    set_profile(profile)
+    return profile
+
+
+def finish():
+    """Stops recording calls and returns the profile they were recorded in.
+
+    The profile is logged if the ``log`` option is set.
+    """
+    _local.request = None
+    profile = set_profile(None)
+    if profile is not None and get_config()['log']:
+        LOG.info("API calls: %s", json.dumps(profile.summary()))
+    return profile
+
+
+def record(service, method, url, status, size, duration):
+    """Records a call in the current profile, if there is one.
+
+    :param service: the type of the service called, e.g. "compute".
+    :param size: the size of the response body, in bytes, if known.
+    :param duration: how long the call took, in seconds.
+    """
+    profile = get_profile()
+    if profile is not None:
+        profile.add(CallRecord(service, method.upper(), url,
+                               url_template(url), status, size, duration))
+
+
+def bind(fn):
+    """Returns ``fn`` making its calls for the current request and recording
+    them in the current profile.
+
+    This is for running ``fn`` in another thread; if there is no current
+    request, ``fn`` is returned as it is.
+    """
+    request = get_request()
+    profile = get_profile()
+    if request is None and profile is None:
+        return fn
+
+    def bound(*args, **kwargs):
+        previous_request = get_request()
+        _local.request = request
+        previous = set_profile(profile)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            set_profile(previous)
+            _local.request = previous_request
+    return bound
@@ -0,0 +1,293 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Small thread-based helpers for running blocking calls concurrently.
+
+Most of the time spent rendering a Horizon page is spent waiting on the
+OpenStack APIs. The helpers in this module allow independent calls to be
+issued side by side with a bounded number of worker threads.
+
+The default number of workers is taken from the ``CONCURRENT_API_WORKERS``
+setting. Setting it to ``1`` makes every helper run its calls serially in
+the calling thread, in the order they were given.
+"""
+
+import collections
+import logging
+import sys
+import threading
+import time
+import weakref
+
+from django.conf import settings
+import six
+from six.moves import queue
+
+from horizon.utils import call_profiler
+from horizon.utils import metrics
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 10
+
+# The pools which have not been garbage collected, for the metrics.
+_pools = weakref.WeakSet()
+_pools_lock = threading.Lock()
+
+
+def _pool_stats(attribute):
+    stats = collections.defaultdict(int)
+    with _pools_lock:
+        pools = list(_pools)
+    for pool in pools:
+        if not pool._shutdown:
+            stats[(pool.name,)] += getattr(pool, attribute)
+    return stats
+
+
+QUEUE_DEPTH = metrics.Gauge(
+    'horizon_thread_pool_queue_depth',
+    "Calls waiting for a worker in the thread pools, by pool name.",
+    ['pool'], callback=lambda: _pool_stats('queue_depth'))
+WORKERS = metrics.Gauge(
+    'horizon_thread_pool_workers',
+    "Worker threads of the thread pools, by pool name.",
+    ['pool'], callback=lambda: _pool_stats('worker_count'))
+
+
+class TimeoutError(Exception):
+    """Raised when a :class:`Future` does not complete in time."""
+
+
+def get_max_workers():
+    """Returns the configured default size of a worker pool."""
+    return max(1, int(getattr(settings, 'CONCURRENT_API_WORKERS',
+                              DEFAULT_MAX_WORKERS)))
+
+
+class Future(object):
+    """The pending result of a call submitted to a :class:`ThreadPool`."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._result = None
+        self._exc_info = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def done(self):
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        """Returns the call's return value, re-raising its exception."""
+        if not self._event.wait(timeout):
+            raise TimeoutError()
+        if self._exc_info is not None:
+            six.reraise(*self._exc_info)
+        return self._result
+
+    def exception(self, timeout=None):
+        if not self._event.wait(timeout):
+            raise TimeoutError()
+        if self._exc_info is not None:
+            return self._exc_info[1]
+        return None
+
+    def add_done_callback(self, fn):
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def set_result(self, result):
+        self._result = result
+        self._finish()
+
+    def set_exc_info(self, exc_info):
+        self._exc_info = exc_info
+        self._finish()
+
+    def _finish(self):
+        with self._lock:
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception:
+                LOG.exception("Exception in future callback.")
+
+
+class ThreadPool(object):
+    """A bounded pool of daemon worker threads.
+
+    Workers are started lazily as work is submitted, up to ``max_workers``.
+    A pool with ``max_workers=1`` and ``inline=True`` does not start any
+    threads and runs each call immediately in :meth:`submit`.
+    """
+
+    def __init__(self, max_workers=None, name=None, inline=None):
+        self.max_workers = max_workers or get_max_workers()
+        self.name = name or 'horizon-pool'
+        if inline is None:
+            inline = self.max_workers == 1
+        self.inline = inline
+        self._queue = queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._idle = 0
+        with _pools_lock:
+            _pools.add(self)
+
+    @property
+    def queue_depth(self):
+        """The number of submitted calls that have not started yet."""
+        return self._queue.qsize()
+
+    @property
+    def worker_count(self):
+        return len(self._threads)
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        if self.inline:
+            self._run(future, fn, args, kwargs)
+            return future
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit work to a pool that has "
+                                   "been shut down.")
+            # The calls made by fn are recorded as made by the caller.
+            self._queue.put((future, call_profiler.bind(fn), args, kwargs))
+            if not self._idle and len(self._threads) < self.max_workers:
+                self._start_worker()
+        return future
+
+    def map(self, fn, iterable, timeout=None):
+        """Like the builtin ``map`` but runs the calls in the pool.
+
+        Results are returned in the order of ``iterable``. The first
+        exception raised by any of the calls is re-raised.
+        """
+        futures = [self.submit(fn, item) for item in iterable]
+        return [future.result(timeout) for future in futures]
+
+    def shutdown(self, wait=True, timeout=None):
+        """Stops the workers once the work already submitted is done.
+
+        With ``wait``, returns when they have stopped or, at the latest,
+        after ``timeout`` seconds in all.
+        """
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._threads)
+        for _thread in threads:
+            self._queue.put(None)
+        if wait:
+            deadline = None if timeout is None else time.time() + timeout
+            for thread in threads:
+                if deadline is None:
+                    thread.join()
+                else:
+                    thread.join(max(0, deadline - time.time()))
+
+    def _start_worker(self):
+        thread = threading.Thread(
+            target=self._worker,
+            name='%s-%d' % (self.name, len(self._threads)))
+        thread.daemon = True
+        self._threads.append(thread)
+        thread.start()
+
+    def _worker(self):
+        while True:
+            with self._lock:
+                self._idle += 1
+            item = self._queue.get()
+            with self._lock:
+                self._idle -= 1
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            self._run(future, fn, args, kwargs)
+
+    @staticmethod
+    def _run(future, fn, args, kwargs):
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            future.set_exc_info(sys.exc_info())
+        else:
+            future.set_result(result)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Don't block on calls that are still running if we are bailing out
+        # early, e.g. because one of the results timed out.
+        self.shutdown(wait=exc_type is None)
+
+
+def concurrent_map(fn, items, max_workers=None, timeout=None):
+    """Calls ``fn`` for each of ``items`` concurrently.
+
+    Returns the results in the order of ``items`` and re-raises the first
+    exception encountered (in that order).
+    """
+    items = list(items)
+    workers = min(max_workers or get_max_workers(), len(items)) or 1
+    with ThreadPool(workers, name='horizon-map') as pool:
+        return pool.map(fn, items, timeout=timeout)
+
+
+def ordered_calls(calls):
+    """Returns ``calls`` as a list of ``(name, callable)`` pairs.
+
+    Plain dicts are sorted by name so that the calls are always issued in
+    the same order; ordered mappings and sequences keep their own order.
+    """
+    if isinstance(calls, dict) and not isinstance(calls,
+                                                  collections.OrderedDict):
+        return sorted(calls.items(), key=lambda item: str(item[0]))
+    elif isinstance(calls, dict):
+        return list(calls.items())
+    return list(calls)
+
+
+def run_concurrently(calls, max_workers=None, timeout=None,
+                     return_exceptions=False):
+    """Runs a set of independent calls concurrently.
+
+    :param calls: a mapping (or a sequence of pairs) of a name to a
+        callable taking no arguments; use :func:`functools.partial` to bind
+        arguments.
+    :param return_exceptions: when ``True`` an exception raised by a call is
+        returned as that call's result instead of being re-raised.
+    :returns: an :class:`~collections.OrderedDict` mapping each name to the
+        return value of its callable, in the order the calls were given.
+    """
+    calls = ordered_calls(calls)
+    workers = min(max_workers or get_max_workers(), len(calls)) or 1
+    results = collections.OrderedDict()
+    with ThreadPool(workers, name='horizon-calls') as pool:
+        futures = [(name, pool.submit(fn)) for name, fn in calls]
+        for name, future in futures:
+            if return_exceptions:
+                exc = future.exception(timeout)
+                results[name] = exc if exc is not None else future.result()
+            else:
+                results[name] = future.result(timeout)
+    return results
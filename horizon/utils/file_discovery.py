@@ -10,7 +10,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import json
 import logging
+import os
+import threading
 
 from os import path
 from os import walk
@@ -21,6 +24,10 @@ MODULE_EXT = '.module.js'
 MOCK_EXT = '.mock.js'
 SPEC_EXT = '.spec.js'
 
+# Bumped whenever what the manifest holds changes.
+MANIFEST_FORMAT = 1
+STATIC_FILE_KINDS = ('sources', 'mocks', 'specs', 'templates')
+
 
 def discover_files(base_path, sub_path='', ext='', trim_base_path=False):
     """Discovers all files with certain extension in given paths.
@@ -90,10 +97,100 @@ def discover_static_files(base_path, sub_path=''):
     return sources, mocks, specs, html_files
 
 
+def _dir_mtimes(root):
+    return dict((dir_path, os.stat(dir_path).st_mtime)
+                for dir_path, dirs, files in walk(root))
+
+
+def _is_fresh(dir_mtimes):
+    try:
+        return all(os.stat(dir_path).st_mtime == mtime
+                   for dir_path, mtime in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+class StaticFilesManifest(object):
+    """A cache of the results of :func:`discover_static_files`.
+
+    The manifest is a JSON file recording, for every path static files were
+    discovered in, the files found and the modification time of each
+    directory of the tree. Adding, removing or renaming a file or directory
+    changes the modification time of its parent directory, so an entry is
+    known to be up to date with one ``stat()`` per directory, instead of
+    walking and sorting the whole tree again.
+
+    Entries which are missing or stale are discovered as usual. The
+    manifest is only written by :meth:`save`, which ``collectstatic``
+    calls.
+    """
+
+    def __init__(self, manifest_path):
+        self.path = manifest_path
+        self.entries = {}
+        self.used = set()
+        try:
+            with open(manifest_path) as manifest_file:
+                data = json.load(manifest_file)
+            if data.get('format') == MANIFEST_FORMAT:
+                self.entries = data['entries']
+        except (IOError, ValueError, KeyError, AttributeError) as e:
+            LOG.debug("Static files manifest %s not loaded: %s",
+                      manifest_path, e)
+
+    def discover(self, base_path, sub_path=''):
+        """Same as :func:`discover_static_files`, using the manifest."""
+        key = path.abspath(path.join(base_path, sub_path))
+        self.used.add(key)
+        entry = self.entries.get(key)
+        if entry is not None and _is_fresh(entry['dirs']):
+            return tuple(entry[kind] for kind in STATIC_FILE_KINDS)
+
+        result = discover_static_files(base_path, sub_path=sub_path)
+        entry = dict(zip(STATIC_FILE_KINDS, result))
+        entry['dirs'] = _dir_mtimes(key)
+        self.entries[key] = entry
+        return result
+
+    def save(self):
+        """Writes the entries used by this process to the manifest."""
+        data = {'format': MANIFEST_FORMAT,
+                'entries': dict((key, entry)
+                                for key, entry in self.entries.items()
+                                if key in self.used)}
+        tmp_path = '%s.%d.tmp' % (self.path, os.getpid())
+        with open(tmp_path, 'w') as manifest_file:
+            json.dump(data, manifest_file, indent=1, sort_keys=True)
+        os.rename(tmp_path, self.path)
+
+
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+
+def get_manifest(manifest_path):
+    """Returns the :class:`StaticFilesManifest` kept at ``manifest_path``.
+
+    The same instance is shared by the whole process, so that the manifest
+    can be saved with what the settings discovered.
+    """
+    with _manifests_lock:
+        if manifest_path not in _manifests:
+            _manifests[manifest_path] = StaticFilesManifest(manifest_path)
+        return _manifests[manifest_path]
+
+
 def populate_horizon_config(horizon_config, base_path,
-                            sub_path='', prepend=False):
-    sources, mocks, specs, template = discover_static_files(
-        base_path, sub_path=sub_path)
+                            sub_path='', prepend=False, manifest=None):
+    """Adds the static files discovered in the given paths to the
+    ``js_files``, ``js_spec_files`` and ``external_templates`` of
+    ``horizon_config``.
+
+    If a :class:`StaticFilesManifest` is given, the files are looked up in
+    it first.
+    """
+    discover = manifest.discover if manifest else discover_static_files
+    sources, mocks, specs, template = discover(base_path, sub_path=sub_path)
     if prepend:
         horizon_config.setdefault('js_files', [])[:0] = sources
         horizon_config.setdefault('js_spec_files', [])[:0] = mocks + specs
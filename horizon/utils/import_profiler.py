@@ -0,0 +1,221 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Measures the time and memory taken to import each module.
+
+This module only depends on the standard library, so that it can be run as
+a script (see the ``profile_startup`` management command) and see every
+import made while the dashboard starts up, including Horizon's own.
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import sys
+import time
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins  # noqa
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+# The level of the import statements which don't set one: Python 2 tries
+# a relative import before an absolute one.
+DEFAULT_LEVEL = -1 if sys.version_info[0] == 2 else 0
+
+
+def memory_usage():
+    """Returns the memory used by the process, in bytes.
+
+    This is the memory traced by ``tracemalloc`` if it is tracing, otherwise
+    the peak resident set size of the process (which only ever grows, but
+    mostly does so when modules are imported at startup).
+    """
+    if tracemalloc is not None and tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on OS X and in kilobytes elsewhere.
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class ImportRecord(object):
+    """The cost of importing a module.
+
+    ``time`` and ``memory`` include the modules imported while importing
+    this one, ``self_time`` and ``self_memory`` don't.
+    """
+    def __init__(self, name, time, memory, self_time, self_memory):
+        self.name = name
+        self.time = time
+        self.memory = memory
+        self.self_time = self_time
+        self.self_memory = self_memory
+
+
+class ImportProfiler(object):
+    """Records an :class:`ImportRecord` for each module imported.
+
+    The profiler replaces ``__import__`` while it is installed::
+
+        with ImportProfiler() as profiler:
+            import some.module
+        for record in profiler.records:
+            ...
+    """
+    def __init__(self):
+        self.records = []
+        self._stack = []
+        self._seen = set()
+        self._import = None
+
+    def install(self):
+        self._seen = set(sys.modules)
+        self._import = builtins.__import__
+        builtins.__import__ = self._profiled_import
+
+    def uninstall(self):
+        builtins.__import__ = self._import
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.uninstall()
+
+    def _claim(self, modules):
+        """Adds the modules imported since the last call to ``modules``."""
+        if len(sys.modules) > len(self._seen):
+            new = [mod for mod in sys.modules if mod not in self._seen]
+            self._seen.update(new)
+            modules.extend(mod for mod in new if sys.modules[mod] is not None)
+
+    def _profiled_import(self, name, globals=None, locals=None, fromlist=(),
+                         level=DEFAULT_LEVEL):
+        if level == 0 and not fromlist and sys.modules.get(name) is not None:
+            # Only looks up a module imported already.
+            return self._import(name, globals, locals, fromlist, level)
+
+        # A module is added to sys.modules before its code runs, so the
+        # modules added since the enclosing import started are the ones it
+        # is importing.
+        if self._stack:
+            self._claim(self._stack[-1][2])
+        else:
+            self._claim([])
+        # The time and memory used by the nested imports, and the modules
+        # imported.
+        frame = [0.0, 0, []]
+        self._stack.append(frame)
+        memory = memory_usage()
+        start = time.time()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.time() - start
+            memory = memory_usage() - memory
+            self._stack.pop()
+            self._claim(frame[2])
+            if frame[2]:
+                self._record(frame, elapsed, memory)
+
+    def _record(self, frame, elapsed, memory):
+        # Attribute the import to its innermost module, e.g. "a.b.c" for
+        # "import a.b.c".
+        name = max(frame[2], key=lambda mod: (mod.count('.'), mod))
+        self.records.append(ImportRecord(name, elapsed, memory,
+                                         elapsed - frame[0],
+                                         memory - frame[1]))
+        if self._stack:
+            self._stack[-1][0] += elapsed
+            self._stack[-1][1] += memory
+
+
+SORT_KEYS = {
+    'cumulative': lambda record: record.time,
+    'self': lambda record: record.self_time,
+    'memory': lambda record: record.memory,
+}
+
+
+def report(records, limit=None, sort='cumulative', out=None):
+    """Prints the costliest imports in ``records`` as a table."""
+    out = out or sys.stdout
+    total_time = sum(r.self_time for r in records)
+    total_memory = sum(r.self_memory for r in records)
+    print("%d modules imported in %.3f s using %.1f MiB" %
+          (len(records), total_time, total_memory / 1048576.0), file=out)
+    print("%10s %10s %10s %10s  %s" % ("cum. ms", "self ms", "cum. KiB",
+                                       "self KiB", "module"), file=out)
+    records = sorted(records, key=SORT_KEYS[sort], reverse=True)
+    for record in records[:limit]:
+        print("%10.1f %10.1f %10d %10d  %s" %
+              (record.time * 1000, record.self_time * 1000,
+               record.memory // 1024, record.self_memory // 1024,
+               record.name), file=out)
+
+
+def main(argv=None):
+    """Profiles the startup of the Django project in ``--settings``.
+
+    Once Django is set up, the URLconf is built and each of the ``paths``
+    resolved, as the first requests for them would.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('paths', nargs='*', default=[],
+                        help='URL paths to resolve after startup')
+    parser.add_argument('--settings',
+                        default=os.environ.get('DJANGO_SETTINGS_MODULE'),
+                        help='the Django settings module')
+    parser.add_argument('--limit', type=int, default=30,
+                        help='how many modules to report')
+    parser.add_argument('--sort', choices=sorted(SORT_KEYS),
+                        default='cumulative',
+                        help='what to sort the modules by')
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help='measure the memory allocated by Python '
+                             'instead of the resident set size (slower)')
+    args = parser.parse_args(argv)
+    os.environ['DJANGO_SETTINGS_MODULE'] = args.settings
+
+    if args.tracemalloc and tracemalloc is not None:
+        tracemalloc.start()
+    with ImportProfiler() as profiler:
+        import django
+        django.setup()
+        from django.core import urlresolvers
+        # Building the URLconf discovers the dashboards and their panels.
+        resolver = urlresolvers.get_resolver(None)
+        resolver.namespace_dict
+        for namespace, sub_resolver in resolver.namespace_dict.values():
+            sub_resolver.namespace_dict
+        for path in args.paths:
+            urlresolvers.resolve(path)
+    report(profiler.records, limit=args.limit, sort=args.sort)
+
+
+if __name__ == '__main__':
+    main()
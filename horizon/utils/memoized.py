@@ -18,6 +18,14 @@ import weakref
 
 import six
 
+from horizon.utils import metrics
+
+
+CALLS = metrics.Counter(
+    'horizon_memoized_calls_total',
+    "Calls to the memoized functions, by whether their result was cached.",
+    ['function', 'result'])
+
 
 class UnhashableKeyWarning(RuntimeWarning):
     """Raised when trying to memoize a function with an unhashable argument."""
@@ -60,6 +68,7 @@ def memoized(func):
     # instance for every decorated function, and it's stored in a closure of
     # the wrapped function.
     cache = {}
+    name = '%s.%s' % (func.__module__, func.__name__)
 
     @functools.wraps(func)
     def wrapped(*args, **kwargs):
@@ -87,6 +96,7 @@ def memoized(func):
             # code, and the miss is in an exception.
             value = cache[key]
         except KeyError:
+            CALLS.inc(function=name, result='miss')
             value = cache[key] = func(*args, **kwargs)
         except TypeError:
             # The calculated key may be unhashable when an unhashable object,
@@ -96,7 +106,10 @@ def memoized(func):
             warnings.warn(
                 "The key %r is not hashable and cannot be memoized." % (key,),
                 UnhashableKeyWarning, 2)
+            CALLS.inc(function=name, result='miss')
             value = func(*args, **kwargs)
+        else:
+            CALLS.inc(function=name, result='hit')
         return value
     return wrapped
 
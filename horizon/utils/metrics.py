@@ -0,0 +1,496 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Counters, gauges and histograms of the internals of the dashboard.
+
+The metrics are kept in a process-local :data:`REGISTRY` and exposed in the
+Prometheus text format by the ``/metrics`` view, as configured by the
+``METRICS`` setting. Nothing is recorded unless it is enabled.
+
+When the dashboard runs in several processes (e.g. pre-forked WSGI workers)
+each one only knows its own metrics. If ``multiprocess_dir`` is set, every
+process writes its metrics to a file in that directory, at most once every
+:data:`DUMP_INTERVAL` seconds, and the ``/metrics`` view adds up those of
+all the processes. The files are named after the pid and the start time of
+the processes, and those of the processes which have exited are folded into
+one archive file.
+"""
+
+import atexit
+import bisect
+import contextlib
+import errno
+import fcntl
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core import signals
+from django.dispatch import receiver
+import six
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0)
+INF = float('inf')
+# The minimum number of seconds between two writes of the metrics of a
+# process in multiprocess mode.
+DUMP_INTERVAL = 1.0
+# The file the metrics of the processes which have exited are added up in.
+ARCHIVE_FILE = 'metrics-archived.json'
+
+_enabled = None
+_last_dump = 0
+_process = None
+
+
+def get_config():
+    config = {'enabled': False,
+              'allowed_ips': ['127.0.0.1', '::1'],
+              'multiprocess_dir': None}
+    config.update(getattr(settings, 'METRICS', {}))
+    return config
+
+
+def enabled():
+    """Returns whether metrics are being recorded.
+
+    This is checked for every value recorded, so it is only read from the
+    settings once.
+    """
+    global _enabled
+    if _enabled is None:
+        if not settings.configured:
+            return False
+        _enabled = bool(get_config()['enabled'])
+    return _enabled
+
+
+@receiver(signals.setting_changed)
+def _setting_changed(setting, **kwargs):
+    global _enabled
+    if setting == 'METRICS':
+        _enabled = None
+
+
+class Registry(object):
+    """The metrics of a process, by name."""
+
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            if any(m.name == metric.name for m in self._metrics):
+                raise ValueError("A metric named %s is already registered."
+                                 % metric.name)
+            self._metrics.append(metric)
+        return metric
+
+    def unregister(self, metric):
+        with self._lock:
+            self._metrics.remove(metric)
+
+    def get_metrics(self):
+        with self._lock:
+            return list(self._metrics)
+
+
+REGISTRY = Registry()
+
+
+class Metric(object):
+    """A value per combination of the values of ``labelnames``."""
+
+    type = None
+
+    def __init__(self, name, documentation, labelnames=(),
+                 registry=REGISTRY):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError("%s takes the labels %s, not %s." %
+                             (self.name, ", ".join(self.labelnames),
+                              ", ".join(sorted(labels))))
+        return tuple(six.text_type(labels[name]) for name in self.labelnames)
+
+    def get_values(self):
+        """Returns a dict mapping the tuples of label values to the values."""
+        with self._lock:
+            return dict(self._values)
+
+    def merge(self, key, value):
+        """Adds ``value`` to the value for the label values ``key``."""
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def samples(self):
+        """Yields the name, labels and value of each sample of the metric."""
+        for key, value in sorted(self.get_values().items()):
+            yield self.name, list(zip(self.labelnames, key)), value
+
+    def dump(self):
+        """Returns the metric as JSON-serializable data."""
+        return {'name': self.name,
+                'type': self.type,
+                'documentation': self.documentation,
+                'labelnames': self.labelnames,
+                'values': [[list(key), value] for key, value
+                           in self.get_values().items()]}
+
+    @classmethod
+    def load(cls, data):
+        """Returns an unregistered metric with the data of :meth:`dump`."""
+        metric = cls(data['name'], data['documentation'], data['labelnames'],
+                     registry=None)
+        for key, value in data['values']:
+            metric.merge(tuple(key), value)
+        return metric
+
+
+class Counter(Metric):
+    """A value which only goes up, like the number of calls to something."""
+
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        if not enabled():
+            return
+        self.merge(self._key(labels), amount)
+
+
+class Gauge(Metric):
+    """A value which goes up and down, like the size of a queue.
+
+    A gauge can have a ``callback`` returning its values, as a dict mapping
+    the tuples of label values to the values, when they are collected.
+    """
+
+    type = 'gauge'
+
+    def __init__(self, name, documentation, labelnames=(), callback=None,
+                 registry=REGISTRY):
+        self.callback = callback
+        super(Gauge, self).__init__(name, documentation, labelnames,
+                                    registry=registry)
+
+    def set(self, value, **labels):
+        if not enabled():
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def get_values(self):
+        values = super(Gauge, self).get_values()
+        if self.callback is not None:
+            values.update(self.callback())
+        return values
+
+
+class Histogram(Metric):
+    """The distribution of observed values, like the duration of requests.
+
+    The values are counted in ``buckets``, each one the number of values
+    lower than or equal to an upper bound.
+    """
+
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(),
+                 buckets=DEFAULT_BUCKETS, registry=REGISTRY):
+        self.buckets = tuple(sorted(float(b) for b in buckets
+                                    if b != INF)) + (INF,)
+        super(Histogram, self).__init__(name, documentation, labelnames,
+                                        registry=registry)
+
+    def observe(self, value, **labels):
+        if not enabled():
+            return
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            current = self._get(key)
+            current[0][index] += 1
+            current[1] += value
+
+    def _get(self, key):
+        current = self._values.get(key)
+        if current is None:
+            current = self._values[key] = [[0] * len(self.buckets), 0]
+        return current
+
+    def merge(self, key, value):
+        counts, total = value
+        with self._lock:
+            current = self._get(key)
+            current[0] = [a + b for a, b in zip(current[0], counts)]
+            current[1] += total
+
+    def get_values(self):
+        with self._lock:
+            return dict((key, [list(counts), total]) for key, (counts, total)
+                        in self._values.items())
+
+    def samples(self):
+        for key, (counts, total) in sorted(self.get_values().items()):
+            labels = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield (self.name + '_bucket',
+                       labels + [('le', _format_value(bound))], cumulative)
+            yield self.name + '_sum', labels, total
+            yield self.name + '_count', labels, cumulative
+
+    def dump(self):
+        data = super(Histogram, self).dump()
+        data['buckets'] = self.buckets[:-1]
+        return data
+
+    @classmethod
+    def load(cls, data):
+        metric = cls(data['name'], data['documentation'], data['labelnames'],
+                     buckets=data['buckets'], registry=None)
+        for key, value in data['values']:
+            metric.merge(tuple(key), value)
+        return metric
+
+
+METRIC_TYPES = dict((cls.type, cls) for cls in (Counter, Gauge, Histogram))
+
+
+# Shared by the caches of the dashboard, with the name of the cache as the
+# "cache" label.
+CACHE_LOOKUPS = Counter(
+    'horizon_cache_lookups_total',
+    "Lookups in the caches of the dashboard, by whether they were hits.",
+    ['cache', 'result'])
+
+
+def _format_value(value):
+    if value == INF:
+        return '+Inf'
+    if value == -INF:
+        return '-Inf'
+    return repr(float(value))
+
+
+def _escape(value):
+    return (value.replace('\\', r'\\').replace('\n', r'\n')
+            .replace('"', r'\"'))
+
+
+def generate_text(metrics):
+    """Returns ``metrics`` in the Prometheus text exposition format."""
+    lines = []
+    for metric in metrics:
+        lines.append('# HELP %s %s' % (
+            metric.name,
+            metric.documentation.replace('\\', r'\\').replace('\n', r'\n')))
+        lines.append('# TYPE %s %s' % (metric.name, metric.type))
+        for name, labels, value in metric.samples():
+            if labels:
+                name += '{%s}' % ','.join('%s="%s"' % (label, _escape(text))
+                                          for label, text in labels)
+            lines.append('%s %s' % (name, _format_value(value)))
+    return '\n'.join(lines) + '\n'
+
+
+def _process_id():
+    """Returns the pid and the start time (in milliseconds) of this process.
+
+    The start time tells apart the processes which had the same pid.
+    """
+    global _process
+    pid = os.getpid()
+    if _process is None or _process[0] != pid:
+        _process = (pid, int(time.time() * 1000))
+    return _process
+
+
+def _dump_path(directory, pid, start):
+    return os.path.join(directory, 'metrics-%d-%d.json' % (pid, start))
+
+
+def _write(directory, path, data):
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.metrics-')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f)
+    # Renaming the file over the previous one is atomic, so it is never
+    # read half written.
+    os.rename(tmp_path, path)
+
+
+def _load(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return None
+
+
+def dump(directory, registry=REGISTRY):
+    """Writes the metrics of this process to a file in ``directory``."""
+    global _last_dump
+    pid, start = _process_id()
+    data = {'pid': pid,
+            'start': start,
+            'metrics': [metric.dump() for metric in registry.get_metrics()]}
+    _write(directory, _dump_path(directory, pid, start), data)
+    _last_dump = time.time()
+
+
+def maybe_dump():
+    """Writes the metrics of this process in multiprocess mode.
+
+    Does nothing if they were written less than :data:`DUMP_INTERVAL`
+    seconds ago.
+    """
+    directory = get_config()['multiprocess_dir']
+    if (directory and enabled() and
+            time.time() - _last_dump >= DUMP_INTERVAL):
+        dump(directory)
+
+
+def _is_running(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError as e:
+        return e.errno == errno.EPERM
+    return True
+
+
+@contextlib.contextmanager
+def _locked(directory):
+    with open(os.path.join(directory, '.metrics.lock'), 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _fold(merged, data, gauges):
+    """Adds the metrics of a file to ``merged``, a dict of the metrics by
+    name. Gauges get a ``pid`` label, or are left out unless ``gauges``.
+    """
+    for metric_data in data['metrics']:
+        cls = METRIC_TYPES[metric_data['type']]
+        if cls is Gauge:
+            if not gauges:
+                continue
+            metric_data['labelnames'] = (list(metric_data['labelnames'])
+                                         + ['pid'])
+            metric_data['values'] = [[key + [str(data['pid'])], value]
+                                     for key, value in metric_data['values']]
+        metric = cls.load(metric_data)
+        if metric.name not in merged:
+            merged[metric.name] = metric
+        else:
+            for key, value in metric.get_values().items():
+                merged[metric.name].merge(key, value)
+
+
+def _archive(directory, exited):
+    """Folds the counters and histograms of the processes which have exited
+    into :data:`ARCHIVE_FILE`, and removes their files.
+
+    Returns the data of the archive file.
+    """
+    path = os.path.join(directory, ARCHIVE_FILE)
+    archived = _load(path)
+    if exited:
+        merged = {}
+        if archived is not None:
+            _fold(merged, archived, gauges=False)
+        for _path, data in exited:
+            _fold(merged, data, gauges=False)
+        archived = {'metrics': [metric.dump()
+                                for metric in merged.values()]}
+        _write(directory, path, archived)
+        for exited_path, _data in exited:
+            os.remove(exited_path)
+    return archived
+
+
+def collect(directory, registry=REGISTRY):
+    """Returns the metrics of all the processes which wrote to ``directory``.
+
+    Counters and histograms are added up, including those of the processes
+    which have exited: their files are folded into a single archive file.
+    Gauges get a ``pid`` label, and those of the processes which have
+    exited are left out.
+    """
+    dump(directory, registry=registry)
+    with _locked(directory):
+        processes = []
+        for path in sorted(glob.glob(os.path.join(directory,
+                                                  'metrics-*.json'))):
+            if os.path.basename(path) == ARCHIVE_FILE:
+                continue
+            data = _load(path)
+            if data is not None:
+                processes.append((path, data))
+        # The pid of an exited process may have been reused, by this
+        # process or another one; only the last one started can be running.
+        latest = {}
+        for _path, data in processes:
+            latest[data['pid']] = max(latest.get(data['pid'], 0),
+                                      data.get('start', 0))
+        running = []
+        exited = []
+        for path, data in processes:
+            if (data.get('start', 0) == latest[data['pid']] and
+                    _is_running(data['pid'])):
+                running.append(data)
+            else:
+                exited.append((path, data))
+        archived = _archive(directory, exited)
+    merged = {}
+    for data in running:
+        _fold(merged, data, gauges=True)
+    if archived is not None:
+        _fold(merged, archived, gauges=False)
+    # Keep the order of the metrics of this process.
+    return [merged.pop(metric.name) for metric in registry.get_metrics()
+            if metric.name in merged] + list(merged.values())
+
+
+def get_metrics():
+    """Returns the metrics exposed by the ``/metrics`` view."""
+    directory = get_config()['multiprocess_dir']
+    if directory:
+        return collect(directory)
+    return REGISTRY.get_metrics()
+
+
+@atexit.register
+def _dump_at_exit():
+    try:
+        if enabled() and get_config()['multiprocess_dir']:
+            dump(get_config()['multiprocess_dir'])
+    except Exception:
+        pass
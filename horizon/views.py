@@ -12,6 +12,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+
+from django import http
 from django import shortcuts
 from django import template
 from django.utils import encoding
@@ -19,6 +22,8 @@ from django.views import generic
 
 import horizon
 from horizon import exceptions
+from horizon.utils import batch
+from horizon.utils import metrics as horizon_metrics
 
 
 class PageTitleMixin(object):
@@ -78,6 +83,33 @@ def user_home(request):
     return shortcuts.redirect(horizon.get_user_home(request.user))
 
 
+def batch_action_status(request, job_id):
+    """Returns the progress of a background batch action as JSON."""
+    status = batch.get_status(job_id)
+    if status is None or status.get('user_id') != request.user.id:
+        raise http.Http404()
+    return http.HttpResponse(json.dumps(status),
+                             content_type='application/json')
+
+
+def metrics(request):
+    """Returns the metrics of the dashboard in the Prometheus text format.
+
+    Only answers when enabled by the ``METRICS`` setting, and to the clients
+    in its ``allowed_ips``.
+    """
+    config = horizon_metrics.get_config()
+    if not config['enabled']:
+        raise http.Http404()
+    allowed_ips = config['allowed_ips']
+    if (allowed_ips is not None and
+            request.META.get('REMOTE_ADDR') not in allowed_ips):
+        return http.HttpResponseForbidden()
+    text = horizon_metrics.generate_text(horizon_metrics.get_metrics())
+    return http.HttpResponse(text,
+                             content_type=horizon_metrics.CONTENT_TYPE)
+
+
 class APIView(HorizonTemplateView):
     """A quick class-based view for putting API data into a template.
 
@@ -31,6 +31,7 @@ import six
 from horizon import base
 from horizon import exceptions
 from horizon.templatetags.horizon import has_permissions  # noqa
+from horizon.utils import concurrency
 from horizon.utils import html
 
 
@@ -124,9 +125,22 @@ class Action(forms.Form):
         displayed alongside the Action's fields. In conjunction with
         :meth:`~horizon.workflows.Action.get_help_text` method you can
         customize your help text template to display practically anything.
+
+    The data an action needs to build its fields can be declared by
+    overriding :meth:`~horizon.workflows.Action.get_prefetch_calls`. The
+    declared calls are issued concurrently before the action's
+    ``populate_<field>_choices`` methods run, and their results are read back
+    with :meth:`~horizon.workflows.Action.get_prefetched`.
+
+    The ``populate_<field>_choices`` methods are called the first time the
+    action's fields are used, e.g. when the action is rendered or validated,
+    rather than when the action is instantiated.
     """
+    # Fields are only populated once the action has been fully initialized.
+    _choices_populated = True
 
     def __init__(self, request, context, *args, **kwargs):
+        self._prefetched = kwargs.pop("prefetched", None)
         if request.method == "POST":
             super(Action, self).__init__(request.POST, initial=context)
         else:
@@ -136,7 +150,8 @@ class Action(forms.Form):
             raise AttributeError("The action %s must define a handle method."
                                  % self.__class__.__name__)
         self.request = request
-        self._populate_choices(request, context)
+        self._choices_context = context
+        self._choices_populated = False
         self.required_css_class = 'required'
 
     def __str__(self):
@@ -145,12 +160,64 @@ class Action(forms.Form):
     def __repr__(self):
         return "<%s: %s>" % (self.__class__.__name__, self.slug)
 
+    @property
+    def fields(self):
+        if not self._choices_populated:
+            self._choices_populated = True
+            self._populate_choices(self.request, self._choices_context)
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields):
+        self._fields = fields
+
+    @property
+    def prefetched(self):
+        """The results of the calls declared by ``get_prefetch_calls``.
+
+        Unless they were handed over by the workflow, the calls are issued
+        the first time this is accessed.
+        """
+        if self._prefetched is None:
+            self._prefetched = run_prefetch_calls(
+                self.get_prefetch_calls(self.request, self._choices_context))
+        return self._prefetched
+
     def _populate_choices(self, request, context):
         for field_name, bound_field in self.fields.items():
             meth = getattr(self, "populate_%s_choices" % field_name, None)
             if meth is not None and callable(meth):
                 bound_field.choices = meth(request, context)
 
+    @classmethod
+    def get_prefetch_calls(cls, request, context):
+        """Declares the API calls this action needs to build its fields.
+
+        Should return a dict (or a sequence of ``(name, callable)`` pairs)
+        mapping a name to a callable taking no arguments. When the action
+        is part of a workflow the calls of all the workflow's steps are
+        issued concurrently before any action is instantiated.
+
+        Returns an empty dict by default.
+        """
+        return {}
+
+    def get_prefetched(self, name, fetch=None):
+        """Returns the result of the prefetched call ``name``.
+
+        If the call raised an exception it is re-raised here, so that it
+        can be handled where the data is used. If ``name`` was not
+        prefetched ``fetch`` is called instead.
+        """
+        if name not in self.prefetched:
+            if fetch is None:
+                raise KeyError("No data was prefetched for %s." % name)
+            return fetch()
+        result = self.prefetched[name]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
     def get_help_text(self, extra_context=None):
         """Returns the help text for this step."""
         text = ""
@@ -177,6 +244,17 @@ class Action(forms.Form):
         return None
 
 
+def run_prefetch_calls(calls):
+    """Runs a set of prefetch calls concurrently.
+
+    Returns a dict mapping each call's name to its result, or to the
+    exception it raised.
+    """
+    if not calls:
+        return {}
+    return dict(concurrency.run_concurrently(calls, return_exceptions=True))
+
+
 class MembershipAction(Action):
     """An action that allows a user to add/remove members from a group.
 
@@ -255,6 +333,14 @@ class Step(object):
         general the default common template should be used. Default:
         ``"horizon/common/_workflow_step.html"``.
 
+    .. attribute:: preload
+
+        Determines whether the contents of the step should be rendered into
+        the workflow's HTML when the workflow is rendered, or whether they
+        should be loaded dynamically once the workflow is displayed. The first
+        step and the workflow's entry point are always rendered. Default:
+        ``True``.
+
     .. attribute:: has_errors
 
         A boolean value which indicates whether or not this step has any
@@ -282,6 +368,7 @@ class Step(object):
     after = None
     help_text = ""
     template_name = "horizon/common/_workflow_step.html"
+    preload = True
 
     def __repr__(self):
         return "<%s: %s>" % (self.__class__.__name__, self.slug)
@@ -301,6 +388,7 @@ class Step(object):
         self.name = self.action_class.name
         self.permissions = self.action_class.permissions
         self.has_errors = False
+        self.prefetched = None
         self._handlers = {}
 
         if self.connections is None:
@@ -362,12 +450,18 @@ class Step(object):
     def action(self):
         if not getattr(self, "_action", None):
             try:
-                # Hook in the action context customization.
-                workflow_context = dict(self.workflow.context)
+                self.workflow._prefetch_if_pending()
+                # Hook in the action context customization. Only the data
+                # of the preceding steps is needed to build this step.
+                workflow_context = dict(
+                    self.workflow._contribute_steps(until=self))
                 context = self.prepare_action_context(self.workflow.request,
                                                       workflow_context)
+                kwargs = {}
+                if self.prefetched:
+                    kwargs['prefetched'] = self.prefetched
                 self._action = self.action_class(self.workflow.request,
-                                                 context)
+                                                 context, **kwargs)
             except Exception:
                 LOG.exception("Problem instantiating action class.")
                 raise
@@ -383,6 +477,44 @@ class Step(object):
         """
         return context
 
+    def get_prefetch_calls(self, request, context):
+        """Returns the API calls whose results this step's action needs.
+
+        The ``context`` is the action context as returned by
+        :meth:`~horizon.workflows.Step.prepare_action_context`. Defaults to
+        the calls declared by the action class.
+        """
+        return self.action_class.get_prefetch_calls(request, context)
+
+    def allowed(self, request):
+        """Determines whether or not the step is part of the workflow.
+
+        Step instances can override this method to specify conditions under
+        which this step should be skipped entirely by returning ``False``.
+
+        The default behavior is to return ``True`` for all cases.
+        """
+        return True
+
+    @property
+    def load(self):
+        """Whether the contents of this step are rendered with the workflow.
+        """
+        workflow = self.workflow
+        return (self.preload or
+                workflow.request.method == "POST" or
+                self.slug == workflow.entry_point or
+                self is workflow.steps[0] or
+                getattr(self, "_action", None) is not None)
+
+    def get_fragment_url(self):
+        """Returns the URL from which the contents of this step are loaded
+        when it is not rendered with the workflow.
+        """
+        params = self.workflow.request.GET.copy()
+        params[self.workflow.fragment_param_name] = self.slug
+        return "%s?%s" % (self.workflow.get_absolute_url(), params.urlencode())
+
     def get_id(self):
         """Returns the ID for this step. Suitable for use in HTML markup."""
         return "%s__%s" % (self.workflow.slug, self.slug)
@@ -438,7 +570,12 @@ class Step(object):
 
     def has_required_fields(self):
         """Returns True if action contains any required fields."""
-        return any(field.required for field in self.action.fields.values())
+        if self.load:
+            fields = self.action.fields
+        else:
+            # Don't build the action of a step which isn't rendered yet.
+            fields = self.action_class.base_fields
+        return any(field.required for field in fields.values())
 
 
 class WorkflowMetaclass(type):
@@ -471,6 +608,14 @@ class UpdateMembersStep(Step):
 
         The placeholder text used when the members list is empty.
 
+    .. attribute:: search_url
+
+        If set, the text typed in the filter of the available list is also
+        searched for at this URL, so that the step doesn't have to embed
+        every available item in the page. The URL must return a JSON object
+        whose ``items`` are objects with an ``id`` and a ``name``.
+        Defaults to ``None``.
+
     """
     template_name = "horizon/common/_workflow_step_update_members.html"
     show_roles = True
@@ -478,6 +623,7 @@ class UpdateMembersStep(Step):
     members_list_title = _("Members")
     no_available_text = _("None available.")
     no_members_text = _("No members.")
+    search_url = None
 
     def get_member_field_name(self, role_id):
         if issubclass(self.action_class, MembershipAction):
@@ -570,6 +716,12 @@ class Workflow(html.HTMLElement):
         The name of a parameter used for tracking the URL to redirect to upon
         completion of the workflow. Defaults to ``"next"``.
 
+    .. attribute:: fragment_param_name
+
+        The name of the query parameter used to request the contents of a
+        single step, for steps which are not preloaded. Defaults to
+        ``"step_fragment"``.
+
     .. attribute:: object
 
         The object (if any) which this workflow relates to. In the case of
@@ -598,6 +750,7 @@ class Workflow(html.HTMLElement):
     success_message = _("%s completed successfully.")
     failure_message = _("%s did not complete.")
     redirect_param_name = "next"
+    fragment_param_name = "step_fragment"
     multipart = False
     wizard = False
     fullscreen = False
@@ -638,6 +791,8 @@ class Workflow(html.HTMLElement):
         # Initialize our context. For ease we can preseed it with a
         # regular dictionary. This should happen after steps have been
         # registered and ordered.
+        self._contributed = len(self.steps)
+        self._contributing = False
         self.context = WorkflowContext(self)
         context_seed = context_seed or {}
         clean_seed = dict([(key, val)
@@ -646,15 +801,45 @@ class Workflow(html.HTMLElement):
         self.context_seed = clean_seed
         self.context.update(clean_seed)
 
+        # The data for each step is fetched when the first action is built.
+        self._prefetch_pending = request is not None
+
+        # The POSTed data of each step is contributed to the context the
+        # first time the context, or a later step, is needed.
         if request and request.method == "POST":
-            for step in self.steps:
+            self._contributed = 0
+
+    @property
+    def context(self):
+        return self._contribute_steps()
+
+    @context.setter
+    def context(self, context):
+        self._context = context
+
+    def _contribute_steps(self, until=None):
+        """Contributes the POSTed data of the steps preceding ``until``, or
+        of every step, to the context. Returns the context.
+        """
+        steps = self.steps
+        stop = steps.index(until) if until in steps else len(steps)
+        if self._contributing:
+            return self._context
+        self._contributing = True
+        try:
+            while self._contributed < stop:
+                step = steps[self._contributed]
+                self._contributed += 1
                 valid = step.action.is_valid()
                 # Be sure to use the CLEANED data if the workflow is valid.
                 if valid:
                     data = step.action.cleaned_data
                 else:
-                    data = request.POST
-                self.context = step.contribute(data, self.context)
+                    data = self.request.POST
+                self._context = step.contribute(data, self._context)
+        finally:
+            self._contributing = False
+        return self._context
 
     @property
     def steps(self):
@@ -662,6 +847,40 @@ class Workflow(html.HTMLElement):
             self._gather_steps()
         return self._ordered_steps
 
+    def prefetch(self, steps=None):
+        """Issues the prefetch calls of the given steps concurrently.
+
+        By default the calls of every step which is rendered with the
+        workflow are issued. Steps whose data was already fetched are
+        skipped. Each step's results are stored on the step and
+        handed to its action when the action is instantiated, so that the
+        ``populate_<field>_choices`` methods of the actions do not have to
+        wait on the APIs one after another.
+
+        This is called automatically when the first action of the workflow
+        is built.
+        """
+        self._prefetch_pending = False
+        if steps is None:
+            steps = [step for step in self.steps if step.load]
+        steps = [step for step in steps if step.prefetched is None]
+        calls = []
+        for step in steps:
+            context = step.prepare_action_context(self.request,
+                                                  dict(self._context))
+            step_calls = step.get_prefetch_calls(self.request, context)
+            for name, call in concurrency.ordered_calls(step_calls or {}):
+                calls.append(((step.slug, name), call))
+        results = run_prefetch_calls(calls)
+        for step in steps:
+            step.prefetched = dict((name, result)
+                                   for (slug, name), result in results.items()
+                                   if slug == step.slug)
+
+    def _prefetch_if_pending(self):
+        if self._prefetch_pending:
+            self.prefetch()
+
     def get_step(self, slug):
         """Returns the instantiated step matching the given slug."""
         for step in self.steps:
@@ -676,7 +895,9 @@ class Workflow(html.HTMLElement):
         self._ordered_steps = [self._registry[step_class]
                                for step_class in ordered_step_classes
                                if has_permissions(self.request.user,
-                                                  self._registry[step_class])]
+                                                  self._registry[step_class])
+                               and self._registry[step_class].allowed(
+                                   self.request)]
 
     def _order_steps(self):
         steps = list(copy.copy(self.default_steps))
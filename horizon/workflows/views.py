@@ -139,8 +139,22 @@ class WorkflowView(hz_views.ModalBackdropMixin, generic.TemplateView):
             error_msg = self.step_errors[step]
             workflow.add_error_to_step(error_msg, step)
 
+    def get_step_fragment(self, slug):
+        """Returns a response containing only the contents of the step
+        matching the given slug.
+        """
+        workflow = self.get_workflow()
+        step = workflow.get_step(slug)
+        if step is None:
+            raise http.Http404()
+        workflow.prefetch(steps=[step])
+        return http.HttpResponse(step.render())
+
     def get(self, request, *args, **kwargs):
         """Handler for HTTP GET requests."""
+        fragment = request.GET.get(self.workflow_class.fragment_param_name)
+        if fragment and request.is_ajax():
+            return self.get_step_fragment(fragment)
         context = self.get_context_data(**kwargs)
         self.set_workflow_step_errors(context)
         return self.render_to_response(context)
@@ -151,6 +165,8 @@ class WorkflowView(hz_views.ModalBackdropMixin, generic.TemplateView):
         Returns a dict describing the validation state of the workflow.
         """
         errors = {}
+        # The steps after the last one being validated aren't needed.
+        workflow.prefetch(steps=workflow.steps[:end + 1])
         for step in workflow.steps[start:end + 1]:
             if not step.action.is_valid():
                 errors[step.slug] = dict(
@@ -302,42 +302,94 @@ def get_url_for_service(service, region, endpoint_type):
     return None
 
 
+class EndpointIndex(object):
+    """An index of a service catalog for fast endpoint lookups.
+
+    The catalog is scanned once to map each service type to its service and
+    to the regions it has endpoints in. URLs are then resolved once per
+    (service type, region, endpoint type) and remembered, including the
+    fallback to the secondary endpoint type.
+    """
+
+    def __init__(self, catalog, token_id=None):
+        self.catalog = catalog
+        self.token_id = token_id
+        self._services = {}
+        self._regions = {}
+        self._urls = {}
+        for service in catalog or []:
+            if 'type' not in service:
+                continue
+            service_type = service['type']
+            # Like get_service_from_catalog, the first match wins.
+            if service_type in self._services:
+                continue
+            self._services[service_type] = service
+            self._regions[service_type] = set(
+                _get_endpoint_region(endpoint)
+                for endpoint in service.get('endpoints', []))
+
+    def get_service(self, service_type):
+        return self._services.get(service_type)
+
+    def is_enabled(self, service_type, region):
+        regions = self._regions.get(service_type)
+        if not regions:
+            return False
+        # ignore region for identity
+        return service_type == 'identity' or region in regions
+
+    def url_for(self, service_type, region, endpoint_type,
+                fallback_endpoint_type=None):
+        key = (service_type, region, endpoint_type, fallback_endpoint_type)
+        if key not in self._urls:
+            url = None
+            service = self._services.get(service_type)
+            if service:
+                url = get_url_for_service(service, region, endpoint_type)
+                if not url and fallback_endpoint_type:
+                    url = get_url_for_service(service, region,
+                                              fallback_endpoint_type)
+            self._urls[key] = url
+        return self._urls[key]
+
+
+def get_endpoint_index(request):
+    """Returns the :class:`EndpointIndex` for the user's service catalog.
+
+    The index is kept on the user object and rebuilt whenever the token or
+    the catalog changes.
+    """
+    user = request.user
+    catalog = user.service_catalog
+    token_id = getattr(getattr(user, 'token', None), 'id', None)
+    index = getattr(user, '_endpoint_index', None)
+    if (index is None or index.catalog is not catalog or
+            index.token_id != token_id):
+        index = EndpointIndex(catalog, token_id)
+        user._endpoint_index = index
+    return index
+
+
 def url_for(request, service_type, endpoint_type=None, region=None):
     endpoint_type = endpoint_type or getattr(settings,
                                              'OPENSTACK_ENDPOINT_TYPE',
                                              'publicURL')
     fallback_endpoint_type = getattr(settings, 'SECONDARY_ENDPOINT_TYPE', None)
 
-    catalog = request.user.service_catalog
-    service = get_service_from_catalog(catalog, service_type)
-    if service:
-        if not region:
-            region = request.user.services_region
-        url = get_url_for_service(service,
-                                  region,
-                                  endpoint_type)
-        if not url and fallback_endpoint_type:
-            url = get_url_for_service(service,
-                                      region,
-                                      fallback_endpoint_type)
-        if url:
-            return url
+    region = region or request.user.services_region
+    url = get_endpoint_index(request).url_for(service_type,
+                                              region,
+                                              endpoint_type,
+                                              fallback_endpoint_type)
+    if url:
+        return url
     raise exceptions.ServiceCatalogException(service_type)
 
 
 def is_service_enabled(request, service_type):
-    service = get_service_from_catalog(request.user.service_catalog,
-                                       service_type)
-    if service:
-        region = request.user.services_region
-        for endpoint in service.get('endpoints', []):
-            if 'type' not in service:
-                continue
-            # ignore region for identity
-            if service['type'] == 'identity' or \
-               _get_endpoint_region(endpoint) == region:
-                return True
-    return False
+    return get_endpoint_index(request).is_enabled(
+        service_type, request.user.services_region)
 
 
 def _get_endpoint_region(endpoint):
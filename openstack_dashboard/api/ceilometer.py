@@ -22,6 +22,7 @@ from horizon import exceptions
 from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
+from openstack_dashboard.api import connection_pool
 from openstack_dashboard.api import keystone
 from openstack_dashboard.api import nova
 
@@ -280,7 +281,10 @@ def ceilometerclient(request):
     return ceilometer_client.Client('2', endpoint,
                                     token=(lambda: request.user.token.id),
                                     insecure=insecure,
-                                    cacert=cacert)
+                                    cacert=cacert,
+                                    http=connection_pool.get_session(
+                                        endpoint, cacert=cacert,
+                                        insecure=insecure))
 
 
 def resource_list(request, query=None, ceilometer_usage_object=None):
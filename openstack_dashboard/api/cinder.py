@@ -20,6 +20,7 @@
 
 from __future__ import absolute_import
 
+import functools
 import logging
 
 from django.conf import settings
@@ -30,9 +31,11 @@ from cinderclient.exceptions import ClientException  # noqa
 from cinderclient.v2.contrib import list_extensions as cinder_list_extensions
 
 from horizon import exceptions
+from horizon.utils import concurrency
 from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
+from openstack_dashboard.api import connection_pool
 from openstack_dashboard.api import nova
 
 LOG = logging.getLogger(__name__)
@@ -162,16 +165,13 @@ def cinderclient(request):
     except exceptions.ServiceCatalogException:
         LOG.debug('no volume service configured.')
         raise
-    c = api_version['client'].Client(request.user.username,
-                                     request.user.token.id,
-                                     project_id=request.user.tenant_id,
-                                     auth_url=cinder_url,
-                                     insecure=insecure,
-                                     cacert=cacert,
-                                     http_log_debug=settings.DEBUG)
-    c.client.auth_token = request.user.token.id
-    c.client.management_url = cinder_url
-    return c
+    return api_version['client'].Client(
+        project_id=request.user.tenant_id,
+        http_log_debug=settings.DEBUG,
+        **connection_pool.get_client_session(cinder_url,
+                                             request.user.token.id,
+                                             cacert=cacert,
+                                             insecure=insecure))
 
 
 def _replace_v2_parameters(data):
@@ -188,21 +188,31 @@ def version_get():
     return api_version['version']
 
 
-def volume_list(request, search_opts=None):
+def volume_list(request, search_opts=None, with_transfers=True):
     """To see all volumes in the cloud as an admin you can pass in a special
     search option: {'all_tenants': 1}
+
+    The pending transfers are retrieved at the same time as the volumes and
+    set as their ``transfer``. Callers which do not need them should pass
+    ``with_transfers=False``.
     """
 
     c_client = cinderclient(request)
     if c_client is None:
         return []
 
+    calls = [('volumes', functools.partial(c_client.volumes.list,
+                                           search_opts=search_opts))]
+    if with_transfers:
+        calls.append(('transfers', functools.partial(
+            transfer_list, request, search_opts=search_opts)))
+    results = concurrency.run_concurrently(calls)
+
     # build a dictionary of volume_id -> transfer
-    transfers = {t.volume_id: t
-                 for t in transfer_list(request, search_opts=search_opts)}
+    transfers = {t.volume_id: t for t in results.get('transfers', [])}
 
     volumes = []
-    for v in c_client.volumes.list(search_opts=search_opts):
+    for v in results['volumes']:
         v.transfer = transfers.get(v.id)
         volumes.append(Volume(v))
 
@@ -212,9 +222,33 @@ def volume_list(request, search_opts=None):
 def volume_get(request, volume_id):
     volume_data = cinderclient(request).volumes.get(volume_id)
 
+    # Each attached instance is retrieved once, at the same time as the
+    # transfer of the volume if there is one.
+    server_ids = sorted(set(attachment['server_id']
+                            for attachment in volume_data.attachments
+                            if "server_id" in attachment))
+
+    def get_servers():
+        servers = concurrency.concurrent_map(
+            functools.partial(nova.server_get, request), server_ids)
+        return dict(zip(server_ids, servers))
+
+    def get_transfer():
+        for transfer in transfer_list(request):
+            if transfer.volume_id == volume_id:
+                return transfer
+
+    calls = []
+    if server_ids:
+        calls.append(('servers', get_servers))
+    if volume_data.status == 'awaiting-transfer':
+        calls.append(('transfer', get_transfer))
+    results = concurrency.run_concurrently(calls) if calls else {}
+
+    servers = results.get('servers', {})
     for attachment in volume_data.attachments:
         if "server_id" in attachment:
-            instance = nova.server_get(request, attachment['server_id'])
+            instance = servers[attachment['server_id']]
             attachment['instance_name'] = instance.name
         else:
             # Nova volume can occasionally send back error'd attachments
@@ -222,12 +256,7 @@ def volume_get(request, volume_id):
             # give the attached instance a generic name.
             attachment['instance_name'] = _("Unknown instance")
 
-    volume_data.transfer = None
-    if volume_data.status == 'awaiting-transfer':
-        for transfer in transfer_list(request):
-            if transfer.volume_id == volume_id:
-                volume_data.transfer = transfer
-                break
+    volume_data.transfer = results.get('transfer')
 
     return Volume(volume_data)
 
@@ -0,0 +1,230 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Process-wide pools of HTTP connections to the OpenStack services.
+
+The service clients are created for every request, and each of them would
+otherwise open its own connections. The pools kept here are shared by all
+the clients (and so all the requests) talking to the same service endpoint,
+which allows connections to be kept alive and reused between requests.
+
+Only connections are shared: every client still sends the token of the
+request it was created for. The adapters also profile the calls made through
+them (see :class:`ProfiledHTTPAdapter`).
+"""
+
+import socket
+import threading
+import time
+
+from django.conf import settings
+from keystoneclient.auth import token_endpoint
+from keystoneclient import session as keystone_session
+import requests
+from requests import adapters
+from six.moves.urllib import parse
+
+from horizon.utils import call_profiler
+from horizon.utils import metrics
+
+
+DEFAULT_MAXSIZE = 10
+
+_lock = threading.Lock()
+_adapters = {}
+
+API_CALL_DURATION = metrics.Histogram(
+    'horizon_api_call_duration_seconds',
+    "Duration of the calls to the OpenStack services.", ['service'])
+
+
+def get_config():
+    config = {'enabled': True,
+              'maxsize': DEFAULT_MAXSIZE,
+              'block': False,
+              'keepalive': True}
+    config.update(getattr(settings, 'OPENSTACK_CONNECTION_POOL', {}))
+    return config
+
+
+def _keepalive_options():
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # These aren't available on every platform.
+    for name, value in (('TCP_KEEPIDLE', 60),
+                        ('TCP_KEEPINTVL', 15),
+                        ('TCP_KEEPCNT', 4)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class ProfiledHTTPAdapter(adapters.HTTPAdapter):
+    """An HTTP adapter recording its calls in the current call profile and in
+    the metrics, if either is enabled (see the ``API_CALL_PROFILER`` and
+    ``METRICS`` settings).
+
+    The duration and size of a call include reading the response body,
+    which ``requests`` does as soon as the response is received anyway.
+    For streamed responses they don't: the duration stops at the headers
+    and the size is the Content-Length header, unknown for chunked bodies.
+    """
+
+    def send(self, request, stream=False, **kwargs):
+        send = super(ProfiledHTTPAdapter, self).send
+        if call_profiler.get_profile() is None and not metrics.enabled():
+            return send(request, stream=stream, **kwargs)
+        status = size = None
+        start = time.time()
+        try:
+            response = send(request, stream=stream, **kwargs)
+            status = response.status_code
+            if stream:
+                length = response.headers.get('Content-Length')
+                if length and length.isdigit():
+                    size = int(length)
+            else:
+                size = len(response.content)
+            return response
+        finally:
+            duration = time.time() - start
+            service = get_service_type(request.url)
+            call_profiler.record(service, request.method, request.url,
+                                 status, size, duration)
+            API_CALL_DURATION.observe(duration, service=service)
+
+
+class PooledHTTPAdapter(ProfiledHTTPAdapter):
+    """An HTTP adapter shared by the sessions of many clients.
+
+    Closing one of those sessions must not tear down the connections the
+    other ones are using, so :meth:`close` does nothing.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, block=False, keepalive=True):
+        self.keepalive = keepalive
+        super(PooledHTTPAdapter, self).__init__(pool_maxsize=maxsize,
+                                                pool_block=block)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.keepalive:
+            kwargs['socket_options'] = (
+                [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)] +
+                _keepalive_options())
+        super(PooledHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+
+    def close(self):
+        pass
+
+
+def get_service_url(url):
+    """Returns the ``scheme://host:port`` part of ``url``."""
+    parts = parse.urlsplit(url)
+    return '%s://%s' % (parts.scheme, parts.netloc)
+
+
+def get_adapter(url, cacert=None, insecure=False):
+    """Returns the shared adapter for the service at ``url``.
+
+    Adapters are keyed by endpoint host, CA bundle and ``insecure`` flag so
+    that connections verified one way are never handed to a client
+    expecting another. Returns ``None`` if pooling is disabled.
+    """
+    config = get_config()
+    if not config['enabled']:
+        return None
+    key = (get_service_url(url), cacert, bool(insecure))
+    with _lock:
+        adapter = _adapters.get(key)
+        if adapter is None:
+            adapter = PooledHTTPAdapter(maxsize=config['maxsize'],
+                                        block=config['block'],
+                                        keepalive=config['keepalive'])
+            _adapters[key] = adapter
+    return adapter
+
+
+def mount(session, url, cacert=None, insecure=False):
+    """Mounts the shared adapter for ``url`` on a ``requests`` session.
+
+    If pooling is disabled, an adapter of the session's own is mounted so
+    that its calls are still profiled.
+    """
+    adapter = (get_adapter(url, cacert=cacert, insecure=insecure) or
+               ProfiledHTTPAdapter())
+    session.mount(get_service_url(url), adapter)
+    return session
+
+
+def get_session(url, cacert=None, insecure=False):
+    """Returns a new ``requests`` session using the shared adapter for ``url``.
+
+    Sessions are cheap and are not shared between threads; the adapter
+    mounted on them is what holds on to the connections.
+    """
+    session = requests.Session()
+    session.verify = False if insecure else (cacert or True)
+    return mount(session, url, cacert=cacert, insecure=insecure)
+
+
+def get_client_session(url, token, cacert=None, insecure=False):
+    """Returns the ``session`` and ``auth`` arguments of a service client.
+
+    The client then uses a keystoneclient session sending ``token`` to the
+    service at ``url`` over the shared connections, through the public
+    session support of the client libraries.
+    """
+    pooled = get_session(url, cacert=cacert, insecure=insecure)
+    return {'session': keystone_session.Session(session=pooled,
+                                                verify=pooled.verify),
+            'auth': token_endpoint.Token(url, token)}
+
+
+def clear():
+    """Drops all the pooled connections."""
+    with _lock:
+        pooled = list(_adapters.values())
+        _adapters.clear()
+    for adapter in pooled:
+        adapters.HTTPAdapter.close(adapter)
+
+
+def _service_types(request):
+    """Maps the ``scheme://host:port`` of each endpoint in the catalog of
+    the user of ``request`` to the type of its service.
+    """
+    types = getattr(request, '_service_types', None)
+    if types is None:
+        types = {}
+        user = getattr(request, 'user', None)
+        for service in getattr(user, 'service_catalog', None) or []:
+            for endpoint in service.get('endpoints', []):
+                # Keystone v2 endpoints have a URL per interface, v3 ones
+                # are an endpoint per interface.
+                for key in ('url', 'publicURL', 'internalURL', 'adminURL'):
+                    if endpoint.get(key):
+                        types.setdefault(get_service_url(endpoint[key]),
+                                         service.get('type'))
+        if request is not None:
+            request._service_types = types
+    return types
+
+
+def get_service_type(url):
+    """Returns the type of the service at ``url`` for the current request.
+
+    Falls back to the host and port of ``url`` for the services which are
+    not in the catalog (e.g. Keystone when the user logs in).
+    """
+    request = call_profiler.get_request()
+    service_url = get_service_url(url)
+    return (_service_types(request).get(service_url) or
+            parse.urlsplit(url).netloc)
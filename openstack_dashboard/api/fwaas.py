@@ -15,6 +15,7 @@
 from __future__ import absolute_import
 
 from collections import OrderedDict
+import functools
 
 from horizon.utils import memoized
 
@@ -97,10 +98,9 @@ def _rule_list(request, expand_policy, **kwargs):
     rules = neutronclient(request).list_firewall_rules(
         **kwargs).get('firewall_rules')
     if expand_policy and rules:
-        policies = _policy_list(request, expand_rule=False)
-        policy_dict = OrderedDict((p.id, p) for p in policies)
-        for rule in rules:
-            rule['policy'] = policy_dict.get(rule['firewall_policy_id'])
+        neutron.expand_resources(
+            rules, 'firewall_policy_id', 'policy',
+            functools.partial(_policy_list, request, expand_rule=False))
     return [Rule(r) for r in rules]
 
 
@@ -169,10 +169,9 @@ def _policy_list(request, expand_rule, **kwargs):
     policies = neutronclient(request).list_firewall_policies(
         **kwargs).get('firewall_policies')
     if expand_rule and policies:
-        rules = _rule_list(request, expand_policy=False)
-        rule_dict = OrderedDict((rule.id, rule) for rule in rules)
-        for p in policies:
-            p['rules'] = [rule_dict.get(rule) for rule in p['firewall_rules']]
+        neutron.expand_resources(
+            policies, 'firewall_rules', 'rules',
+            functools.partial(_rule_list, request, expand_policy=False))
     return [Policy(p) for p in policies]
 
 
@@ -257,10 +256,9 @@ def _firewall_list(request, expand_policy, **kwargs):
     firewalls = neutronclient(request).list_firewalls(
         **kwargs).get('firewalls')
     if expand_policy and firewalls:
-        policies = _policy_list(request, expand_rule=False)
-        policy_dict = OrderedDict((p.id, p) for p in policies)
-        for fw in firewalls:
-            fw['policy'] = policy_dict.get(fw['firewall_policy_id'])
+        neutron.expand_resources(
+            firewalls, 'firewall_policy_id', 'policy',
+            functools.partial(_policy_list, request, expand_rule=False))
     return [Firewall(f) for f in firewalls]
 
 
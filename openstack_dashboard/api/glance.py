@@ -18,25 +18,33 @@
 
 from __future__ import absolute_import
 
+import atexit
 import collections
+import hashlib
 import itertools
 import json
 import logging
 import os
+import threading
+import time
 
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import InMemoryUploadedFile
-from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.files.uploadedfile import TemporaryUploadedFile
+import six
 
 
 import glanceclient as glance_client
-from six.moves import _thread as thread
+from glanceclient.common import exceptions as glance_exceptions
 
+from horizon.utils import concurrency
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
+from horizon.utils import metrics
 from openstack_dashboard.api import base
+from openstack_dashboard.api import connection_pool
 
 
 LOG = logging.getLogger(__name__)
@@ -48,8 +56,11 @@ def glanceclient(request, version='1'):
     url = base.url_for(request, 'image')
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
-    return glance_client.Client(version, url, token=request.user.token.id,
-                                insecure=insecure, cacert=cacert)
+    c = glance_client.Client(version, url, token=request.user.token.id,
+                             insecure=insecure, cacert=cacert)
+    connection_pool.mount(c.http_client.session, url,
+                          cacert=cacert, insecure=insecure)
+    return c
 
 
 def image_delete(request, image_id):
@@ -66,6 +77,30 @@ def image_get(request, image_id):
     return image
 
 
+@memoized
+def image_list_by_ids(request, image_ids):
+    """Returns the images with the given IDs.
+
+    The images are retrieved concurrently. Images which don't exist anymore,
+    aren't visible to the user or couldn't be retrieved for another reason
+    are left out of the result; the errors other than "not found" are
+    logged.
+
+    :param image_ids: a tuple of image IDs.
+    """
+    def get_image(image_id):
+        try:
+            return image_get(request, image_id)
+        except glance_exceptions.NotFound:
+            return None
+        except Exception as e:
+            LOG.warn('Unable to retrieve image %s: %s', image_id, e)
+            return None
+
+    images = concurrency.concurrent_map(get_image, image_ids)
+    return [image for image in images if image is not None]
+
+
 def image_list_detailed(request, marker=None, sort_dir='desc',
                         sort_key='created_at', filters=None, paginate=False):
     limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
@@ -113,16 +148,168 @@ def image_update(request, image_id, **kwargs):
         return glanceclient(request).images.update(image_id, **kwargs)
     finally:
         if image_data:
-            try:
-                os.remove(image_data.file.name)
-            except Exception as e:
-                filename = str(image_data.file)
-                if hasattr(image_data.file, 'name'):
-                    filename = image_data.file.name
-                msg = (('Failed to remove temporary image file '
-                        '%(file)s (%(e)s)') %
-                       dict(file=filename, e=str(e)))
-                LOG.warn(msg)
+            _remove_image_file(image_data)
+
+
+def _remove_image_file(image_data):
+    try:
+        os.remove(image_data.file.name)
+    except Exception as e:
+        filename = str(image_data.file)
+        if hasattr(image_data.file, 'name'):
+            filename = image_data.file.name
+        msg = (('Failed to remove temporary image file '
+                '%(file)s (%(e)s)') %
+               dict(file=filename, e=str(e)))
+        LOG.warn(msg)
+
+
+class _ProgressFile(object):
+    """File-like wrapper counting the bytes glanceclient reads from it."""
+
+    def __init__(self, data, callback):
+        self._data = data
+        self._callback = callback
+        self.file = data.file
+        self.name = getattr(data, 'name', None)
+
+    def read(self, size=-1):
+        chunk = self._data.read(size)
+        if chunk:
+            self._callback(len(chunk))
+        return chunk
+
+    def seek(self, *args):
+        return self._data.seek(*args)
+
+    def tell(self):
+        return self._data.tell()
+
+
+class ImageUploadManager(object):
+    """Uploads local image files to Glance in the background.
+
+    Uploads are handed to a bounded pool of worker threads whose size is
+    controlled by the ``HORIZON_IMAGES_UPLOAD_WORKERS`` setting. The state of
+    every upload is recorded in the Django cache, so that it can be queried
+    from any WSGI process with :meth:`get_status`.
+    """
+
+    CACHE_KEY = 'horizon:image_upload:%s'
+    # How long a finished upload's status is kept around, in seconds.
+    STATUS_TIMEOUT = 60 * 60
+    # Minimum interval between two progress updates, in seconds.
+    PROGRESS_INTERVAL = 1
+    # How long the process waits for the running uploads when it exits, in
+    # seconds. The uploads still running then are abandoned.
+    SHUTDOWN_TIMEOUT = 10
+
+    def __init__(self):
+        self._pool = None
+        self._lock = threading.Lock()
+        self._stopping = False
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                workers = getattr(settings, 'HORIZON_IMAGES_UPLOAD_WORKERS', 4)
+                self._pool = concurrency.ThreadPool(
+                    workers, name='image-upload', inline=False)
+                atexit.register(self.shutdown,
+                                timeout=self.SHUTDOWN_TIMEOUT)
+            return self._pool
+
+    def _set_status(self, image_id, **values):
+        key = self.CACHE_KEY % image_id
+        status = cache.get(key) or {'image_id': image_id}
+        status.update(values)
+        total = status.get('total_bytes')
+        if total:
+            status['progress'] = int(
+                100 * status.get('bytes_uploaded', 0) / total)
+        cache.set(key, status, self.STATUS_TIMEOUT)
+        return status
+
+    def get_status(self, image_id):
+        """Returns the status of an upload, or ``None`` if it is unknown.
+
+        The status is a dictionary with the ``status`` (one of ``queued``,
+        ``uploading``, ``active`` or ``error``), ``bytes_uploaded``,
+        ``total_bytes``, ``progress`` (in percent) and ``error`` keys.
+        """
+        return cache.get(self.CACHE_KEY % image_id)
+
+    def submit(self, request, image_id, data):
+        """Queues the upload of ``data`` to the image ``image_id``."""
+        if isinstance(data, InMemoryUploadedFile):
+            # Spool the data to a temporary file rather than keeping a second
+            # copy of it in memory; Django closes the original one once the
+            # request has been handled.
+            data = self._spool(data)
+        if isinstance(data, TemporaryUploadedFile):
+            # Hack to fool Django, so we can keep file open in the new thread.
+            data.file.close_called = True
+        self._set_status(image_id, status='queued', bytes_uploaded=0,
+                         total_bytes=getattr(data, 'size', None), progress=0,
+                         error=None)
+        self._get_pool().submit(self._upload, request, image_id, data)
+
+    @staticmethod
+    def _spool(data):
+        spooled = TemporaryUploadedFile(data.name, data.content_type,
+                                        data.size, data.charset)
+        for chunk in data.chunks():
+            spooled.write(chunk)
+        spooled.seek(0)
+        return spooled
+
+    def _upload(self, request, image_id, data):
+        if self._stopping:
+            self._fail(request, image_id, data, 'Upload cancelled.')
+            return
+
+        progress = {'bytes': 0, 'reported': time.time()}
+
+        def on_read(size):
+            progress['bytes'] += size
+            now = time.time()
+            if now - progress['reported'] >= self.PROGRESS_INTERVAL:
+                progress['reported'] = now
+                self._set_status(image_id, bytes_uploaded=progress['bytes'])
+
+        self._set_status(image_id, status='uploading')
+        try:
+            image_update(request, image_id,
+                         data=_ProgressFile(data, on_read),
+                         purge_props=False)
+        except Exception as e:
+            LOG.exception('Failed to upload data for image %s.', image_id)
+            self._fail(request, image_id, None, str(e))
+        else:
+            self._set_status(image_id, status='active',
+                             bytes_uploaded=progress['bytes'])
+
+    def _fail(self, request, image_id, data, message):
+        self._set_status(image_id, status='error', error=message)
+        if data is not None:
+            _remove_image_file(data)
+        # An image without data is of no use to anyone; clean it up.
+        try:
+            image_delete(request, image_id)
+        except Exception:
+            LOG.warn('Failed to delete image %s after a failed upload.',
+                     image_id)
+
+    def shutdown(self, wait=True, timeout=None):
+        """Stops the workers, cancelling uploads that haven't started."""
+        self._stopping = True
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, timeout=timeout)
+
+
+upload_manager = ImageUploadManager()
 
 
 def image_create(request, **kwargs):
@@ -139,30 +326,25 @@ def image_create(request, **kwargs):
     asynchronously.
 
     In the case of 'data' the process of uploading the data may take
-    some time and is handed off to a seperate thread.
+    some time and is handed off to the :class:`ImageUploadManager`. Its
+    progress can be followed with :func:`image_upload_status`.
     """
     data = kwargs.pop('data', None)
 
     image = glanceclient(request).images.create(**kwargs)
 
     if data:
-        if isinstance(data, TemporaryUploadedFile):
-            # Hack to fool Django, so we can keep file open in the new thread.
-            data.file.close_called = True
-        if isinstance(data, InMemoryUploadedFile):
-            # Clone a new file for InMemeoryUploadedFile.
-            # Because the old one will be closed by Django.
-            data = SimpleUploadedFile(data.name,
-                                      data.read(),
-                                      data.content_type)
-        thread.start_new_thread(image_update,
-                                (request, image.id),
-                                {'data': data,
-                                 'purge_props': False})
+        upload_manager.submit(request, image.id, data)
 
     return image
 
 
+def image_upload_status(request, image_id):
+    """Returns the status of a local upload started by :func:`image_create`.
+    """
+    return upload_manager.get_status(image_id)
+
+
 def image_update_properties(request, image_id, remove_props=None, **kwargs):
     """Add or update a custom property of an image."""
     return glanceclient(request, '2').images.update(image_id,
@@ -297,16 +479,71 @@ def metadefs_namespace_list(request,
     return namespaces, has_more_data, has_prev_data
 
 
+NAMESPACE_CACHE_KEY = 'horizon:metadefs_namespace:%s'
+
+
+def _namespace_cache_key(namespace):
+    if isinstance(namespace, six.text_type):
+        namespace = namespace.encode('utf-8')
+    return NAMESPACE_CACHE_KEY % hashlib.sha1(namespace).hexdigest()
+
+
+def invalidate_metadefs_namespace(namespace):
+    """Drops the cached details of ``namespace`` for every resource type."""
+    cache.delete(_namespace_cache_key(namespace))
+
+
+def metadefs_namespace_get_many(request, namespaces, resource_type=None):
+    """Returns the details of several namespaces, as plain dictionaries.
+
+    The details are kept in the Django cache for
+    ``METADEFS_NAMESPACE_CACHE_TIMEOUT`` seconds, per namespace and resource
+    type, and are shared between requests. Only the namespaces the request
+    was allowed to list should be passed in. Those missing from the cache are
+    fetched concurrently.
+    """
+    timeout = getattr(settings, 'METADEFS_NAMESPACE_CACHE_TIMEOUT', 300)
+    keys = dict((name, _namespace_cache_key(name)) for name in namespaces)
+    cached = cache.get_many(keys.values()) if timeout else {}
+
+    details = {}
+    missing = []
+    for name in namespaces:
+        entry = cached.get(keys[name]) or {}
+        if resource_type in entry:
+            details[name] = entry[resource_type]
+        elif name not in missing:
+            missing.append(name)
+        if timeout:
+            metrics.CACHE_LOOKUPS.inc(
+                cache='metadefs_namespace',
+                result='hit' if resource_type in entry else 'miss')
+
+    def fetch(name):
+        return dict(glanceclient(request, '2').metadefs_namespace.get(
+            name, resource_type=resource_type))
+
+    if missing:
+        fetched = concurrency.concurrent_map(fetch, missing)
+        for name, namespace in zip(missing, fetched):
+            details[name] = namespace
+            if timeout:
+                entry = cached.get(keys[name]) or {}
+                entry[resource_type] = namespace
+                cache.set(keys[name], entry, timeout)
+
+    return [details[name] for name in namespaces]
+
+
 def metadefs_namespace_full_list(request, resource_type, filters={},
                                  *args, **kwargs):
     filters['resource_types'] = [resource_type]
     namespaces, has_more_data, has_prev_data = metadefs_namespace_list(
         request, filters, *args, **kwargs
     )
-    return [
-        metadefs_namespace_get(request, x.namespace, resource_type)
-        for x in namespaces
-    ], has_more_data, has_prev_data
+    return metadefs_namespace_get_many(
+        request, [x.namespace for x in namespaces], resource_type
+    ), has_more_data, has_prev_data
 
 
 def metadefs_namespace_create(request, namespace):
@@ -314,13 +551,16 @@ def metadefs_namespace_create(request, namespace):
 
 
 def metadefs_namespace_update(request, namespace_name, **properties):
-    return glanceclient(request, '2').metadefs_namespace.update(
+    namespace = glanceclient(request, '2').metadefs_namespace.update(
         namespace_name,
         **properties)
+    invalidate_metadefs_namespace(namespace_name)
+    return namespace
 
 
 def metadefs_namespace_delete(request, namespace_name):
-    return glanceclient(request, '2').metadefs_namespace.delete(namespace_name)
+    glanceclient(request, '2').metadefs_namespace.delete(namespace_name)
+    invalidate_metadefs_namespace(namespace_name)
 
 
 def metadefs_resource_types_list(request):
@@ -338,8 +578,10 @@ def metadefs_namespace_resource_types(request, namespace_name):
 def metadefs_namespace_add_resource_type(request,
                                          namespace_name,
                                          resource_type):
-    return glanceclient(request, '2').metadefs_resource_type.associate(
+    association = glanceclient(request, '2').metadefs_resource_type.associate(
         namespace_name, **resource_type)
+    invalidate_metadefs_namespace(namespace_name)
+    return association
 
 
 def metadefs_namespace_remove_resource_type(request,
@@ -347,3 +589,4 @@ def metadefs_namespace_remove_resource_type(request,
                                             resource_type_name):
     glanceclient(request, '2').metadefs_resource_type.deassociate(
         namespace_name, resource_type_name)
+    invalidate_metadefs_namespace(namespace_name)
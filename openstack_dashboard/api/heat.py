@@ -18,6 +18,7 @@ from heatclient import client as heat_client
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
 from openstack_dashboard.api import base
+from openstack_dashboard.api import connection_pool
 
 LOG = logging.getLogger(__name__)
 
@@ -36,17 +37,24 @@ def heatclient(request, password=None):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
     endpoint = base.url_for(request, 'orchestration')
-    kwargs = {
-        'token': request.user.token.id,
-        'insecure': insecure,
-        'ca_file': cacert,
-        'username': request.user.username,
-        'password': password
-        # 'timeout': args.timeout,
-        # 'ca_file': args.ca_file,
-        # 'cert_file': args.cert_file,
-        # 'key_file': args.key_file,
-    }
+    if password is None:
+        kwargs = connection_pool.get_client_session(
+            endpoint, request.user.token.id, cacert=cacert, insecure=insecure)
+    else:
+        # The session client of heatclient doesn't send the credentials
+        # Heat stores for deferred operations, so the calls taking a
+        # password use the legacy client (and their own connections).
+        kwargs = {
+            'token': request.user.token.id,
+            'insecure': insecure,
+            'ca_file': cacert,
+            'username': request.user.username,
+            'password': password
+            # 'timeout': args.timeout,
+            # 'ca_file': args.ca_file,
+            # 'cert_file': args.cert_file,
+            # 'key_file': args.key_file,
+        }
     client = heat_client.Client(api_version, endpoint, **kwargs)
     client.format_parameters = format_parameters
     return client
@@ -40,6 +40,7 @@ from openstack_dashboard import policy
 
 LOG = logging.getLogger(__name__)
 DEFAULT_ROLE = None
+ADMIN_ALLOWED_ATTR = "_keystone_admin_allowed"
 
 
 # Set up our data structure for managing Identity API versions, and
@@ -122,6 +123,21 @@ def _get_endpoint_url(request, endpoint_type, catalog=None):
     return url
 
 
+def _is_admin_allowed(request):
+    """Checks the identity admin policy for the request's current token.
+
+    The outcome is cached on the request so that the policy engine only runs
+    once per request and token, however many admin clients are asked for.
+    """
+    token_id = request.user.token.id
+    cached = getattr(request, ADMIN_ALLOWED_ATTR, None)
+    if cached is not None and cached[0] == token_id:
+        return cached[1]
+    allowed = policy.check((("identity", "admin_required"),), request)
+    setattr(request, ADMIN_ALLOWED_ATTR, (token_id, allowed))
+    return allowed
+
+
 def keystoneclient(request, admin=False):
     """Returns a client connected to the Keystone backend.
 
@@ -142,11 +158,12 @@ def keystoneclient(request, admin=False):
     as a keyword argument.
 
     The client is cached so that subsequent API calls during the same
-    request/response cycle don't have to be re-authenticated.
+    request/response cycle don't have to be re-authenticated. Likewise the
+    admin policy is only checked once per request and token.
     """
     user = request.user
     if admin:
-        if not policy.check((("identity", "admin_required"),), request):
+        if not _is_admin_allowed(request):
             raise exceptions.NotAuthorized
         endpoint_type = 'adminURL'
     else:
@@ -259,6 +276,55 @@ def tenant_delete(request, project):
     return manager.delete(project)
 
 
+def _paginate(request, items, marker=None):
+    """Returns the page of ``items`` following the one with the id ``marker``.
+
+    Keystone v3 doesn't support marker based pagination, so its listings are
+    paginated here, after any filtering has been done by Keystone. Every
+    page therefore costs a full (filtered) listing. Returns a tuple of the
+    page and whether there are more items after it.
+
+    Raises :class:`horizon.exceptions.NotFound` if ``marker`` isn't one of
+    the ``items``, e.g. because that item was deleted since the previous
+    page was shown, rather than starting over at the first page.
+    """
+    page_size = utils.get_page_size(request)
+    start = 0
+    if marker:
+        for index, item in enumerate(items):
+            if item.id == marker:
+                start = index + 1
+                break
+        else:
+            raise exceptions.NotFound(
+                _('The page following "%s" could not be found.') % marker)
+    page = list(items[start:start + page_size + 1])
+    has_more_data = len(page) > page_size
+    return page[:page_size], has_more_data
+
+
+def _match(item, key, value):
+    if key.endswith('__icontains'):
+        attr = getattr(item, key[:-len('__icontains')], None) or ''
+        return value.lower() in attr.lower()
+    return getattr(item, key, None) == value
+
+
+def _filter(items, filters):
+    """Applies ``filters`` to the result of a listing.
+
+    A filter on ``<attribute>__icontains`` matches the items whose attribute
+    contains the value, ignoring case, as it does with Keystone v3. Other
+    filters are exact matches. This is used where Keystone doesn't filter
+    (v2, and v3 backends ignoring some filters).
+    """
+    if not filters:
+        return items
+    return [item for item in items
+            if all(_match(item, key, value)
+                   for key, value in filters.items())]
+
+
 def tenant_list(request, paginate=False, marker=None, domain=None, user=None,
                 admin=True, filters=None):
     manager = VERSIONS.get_project_manager(request, admin=admin)
@@ -273,9 +339,14 @@ def tenant_list(request, paginate=False, marker=None, domain=None, user=None,
     # if requesting the projects for the current user,
     # return the list from the cache
     if user == request.user.id:
-        tenants = request.user.authorized_tenants
+        tenants = _filter(request.user.authorized_tenants, filters)
 
     elif VERSIONS.active < 3:
+        if filters:
+            tenants = _filter(manager.list(), filters)
+            if paginate:
+                tenants, has_more_data = _paginate(request, tenants, marker)
+            return (tenants, has_more_data)
         tenants = manager.list(limit, marker)
         if paginate and len(tenants) > page_size:
             tenants.pop(-1)
@@ -287,7 +358,9 @@ def tenant_list(request, paginate=False, marker=None, domain=None, user=None,
         }
         if filters is not None:
             kwargs.update(filters)
-        tenants = manager.list(**kwargs)
+        tenants = _filter(manager.list(**kwargs), filters)
+        if paginate:
+            tenants, has_more_data = _paginate(request, tenants, marker)
     return (tenants, has_more_data)
 
 
@@ -305,7 +378,15 @@ def tenant_update(request, project, name=None, description=None,
         raise exceptions.Conflict()
 
 
-def user_list(request, project=None, domain=None, group=None, filters=None):
+def user_list(request, project=None, domain=None, group=None, filters=None,
+              paginate=False, marker=None):
+    """Returns the users matching the given criteria.
+
+    ``filters`` are applied by Keystone v3 and again by Horizon, for Keystone
+    v2 and the backends ignoring some of them (see :func:`_filter`). With
+    ``paginate`` only the page of users after the one with the id ``marker``
+    is returned, together with whether there are more.
+    """
     if VERSIONS.active < 3:
         kwargs = {"tenant_id": project}
     else:
@@ -317,7 +398,24 @@ def user_list(request, project=None, domain=None, group=None, filters=None):
         if filters is not None:
             kwargs.update(filters)
     users = keystoneclient(request, admin=True).users.list(**kwargs)
-    return [VERSIONS.upgrade_v2_user(user) for user in users]
+    users = [VERSIONS.upgrade_v2_user(user) for user in users]
+    users = _filter(users, filters)
+    if paginate:
+        return _paginate(request, users, marker)
+    return users
+
+
+def user_search(request, query, domain=None, limit=None):
+    """Returns the users whose name contains ``query``, ignoring case.
+
+    The search is made by Keystone where it supports inexact filtering and
+    repeated here for the deployments where it doesn't. At most ``limit``
+    users are returned, by default a page worth.
+    """
+    limit = limit or utils.get_page_size(request)
+    users = user_list(request, domain=domain,
+                      filters={'name__icontains': query})
+    return users[:limit]
 
 
 def user_create(request, name=None, email=None, password=None, project=None,
@@ -467,9 +565,11 @@ def group_delete(request, group_id):
     return manager.delete(group_id)
 
 
-def group_list(request, domain=None, project=None, user=None):
+def group_list(request, domain=None, project=None, user=None, filters=None,
+               paginate=False, marker=None):
     manager = keystoneclient(request, admin=True).groups
-    groups = manager.list(user=user, domain=domain)
+    groups = _filter(manager.list(user=user, domain=domain, **(filters or {})),
+                     filters)
 
     if project:
         project_groups = []
@@ -479,6 +579,8 @@ def group_list(request, domain=None, project=None, user=None):
                 project_groups.append(group)
         groups = project_groups
 
+    if paginate:
+        return _paginate(request, groups, marker)
     return groups
 
 
@@ -14,10 +14,12 @@
 
 from __future__ import absolute_import
 
-from collections import OrderedDict
+import functools
+
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import messages
+from horizon.utils import concurrency
 
 from openstack_dashboard.api import neutron
 
@@ -109,9 +111,13 @@ def vip_get(request, vip_id):
 def _vip_get(request, vip_id, expand_resource=False):
     vip = neutronclient(request).show_vip(vip_id).get('vip')
     if expand_resource:
-        vip['subnet'] = neutron.subnet_get(request, vip['subnet_id'])
-        vip['port'] = neutron.port_get(request, vip['port_id'])
-        vip['pool'] = _pool_get(request, vip['pool_id'])
+        vip.update(concurrency.run_concurrently([
+            ('subnet', functools.partial(neutron.subnet_get, request,
+                                         vip['subnet_id'])),
+            ('port', functools.partial(neutron.port_get, request,
+                                       vip['port_id'])),
+            ('pool', functools.partial(_pool_get, request, vip['pool_id'])),
+        ]))
     return Vip(vip)
 
 
@@ -147,13 +153,10 @@ def pool_create(request, **kwargs):
     return Pool(pool)
 
 
-def _get_vip(request, pool, vip_dict):
+def _get_vip(request, pool):
     if pool['vip_id'] is not None:
         try:
-            if vip_dict:
-                vip = vip_dict.get(pool['vip_id'])
-            else:
-                vip = _vip_get(request, pool['vip_id'])
+            vip = _vip_get(request, pool['vip_id'])
         except Exception:
             messages.warning(request, _("Unable to get VIP for pool "
                                         "%(pool)s.") % {"pool": pool["id"]})
@@ -169,16 +172,19 @@ def pool_list(request, **kwargs):
 
 def _pool_list(request, expand_subnet=False, expand_vip=False, **kwargs):
     pools = neutronclient(request).list_pools(**kwargs).get('pools')
+    # Only the subnets and VIPs the pools refer to are retrieved, each with
+    # a single filtered listing.
+    expansions = []
     if expand_subnet:
-        subnets = neutron.subnet_list(request)
-        subnet_dict = OrderedDict((s.id, s) for s in subnets)
-        for p in pools:
-            p['subnet'] = subnet_dict.get(p['subnet_id'])
+        expansions.append(('subnet', functools.partial(
+            neutron.expand_resources, pools, 'subnet_id', 'subnet',
+            functools.partial(neutron.subnet_list, request))))
     if expand_vip:
-        vips = vip_list(request)
-        vip_dict = OrderedDict((v.id, v) for v in vips)
-        for p in pools:
-            p['vip'] = _get_vip(request, p, vip_dict)
+        expansions.append(('vip', functools.partial(
+            neutron.expand_resources, pools, 'vip_id', 'vip',
+            functools.partial(vip_list, request))))
+    if pools and expansions:
+        concurrency.run_concurrently(expansions)
     return [Pool(p) for p in pools]
 
 
@@ -204,7 +210,7 @@ def _pool_get(request, pool_id, expand_resource=False):
         except Exception:
             messages.warning(request, _("Unable to get subnet for pool "
                                         "%(pool)s.") % {"pool": pool_id})
-        pool['vip'] = _get_vip(request, pool, vip_dict=None)
+        pool['vip'] = _get_vip(request, pool)
         # Check here to reduce the additional request if pool['members'] is
         # empty
         if pool['members']:
@@ -217,13 +223,17 @@ def _pool_get(request, pool_id, expand_resource=False):
         # If the filter to get health monitors list is empty, all health
         # monitors will be returned in the tenant.
         if pool['health_monitors']:
+            try:
+                monitor_dict = neutron.list_resources_by_ids(
+                    functools.partial(pool_health_monitor_list, request),
+                    pool['health_monitors'])
+            except Exception:
+                monitor_dict = {}
             monitors = []
             for monitor_id in pool['health_monitors']:
-                try:
-                    monitors.append(_pool_health_monitor_get(request,
-                                                             monitor_id,
-                                                             False))
-                except Exception:
+                if monitor_id in monitor_dict:
+                    monitors.append(monitor_dict[monitor_id])
+                else:
                     messages.warning(request,
                                      _("Unable to get health monitor "
                                        "%(monitor_id)s for pool %(pool)s.")
@@ -340,10 +350,12 @@ def member_list(request, **kwargs):
 def _member_list(request, expand_pool, **kwargs):
     members = neutronclient(request).list_members(**kwargs).get('members')
     if expand_pool:
-        pools = _pool_list(request)
-        pool_dict = OrderedDict((p.id, p) for p in pools)
+        pool_dict = neutron.list_resources_by_ids(
+            functools.partial(_pool_list, request),
+            [m['pool_id'] for m in members])
         for m in members:
-            m['pool_name'] = pool_dict.get(m['pool_id']).name_or_id
+            pool = pool_dict.get(m['pool_id'])
+            m['pool_name'] = pool.name_or_id if pool else m['pool_id']
     return [Member(m) for m in members]
 
 
@@ -33,6 +33,7 @@ import six
 from horizon import messages
 from horizon.utils.memoized import memoized  # noqa
 from openstack_dashboard.api import base
+from openstack_dashboard.api import connection_pool
 from openstack_dashboard.api import network_base
 from openstack_dashboard.api import nova
 from openstack_dashboard import policy
@@ -553,11 +554,9 @@ def get_ipver_str(ip_version):
 def neutronclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
-    c = neutron_client.Client(token=request.user.token.id,
-                              auth_url=base.url_for(request, 'identity'),
-                              endpoint_url=base.url_for(request, 'network'),
-                              insecure=insecure, ca_cert=cacert)
-    return c
+    return neutron_client.Client(**connection_pool.get_client_session(
+        base.url_for(request, 'network'), request.user.token.id,
+        cacert=cacert, insecure=insecure))
 
 
 def list_resources_with_long_filters(list_method,
@@ -614,6 +613,53 @@ def list_resources_with_long_filters(list_method,
         return resources
 
 
+def list_resources_by_ids(list_method, ids, **params):
+    """Returns the resources with the given IDs, by ID.
+
+    The resources are retrieved with a single ``id`` filtered listing, split
+    in chunks if the URI would be too long (see
+    :func:`list_resources_with_long_filters`). Nothing is retrieved if
+    there are no IDs, as an empty filter would return every resource.
+
+    :param list_method: a method listing the resources and returning API
+        wrappers, e.g. ``functools.partial(subnet_list, request)``.
+    """
+    ids = sorted(set(resource_id for resource_id in ids if resource_id))
+    if not ids:
+        return collections.OrderedDict()
+    resources = list_resources_with_long_filters(list_method, 'id', ids,
+                                                 **params)
+    return collections.OrderedDict((r.id, r) for r in resources)
+
+
+def expand_resources(items, id_key, target_key, list_method, **params):
+    """Attaches the resources referenced by a list of API dicts.
+
+    ``item[id_key]`` is either a single ID or a list of IDs. The IDs
+    referenced by all ``items`` are retrieved at once with
+    :func:`list_resources_by_ids` and ``item[target_key]`` is set to the
+    matching resource (or list of resources), ``None`` standing in for the
+    ones which do not exist.
+
+    :returns: the retrieved resources, by ID.
+    """
+    ids = []
+    for item in items:
+        value = item.get(id_key)
+        if isinstance(value, (list, tuple)):
+            ids.extend(value)
+        else:
+            ids.append(value)
+    resources = list_resources_by_ids(list_method, ids, **params)
+    for item in items:
+        value = item.get(id_key)
+        if isinstance(value, (list, tuple)):
+            item[target_key] = [resources.get(i) for i in value]
+        else:
+            item[target_key] = resources.get(value)
+    return resources
+
+
 def network_list(request, **params):
     LOG.debug("network_list(): params=%s", params)
     networks = neutronclient(request).list_networks(**params).get('networks')
@@ -36,10 +36,12 @@ from novaclient.v2 import security_groups as nova_security_groups
 from novaclient.v2 import servers as nova_servers
 
 from horizon import conf
+from horizon.utils import concurrency
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
+from openstack_dashboard.api import connection_pool
 from openstack_dashboard.api import network_base
 
 
@@ -445,16 +447,12 @@ class FloatingIpManager(network_base.FloatingIpManager):
 def novaclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
-    c = nova_client.Client(2, request.user.username,
-                           request.user.token.id,
-                           project_id=request.user.tenant_id,
-                           auth_url=base.url_for(request, 'compute'),
-                           insecure=insecure,
-                           cacert=cacert,
-                           http_log_debug=settings.DEBUG)
-    c.client.auth_token = request.user.token.id
-    c.client.management_url = base.url_for(request, 'compute')
-    return c
+    url = base.url_for(request, 'compute')
+    return nova_client.Client(2, project_id=request.user.tenant_id,
+                              http_log_debug=settings.DEBUG,
+                              **connection_pool.get_client_session(
+                                  url, request.user.token.id,
+                                  cacert=cacert, insecure=insecure))
 
 
 def server_vnc_console(request, instance_id, console_type='novnc'):
@@ -509,6 +507,34 @@ def flavor_list(request, is_public=True, get_extras=False):
     return flavors
 
 
+@memoized
+def flavor_list_by_ids(request, flavor_ids):
+    """Returns the flavors with the given IDs.
+
+    Public and private flavors are retrieved with a single listing. Flavors
+    which are not part of it, e.g. because they have been deleted, are then
+    retrieved concurrently. Unknown flavors are left out of the result.
+
+    :param flavor_ids: a tuple of flavor IDs.
+    """
+    flavors = dict((flavor.id, flavor)
+                   for flavor in flavor_list(request, is_public=None))
+
+    def get_flavor(flavor_id):
+        try:
+            return flavor_get(request, flavor_id)
+        except nova_exceptions.NotFound:
+            return None
+
+    missing = [flavor_id for flavor_id in flavor_ids
+               if flavor_id not in flavors]
+    for flavor in concurrency.concurrent_map(get_flavor, missing):
+        if flavor is not None:
+            flavors[flavor.id] = flavor
+    return [flavors[flavor_id] for flavor_id in flavor_ids
+            if flavor_id in flavors]
+
+
 @memoized
 def flavor_access_list(request, flavor=None):
     """Get the list of access instance sizes (flavors)."""
@@ -22,6 +22,7 @@ in https://wiki.openstack.org/wiki/APIChangeGuidelines.
 """
 
 # import REST API modules here
+from . import batch        #flake8: noqa
 from . import cinder       #flake8: noqa
 from . import config       #flake8: noqa
 from . import glance       #flake8: noqa
@@ -0,0 +1,157 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+"""API for making many REST API calls in a single request.
+"""
+
+import copy
+import functools
+import json
+
+from django.core import urlresolvers
+from django import http
+from django.utils import datastructures
+from django.utils import encoding
+from django.utils import translation
+from django.views import generic
+import six
+
+from horizon.utils import concurrency
+
+from openstack_dashboard.api.rest import urls
+from openstack_dashboard.api.rest import utils as rest_utils
+
+
+# The most sub-requests a single batch may hold.
+MAX_REQUESTS = 50
+
+# The methods of the sub-requests made concurrently.
+CONCURRENT_METHODS = ('GET', 'HEAD')
+
+
+def _method(spec):
+    """Returns the method of a sub-request, or ``None`` if it is invalid."""
+    if not isinstance(spec, dict):
+        return None
+    return spec.get('method', 'GET').upper()
+
+
+def _sub_request(request, spec):
+    """Builds the request dispatched for one sub-request of a batch.
+
+    The sub-request is a copy of the batch request, so that it shares its
+    user, session and any API client already set up for it. As the session
+    is not thread-safe, only the sub-requests which don't change it (those
+    with a method in ``CONCURRENT_METHODS``) may run in other threads.
+    """
+    method = _method(spec)
+    query = spec.get('query') or ''
+    if not isinstance(query, six.string_types):
+        query_dict = http.QueryDict('', mutable=True)
+        for key, value in query.items():
+            if not isinstance(value, (list, tuple)):
+                value = [value]
+            query_dict.setlist(key, [six.text_type(v) for v in value])
+        query = query_dict.urlencode()
+    body = spec.get('body')
+
+    sub = copy.copy(request)
+    sub.META = dict(request.META, REQUEST_METHOD=method, QUERY_STRING=query,
+                    CONTENT_TYPE='application/json')
+    # The validators of the batch request don't apply to its sub-requests.
+    sub.META.pop('HTTP_IF_NONE_MATCH', None)
+    sub.method = method
+    sub.path = sub.path_info = spec['path']
+    sub.GET = http.QueryDict(query)
+    sub._body = json.dumps(body).encode('utf-8') if body is not None else b''
+    sub._post = http.QueryDict('')
+    sub._files = datastructures.MultiValueDict()
+    return sub
+
+
+def _resolve(path, prefix):
+    """Resolves ``path`` against the REST API URLs.
+
+    ``path`` is either a full path, starting with ``prefix`` (the path the
+    REST API is served at), or one relative to the REST API.
+    """
+    if path.startswith(prefix):
+        path = path[len(prefix):]
+    path = '/' + path.lstrip('/')
+    match = urlresolvers.resolve(path, urls)
+    if match.func.__name__ == Batch.__name__:
+        raise rest_utils.AjaxError(400, 'batch requests cannot be nested')
+    return match
+
+
+def _dispatch(request, spec, prefix, language):
+    """Dispatches a sub-request and returns its response as a dict."""
+    try:
+        if not isinstance(spec, dict) or 'path' not in spec:
+            raise rest_utils.AjaxError(400, 'sub-request requires a path')
+        match = _resolve(spec['path'], prefix)
+        sub = _sub_request(request, spec)
+        # The language is activated per thread.
+        with translation.override(language):
+            response = match.func(sub, *match.args, **match.kwargs)
+    except urlresolvers.Resolver404:
+        return {'status': 404, 'body': 'not found: %s' % spec['path']}
+    except rest_utils.AjaxError as e:
+        return {'status': e.http_status, 'body': six.text_type(e)}
+
+    content = encoding.force_text(rest_utils.get_content(response))
+    if response.get('Content-Type', '').startswith('application/json'):
+        content = json.loads(content) if content else None
+    return {'status': response.status_code, 'body': content}
+
+
+@urls.register
+class Batch(generic.View):
+    """API for making many REST API calls at once.
+    """
+    url_regex = r'batch/$'
+
+    @rest_utils.ajax(data_required=True)
+    def post(self, request):
+        """Make several REST API calls.
+
+        The POST data should be an application/json array of the calls to
+        make, each one an object with a "path" (e.g. "/api/nova/servers/" or
+        just "nova/servers/") and optional "method" (defaults to "GET"),
+        "query" (an object or a query string) and "body" (sent as JSON)
+        attributes.
+
+        The calls are made on behalf of the user making the batch request.
+        Those changing something (any method but GET and HEAD) are made
+        first, one after another in the order given, then the others are
+        made concurrently. This method returns an array holding, in the
+        order of the calls, an object with the "status" and decoded "body"
+        of each call's response.
+        """
+        if not isinstance(request.DATA, list):
+            raise rest_utils.AjaxError(400, 'batch requires an array')
+        if len(request.DATA) > MAX_REQUESTS:
+            raise rest_utils.AjaxError(
+                400, 'batch is limited to %d requests' % MAX_REQUESTS)
+        prefix = request.path[:-len('batch/')]
+        language = translation.get_language()
+        results = {}
+        concurrent_calls = []
+        for i, spec in enumerate(request.DATA):
+            call = functools.partial(_dispatch, request, spec, prefix,
+                                     language)
+            if _method(spec) in CONCURRENT_METHODS:
+                concurrent_calls.append((i, call))
+            else:
+                results[i] = call()
+        if concurrent_calls:
+            results.update(concurrency.run_concurrently(concurrent_calls))
+        return [results[i] for i in range(len(request.DATA))]
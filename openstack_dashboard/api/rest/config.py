@@ -39,6 +39,8 @@ class Settings(generic.View):
     """
     url_regex = r'settings/$'
 
+    # The settings only change when Horizon is restarted.
+    @rest_utils.conditional(max_age=300)
     @rest_utils.ajax()
     def get(self, request):
         return {k: getattr(settings, k, None) for k in settings_allowed}
@@ -11,10 +11,16 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
+import copy
+import itertools
 import json
 import json.encoder as encoder
 
 from django.utils.translation import ugettext_lazy as _
+import six
+
+# How many list items are encoded at a time by iterencode().
+CHUNK_SIZE = 100
 
 
 class NaNJSONEncoder(json.JSONEncoder):
@@ -23,6 +29,25 @@ class NaNJSONEncoder(json.JSONEncoder):
         self.inf_str = inf_str
         super(NaNJSONEncoder, self).__init__(**kwargs)
 
+    def encode(self, o):
+        """Encodes with the standard (C-accelerated) encoder if possible.
+
+        The overridden iterencode() is implemented in pure Python, so it is
+        only used once the standard encoder found a NaN or infinite value.
+        """
+        strict = getattr(self, '_strict', None)
+        if strict is None:
+            strict = copy.copy(self)
+            strict.allow_nan = False
+            self._strict = strict
+        try:
+            return ''.join(json.JSONEncoder.iterencode(strict, o,
+                                                       _one_shot=True))
+        except ValueError:
+            if not self.allow_nan:
+                raise
+        return super(NaNJSONEncoder, self).encode(o)
+
     def iterencode(self, o, _one_shot=False):
         """The sole purpose of defining a custom JSONEncoder class is to
         override floatstr() inner function, or more specifically the
@@ -74,3 +99,65 @@ class NaNJSONEncoder(json.JSONEncoder):
             self.key_separator, self.item_separator, self.sort_keys,
             self.skipkeys, _one_shot)
         return _iterencode(o, 0)
+
+
+def count_items(data):
+    """Returns the number of items of the lists iterencode() streams."""
+    if isinstance(data, (list, tuple)):
+        return len(data)
+    if isinstance(data, dict):
+        return sum(len(value) for value in data.values()
+                   if isinstance(value, (list, tuple)))
+    return 0
+
+
+def _iterencode_rest(items, json_encoder, chunk_size):
+    for start in range(chunk_size, len(items), chunk_size):
+        yield json_encoder.item_separator
+        # Encode the whole chunk at once, without its brackets.
+        yield json_encoder.encode(list(items[start:start + chunk_size]))[1:-1]
+    yield ']'
+
+
+def _iterencode_list(items, json_encoder, chunk_size):
+    first = json_encoder.encode(list(items[:chunk_size]))[1:-1]
+    return itertools.chain(['[', first],
+                           _iterencode_rest(items, json_encoder, chunk_size))
+
+
+def iterencode(data, json_encoder, chunk_size=CHUNK_SIZE):
+    """Encodes ``data`` with ``json_encoder`` one chunk at a time.
+
+    The lists ``data`` is made of (either ``data`` itself or the values of
+    a dict, such as the ``items`` of the REST API list responses) are
+    encoded ``chunk_size`` items at a time, so that large responses can be
+    streamed rather than built as a single string. Each chunk is encoded
+    with a single ``json_encoder.encode()`` call, which keeps the fast path
+    of the standard encoder. ``json_encoder`` must not indent its output.
+    The result is the same as encoding ``data`` at once.
+
+    The other values and the first chunk of each list are encoded by the
+    call itself, so that data which can't be encoded usually fails before
+    anything is sent; the rest is encoded as the result is iterated.
+    """
+    if isinstance(data, (list, tuple)):
+        return _iterencode_list(data, json_encoder, chunk_size)
+    elif (isinstance(data, dict) and
+          all(isinstance(key, six.string_types) for key in data)):
+        keys = sorted(data) if json_encoder.sort_keys else list(data)
+        parts = [['{']]
+        for i, key in enumerate(keys):
+            if i:
+                parts.append([json_encoder.item_separator])
+            parts.append([json_encoder.encode(key) +
+                          json_encoder.key_separator])
+            value = data[key]
+            if isinstance(value, (list, tuple)):
+                parts.append(_iterencode_list(value, json_encoder,
+                                              chunk_size))
+            else:
+                parts.append([json_encoder.encode(value)])
+        parts.append(['}'])
+        return itertools.chain.from_iterable(parts)
+    else:
+        return iter([json_encoder.encode(data)])
@@ -14,6 +14,9 @@
 """API over the keystone service.
 """
 
+import functools
+import hashlib
+
 import django.http
 from django.views import generic
 
@@ -105,11 +108,17 @@ class Users(generic.View):
         The DELETE data should be an application/json array of user ids to
         delete.
 
-        This method returns HTTP 204 (no content) on success.
+        The users are deleted concurrently. The current user is never
+        deleted.
+
+        This method returns HTTP 204 (no content) on success. Otherwise it
+        returns an object mapping each user id to the "status" and "error" of
+        its deletion, with the status of the first deletion which failed.
         """
-        for user_id in request.DATA:
-            if user_id != request.user.id:
-                api.keystone.user_delete(request, user_id)
+        user_ids = [user_id for user_id in request.DATA
+                    if user_id != request.user.id]
+        return rest_utils.BulkResponse(rest_utils.bulk_call(
+            functools.partial(api.keystone.user_delete, request), user_ids))
 
 
 @urls.register
@@ -223,10 +232,15 @@ class Roles(generic.View):
         The DELETE data should be an application/json array of role ids to
                 delete.
 
-        This method returns HTTP 204 (no content) on success.
+        The roles are deleted concurrently.
+
+        This method returns HTTP 204 (no content) on success. Otherwise it
+        returns an object mapping each role id to the "status" and "error" of
+        its deletion, with the status of the first deletion which failed.
         """
-        for role_id in request.DATA:
-            api.keystone.role_delete(request, role_id)
+        return rest_utils.BulkResponse(rest_utils.bulk_call(
+            functools.partial(api.keystone.role_delete, request),
+            request.DATA))
 
 
 @urls.register
@@ -314,10 +328,15 @@ class Domains(generic.View):
         The DELETE data should be an application/json array of domain ids to
                 delete.
 
-        This method returns HTTP 204 (no content) on success.
+        The domains are deleted concurrently.
+
+        This method returns HTTP 204 (no content) on success. Otherwise it
+        returns an object mapping each domain id to the "status" and "error"
+        of its deletion, with the status of the first deletion which failed.
         """
-        for domain_id in request.DATA:
-            api.keystone.domain_delete(request, domain_id)
+        return rest_utils.BulkResponse(rest_utils.bulk_call(
+            functools.partial(api.keystone.domain_delete, request),
+            request.DATA))
 
 
 @urls.register
@@ -460,10 +479,15 @@ class Projects(generic.View):
         The DELETE data should be an application/json array of project ids to
         delete.
 
-        This method returns HTTP 204 (no content) on success.
+        The projects are deleted concurrently.
+
+        This method returns HTTP 204 (no content) on success. Otherwise it
+        returns an object mapping each project id to the "status" and "error"
+        of its deletion, with the status of the first deletion which failed.
         """
-        for id in request.DATA:
-            api.keystone.tenant_delete(request, id)
+        return rest_utils.BulkResponse(rest_utils.bulk_call(
+            functools.partial(api.keystone.tenant_delete, request),
+            request.DATA))
 
 
 @urls.register
@@ -527,10 +551,17 @@ class ProjectRole(generic.View):
         )
 
 
+def _service_catalog_version(request):
+    # The catalog comes with the token, so it only changes with it.
+    token_id = request.user.token.id
+    return hashlib.sha1(token_id.encode('utf-8')).hexdigest()
+
+
 @urls.register
 class ServiceCatalog(generic.View):
     url_regex = r'keystone/svc-catalog/$'
 
+    @rest_utils.conditional(etag_func=_service_catalog_version)
     @rest_utils.ajax()
     def get(self, request):
         """Return the Keystone service catalog associated with the current
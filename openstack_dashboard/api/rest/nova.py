@@ -69,6 +69,7 @@ class AvailabilityZones(generic.View):
     """
     url_regex = r'nova/availzones/$'
 
+    @rest_utils.conditional()
     @rest_utils.ajax()
     def get(self, request):
         """Get a list of availability zones.
@@ -92,6 +93,7 @@ class Limits(generic.View):
     """
     url_regex = r'nova/limits/$'
 
+    @rest_utils.conditional()
     @rest_utils.ajax(json_encoder=json_encoder.NaNJSONEncoder)
     def get(self, request):
         """Get an object describing the current project limits.
@@ -196,6 +198,7 @@ class Extensions(generic.View):
     """
     url_regex = r'nova/extensions/$'
 
+    @rest_utils.conditional()
     @rest_utils.ajax()
     def get(self, request):
         """Get a list of extensions.
@@ -216,6 +219,7 @@ class Flavors(generic.View):
     """
     url_regex = r'nova/flavors/$'
 
+    @rest_utils.conditional()
     @rest_utils.ajax()
     def get(self, request):
         """Get a list of flavors.
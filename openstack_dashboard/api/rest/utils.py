@@ -11,20 +11,29 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import collections
 import functools
+import hashlib
 import json
 import logging
 
 from django.conf import settings
 from django import http
 from django.utils import decorators
+from django.utils import http as http_utils
 
 from oslo_serialization import jsonutils
 
 from horizon import exceptions
+from horizon.utils import concurrency
+
+from openstack_dashboard.api.rest import json_encoder as encoders
 
 log = logging.getLogger(__name__)
 
+# Responses holding at least that many list items are streamed.
+STREAMING_THRESHOLD = 1000
+
 
 class AjaxError(Exception):
     def __init__(self, http_status, msg):
@@ -63,6 +72,109 @@ class JSONResponse(http.HttpResponse):
         )
 
 
+def _log_stream_errors(chunks):
+    try:
+        for chunk in chunks:
+            yield chunk
+    except Exception:
+        # The status was sent already: aborting the response is the only
+        # way left to tell the client it is incomplete.
+        log.exception('error encoding a streamed response')
+        raise
+
+
+class StreamingJSONResponse(http.StreamingHttpResponse):
+    """A JSON response encoded as it is sent, for large list responses.
+
+    See :func:`openstack_dashboard.api.rest.json_encoder.iterencode`. The
+    start of the data is encoded when the response is created, so that
+    data which can't be encoded raises then, in the view. An error further
+    on is logged and aborts the response.
+    """
+    def __init__(self, data, status=200, json_encoder=json.JSONEncoder):
+        encoder = json_encoder(default=jsonutils.to_primitive,
+                               sort_keys=settings.DEBUG)
+        super(StreamingJSONResponse, self).__init__(
+            _log_stream_errors(encoders.iterencode(data, encoder)),
+            status=status,
+            content_type='application/json',
+        )
+
+
+def json_response(data, status=200, json_encoder=json.JSONEncoder):
+    """Returns a :class:`JSONResponse` of ``data``.
+
+    A :class:`StreamingJSONResponse` is returned instead if the lists in
+    ``data`` hold ``STREAMING_THRESHOLD`` items or more.
+    """
+    if encoders.count_items(data) >= STREAMING_THRESHOLD:
+        return StreamingJSONResponse(data, status, json_encoder)
+    return JSONResponse(data, status, json_encoder)
+
+
+def get_content(response):
+    """Returns the body of ``response``, whether it is streamed or not.
+
+    This consumes the content of a streamed response.
+    """
+    if response.streaming:
+        return b''.join(response.streaming_content)
+    return response.content
+
+
+class BulkResponse(JSONResponse):
+    """The response of an endpoint acting on many objects at once.
+
+    ``results`` is the mapping returned by :func:`bulk_call`. If every call
+    succeeded the response is an empty 204; otherwise the whole mapping is
+    returned, with the status of the first failed call.
+    """
+    def __init__(self, results):
+        failed = [result['status'] for result in results.values()
+                  if result['error'] is not None]
+        if failed:
+            super(BulkResponse, self).__init__(results, status=failed[0])
+        else:
+            super(BulkResponse, self).__init__('', status=204)
+
+
+def _error_status(e):
+    if isinstance(e, http_errors):
+        if hasattr(e, 'http_status'):
+            return e.http_status
+        elif hasattr(e, 'code'):
+            return e.code
+    return 500
+
+
+def bulk_call(fn, ids, max_workers=None):
+    """Calls ``fn`` for each of ``ids`` concurrently.
+
+    At most ``max_workers`` calls (by default the ``CONCURRENT_API_WORKERS``
+    setting) are made at the same time. Every call is made, whether the
+    other ones fail or not.
+
+    :returns: an :class:`~collections.OrderedDict` mapping each id, in the
+        order of ``ids``, to a ``{"status": ..., "error": ...}`` dict. The
+        status is an HTTP status code; the error is ``None`` on success and
+        the message of the exception raised otherwise.
+    """
+    calls = collections.OrderedDict(
+        (id, functools.partial(fn, id)) for id in ids)
+    outcomes = concurrency.run_concurrently(calls, max_workers=max_workers,
+                                            return_exceptions=True)
+    results = collections.OrderedDict()
+    for id, outcome in outcomes.items():
+        if isinstance(outcome, Exception):
+            status = _error_status(outcome)
+            if status == 500:
+                log.error('error invoking apiclient for %s: %s', id, outcome)
+            results[id] = {'status': status, 'error': str(outcome)}
+        else:
+            results[id] = {'status': 204, 'error': None}
+    return results
+
+
 def ajax(authenticated=True, data_required=False,
          json_encoder=json.JSONEncoder):
     '''Provide a decorator to wrap a view method so that it may exist in an
@@ -118,7 +230,7 @@ def ajax(authenticated=True, data_required=False,
                     return data
                 elif data is None:
                     return JSONResponse('', status=204)
-                return JSONResponse(data, json_encoder=json_encoder)
+                return json_response(data, json_encoder=json_encoder)
             except http_errors as e:
                 # exception was raised with a specific HTTP status
                 if hasattr(e, 'http_status'):
@@ -137,6 +249,65 @@ def ajax(authenticated=True, data_required=False,
     return decorator
 
 
+def _etag_matches(request, etag):
+    etags = http_utils.parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+    return etag in etags or '*' in etags
+
+
+def conditional(max_age=0, etag_func=None):
+    '''Provide a decorator adding validators to the responses of a GET
+    view method wrapped by ajax(), which it must be applied on top of:
+
+        @rest_utils.conditional(max_age=300)
+        @rest_utils.ajax()
+        def get(self, request):
+            ...
+
+    Successful responses get a strong ETag and a "Cache-Control: private,
+    max-age" header. A request whose If-None-Match header holds the ETag of
+    the response gets an empty 304 "NOT MODIFIED" instead.
+
+    By default the ETag is a hash of the response body, so the view method
+    is still called. If etag_func is given it is called with the arguments
+    of the view method and should return a cheap version token of the
+    data; the view method is then only called if the token doesn't match.
+
+    Only use a max_age over 0 for data which doesn't depend on the current
+    project or region: the browser won't ask for the data again until then.
+    '''
+    cache_control = 'private, max-age=%d' % max_age
+
+    def decorator(function):
+        @functools.wraps(function,
+                         assigned=decorators.available_attrs(function))
+        def _wrapped(self, request, *args, **kw):
+            if request.method not in ('GET', 'HEAD'):
+                return function(self, request, *args, **kw)
+
+            etag = None
+            if etag_func is not None and request.user.is_authenticated():
+                etag = etag_func(request, *args, **kw)
+                if etag is not None and _etag_matches(request, etag):
+                    response = http.HttpResponseNotModified()
+                    response['ETag'] = http_utils.quote_etag(etag)
+                    response['Cache-Control'] = cache_control
+                    return response
+
+            response = function(self, request, *args, **kw)
+            if response.status_code != 200 or response.streaming:
+                return response
+            if etag is None:
+                etag = hashlib.sha1(response.content).hexdigest()
+            if _etag_matches(request, etag):
+                response = http.HttpResponseNotModified()
+            response['ETag'] = http_utils.quote_etag(etag)
+            response['Cache-Control'] = cache_control
+            return response
+
+        return _wrapped
+    return decorator
+
+
 def parse_filters_kwargs(request, client_keywords={}):
     """Extract REST filter parameters from the request GET args.
 
@@ -29,6 +29,7 @@ from horizon import exceptions
 from horizon.utils.memoized import memoized  # noqa
 
 from openstack_dashboard.api import base
+from openstack_dashboard.api import connection_pool
 
 
 LOG = logging.getLogger(__name__)
@@ -55,6 +56,16 @@ class StorageObject(base.APIDictWrapper):
         return self.name
 
 
+class PooledConnection(swiftclient.client.Connection):
+    """A swift connection which uses the process-wide connection pools."""
+
+    def http_connection(self, url=None):
+        parsed, conn = super(PooledConnection, self).http_connection(url)
+        connection_pool.mount(conn.request_session, conn.url,
+                              cacert=self.cacert, insecure=self.insecure)
+        return parsed, conn
+
+
 class PseudoFolder(base.APIDictWrapper):
     def __init__(self, apidict, container_name):
         super(PseudoFolder, self).__init__(apidict)
@@ -111,14 +122,14 @@ def swift_api(request):
     endpoint = base.url_for(request, 'object-store')
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
-    return swiftclient.client.Connection(None,
-                                         request.user.username,
-                                         None,
-                                         preauthtoken=request.user.token.id,
-                                         preauthurl=endpoint,
-                                         cacert=cacert,
-                                         insecure=insecure,
-                                         auth_version="2.0")
+    return PooledConnection(None,
+                            request.user.username,
+                            None,
+                            preauthtoken=request.user.token.id,
+                            preauthurl=endpoint,
+                            cacert=cacert,
+                            insecure=insecure,
+                            auth_version="2.0")
 
 
 def swift_container_exists(request, container_name):
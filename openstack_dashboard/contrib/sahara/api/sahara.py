@@ -18,6 +18,7 @@ from django.conf import settings
 from horizon import exceptions
 from horizon.utils.memoized import memoized  # noqa
 from openstack_dashboard.api import base
+from openstack_dashboard.api import connection_pool
 
 from saharaclient.api.base import APIException
 from saharaclient import client as api_client
@@ -76,9 +77,9 @@ def client(request):
                              sahara_url=sahara_url,
                              service_type=service_type,
                              project_id=request.user.project_id,
-                             input_auth_token=request.user.token.id,
-                             insecure=insecure,
-                             cacert=cacert)
+                             **connection_pool.get_client_session(
+                                 sahara_url, request.user.token.id,
+                                 cacert=cacert, insecure=insecure))
 
 
 def image_list(request, search_opts=None):
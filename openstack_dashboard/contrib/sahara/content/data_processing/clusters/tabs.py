@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
 
 from django.utils.translation import ugettext_lazy as _
@@ -18,9 +19,7 @@ from django.utils.translation import ugettext_lazy as _
 from horizon import exceptions
 from horizon import tables
 from horizon import tabs
-
-from openstack_dashboard.contrib.sahara.content. \
-    data_processing.utils import workflow_helpers as helpers
+from horizon.utils import concurrency
 
 from openstack_dashboard.api import glance
 from openstack_dashboard.api import network
@@ -91,22 +90,7 @@ class NodeGroupsTab(tabs.Tab):
         try:
             sahara = saharaclient.client(request)
             cluster = sahara.clusters.get(cluster_id)
-            for ng in cluster.node_groups:
-                if ng["flavor_id"]:
-                    ng["flavor_name"] = (
-                        nova.flavor_get(request, ng["flavor_id"]).name)
-                if ng["floating_ip_pool"]:
-                    ng["floating_ip_pool_name"] = (
-                        self._get_floating_ip_pool_name(
-                            request, ng["floating_ip_pool"]))
-
-                if ng.get("node_group_template_id", None):
-                    ng["node_group_template"] = saharaclient.safe_call(
-                        sahara.node_group_templates.get,
-                        ng["node_group_template_id"])
-
-                ng["security_groups_full"] = helpers.get_security_groups(
-                    request, ng["security_groups"])
+            enrich_node_groups(request, sahara, cluster.node_groups)
         except Exception:
             cluster = {}
             exceptions.handle(request,
@@ -114,11 +98,78 @@ class NodeGroupsTab(tabs.Tab):
 
         return {"cluster": cluster}
 
-    def _get_floating_ip_pool_name(self, request, pool_id):
-        pools = [pool for pool in network.floating_ip_pools_list(
-            request) if pool.id == pool_id]
 
-        return pools[0].name if pools else pool_id
+def _node_group_references(node_groups):
+    """Returns the IDs of each kind of resource ``node_groups`` refer to."""
+    references = {'flavors': set(), 'pools': set(), 'templates': set(),
+                  'security_groups': set()}
+    for ng in node_groups:
+        if ng["flavor_id"]:
+            references['flavors'].add(ng["flavor_id"])
+        if ng["floating_ip_pool"]:
+            references['pools'].add(ng["floating_ip_pool"])
+        if ng.get("node_group_template_id", None):
+            references['templates'].add(ng["node_group_template_id"])
+        references['security_groups'].update(ng["security_groups"] or [])
+    return references
+
+
+def _attach_node_group_details(ng, flavors, pools, templates,
+                               security_groups):
+    """Sets the details of the resources a node group refers to on it.
+
+    A flavor or floating IP pool which can't be found is shown by ID, and a
+    security group by name.
+    """
+    if ng["flavor_id"]:
+        flavor = flavors.get(ng["flavor_id"])
+        ng["flavor_name"] = flavor.name if flavor else ng["flavor_id"]
+    if ng["floating_ip_pool"]:
+        pool = pools.get(ng["floating_ip_pool"])
+        ng["floating_ip_pool_name"] = (pool.name if pool
+                                       else ng["floating_ip_pool"])
+    if ng.get("node_group_template_id", None):
+        ng["node_group_template"] = templates.get(
+            ng["node_group_template_id"])
+    ng["security_groups_full"] = []
+    for group in ng["security_groups"] or []:
+        if group not in security_groups:
+            LOG.info(_('Unable to retrieve security group %(group)s.') %
+                     {'group': group})
+        ng["security_groups_full"].append(
+            security_groups.get(group, {'name': group}))
+
+
+def enrich_node_groups(request, sahara, node_groups):
+    """Attaches flavor, floating IP pool, template and security group
+    details to ``node_groups``.
+
+    The IDs referenced by all the node groups are gathered first, so that
+    each kind of resource is retrieved with a single call: the flavors by
+    ID, and the floating IP pools, node group templates and security groups
+    with one listing each. The four calls are made at the same time.
+    """
+    references = _node_group_references(node_groups)
+    list_methods = {
+        'flavors': lambda: nova.flavor_list_by_ids(
+            request, tuple(sorted(references['flavors']))),
+        'pools': lambda: network.floating_ip_pools_list(request),
+        'templates': sahara.node_group_templates.list,
+        'security_groups': lambda: network.security_group_list(request),
+    }
+
+    def get_by_id(kind):
+        if not references[kind]:
+            return {}
+        return dict((resource.id, resource)
+                    for resource in list_methods[kind]())
+
+    results = concurrency.run_concurrently(
+        (kind, functools.partial(get_by_id, kind))
+        for kind in ('flavors', 'pools', 'templates', 'security_groups'))
+    for ng in node_groups:
+        _attach_node_group_details(ng, **results)
+    return node_groups
 
 
 class Instance(object):
@@ -15,9 +15,13 @@ import json
 from django.core.urlresolvers import reverse
 from django import http
 
+import mock
 from mox3.mox import IsA  # noqa
 
+from openstack_dashboard import api as dash_api
 from openstack_dashboard.contrib.sahara import api
+from openstack_dashboard.contrib.sahara.content.data_processing.clusters \
+    import tabs
 from openstack_dashboard.test import helpers as test
 
 
@@ -91,3 +95,51 @@ class DataProcessingClusterTests(test.TestCase):
         self.assertNoFormErrors(res)
         self.assertRedirectsNoFollow(res, INDEX_URL)
         self.assertMessageCount(success=1)
+
+    @test.create_stubs({dash_api.nova: ('flavor_list_by_ids',),
+                        dash_api.network: ('floating_ip_pools_list',
+                                           'security_group_list')})
+    def test_enrich_node_groups(self):
+        flavor = self.flavors.first()
+        ngt = self.nodegroup_templates.first()
+        security_group = self.security_groups.first()
+        pool = mock.Mock(id='pool-1')
+        pool.name = 'public'
+        node_groups = [{'flavor_id': flavor.id,
+                        'floating_ip_pool': 'pool-1',
+                        'node_group_template_id': ngt.id,
+                        'security_groups': [security_group.id, 'gone']},
+                       {'flavor_id': flavor.id,
+                        'floating_ip_pool': 'pool-1',
+                        'node_group_template_id': ngt.id,
+                        'security_groups': [security_group.id]},
+                       {'flavor_id': 'gone',
+                        'floating_ip_pool': 'pool-2',
+                        'security_groups': None}]
+        sahara = mock.Mock()
+        sahara.node_group_templates.list.return_value = [ngt]
+
+        dash_api.nova.flavor_list_by_ids(
+            IsA(http.HttpRequest),
+            tuple(sorted([flavor.id, 'gone']))).AndReturn([flavor])
+        dash_api.network.floating_ip_pools_list(IsA(http.HttpRequest)) \
+            .AndReturn([pool])
+        dash_api.network.security_group_list(IsA(http.HttpRequest)) \
+            .AndReturn([security_group])
+        self.mox.ReplayAll()
+
+        tabs.enrich_node_groups(self.request, sahara, node_groups)
+
+        sahara.node_group_templates.list.assert_called_once_with()
+        self.assertEqual([flavor.name, flavor.name, 'gone'],
+                         [ng['flavor_name'] for ng in node_groups])
+        self.assertEqual(['public', 'public', 'pool-2'],
+                         [ng['floating_ip_pool_name'] for ng in node_groups])
+        self.assertEqual(ngt, node_groups[0]['node_group_template'])
+        self.assertEqual(ngt, node_groups[1]['node_group_template'])
+        self.assertNotIn('node_group_template', node_groups[2])
+        self.assertEqual([security_group, {'name': 'gone'}],
+                         node_groups[0]['security_groups_full'])
+        self.assertEqual([security_group],
+                         node_groups[1]['security_groups_full'])
+        self.assertEqual([], node_groups[2]['security_groups_full'])
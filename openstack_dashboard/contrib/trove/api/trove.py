@@ -18,6 +18,7 @@ from django.conf import settings
 from troveclient.v1 import client
 
 from openstack_dashboard.api import base
+from openstack_dashboard.api import connection_pool
 
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
@@ -30,16 +31,11 @@ def troveclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
     trove_url = base.url_for(request, 'database')
-    c = client.Client(request.user.username,
-                      request.user.token.id,
-                      project_id=request.user.project_id,
-                      auth_url=trove_url,
-                      insecure=insecure,
-                      cacert=cacert,
-                      http_log_debug=settings.DEBUG)
-    c.client.auth_token = request.user.token.id
-    c.client.management_url = trove_url
-    return c
+    return client.Client(project_id=request.user.project_id,
+                         http_log_debug=settings.DEBUG,
+                         **connection_pool.get_client_session(
+                             trove_url, request.user.token.id,
+                             cacert=cacert, insecure=insecure))
 
 
 def instance_list(request, marker=None):
@@ -12,7 +12,6 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from collections import OrderedDict
 import uuid
 
 from django.core.urlresolvers import reverse
@@ -29,9 +28,10 @@ INDEX_URL = reverse('horizon:admin:instances:index')
 
 
 class InstanceViewTest(test.BaseAdminViewTests):
-    @test.create_stubs({api.nova: ('flavor_list', 'server_list',
+    @test.create_stubs({api.nova: ('flavor_list_by_ids', 'server_list',
                                    'extension_supported',),
                         api.keystone: ('tenant_list',),
+                        api.glance: ('image_list_by_ids',),
                         api.network: ('servers_update_addresses',)})
     def test_index(self):
         servers = self.servers.list()
@@ -49,7 +49,10 @@ class InstanceViewTest(test.BaseAdminViewTests):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
-        api.nova.flavor_list(IsA(http.HttpRequest)).AndReturn(flavors)
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest),
+                                    IsA(tuple)).AndReturn(flavors)
+        api.glance.image_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
+            .AndReturn(self.images.list())
         self.mox.ReplayAll()
 
         res = self.client.get(INDEX_URL)
@@ -57,15 +60,14 @@ class InstanceViewTest(test.BaseAdminViewTests):
         instances = res.context['table'].data
         self.assertItemsEqual(instances, servers)
 
-    @test.create_stubs({api.nova: ('flavor_list', 'flavor_get',
-                                   'server_list', 'extension_supported',),
+    @test.create_stubs({api.nova: ('flavor_list_by_ids', 'server_list',
+                                   'extension_supported',),
                         api.keystone: ('tenant_list',),
+                        api.glance: ('image_list_by_ids',),
                         api.network: ('servers_update_addresses',)})
     def test_index_flavor_list_exception(self):
         servers = self.servers.list()
         tenants = self.tenants.list()
-        flavors = self.flavors.list()
-        full_flavors = OrderedDict([(f.id, f) for f in flavors])
 
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
@@ -77,26 +79,27 @@ class InstanceViewTest(test.BaseAdminViewTests):
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)). \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest),
+                                    IsA(tuple)). \
             AndRaise(self.exceptions.nova)
         api.keystone.tenant_list(IsA(http.HttpRequest)).\
             AndReturn([tenants, False])
-        for server in servers:
-            api.nova.flavor_get(IsA(http.HttpRequest), server.flavor["id"]). \
-                AndReturn(full_flavors[server.flavor["id"]])
-
+        api.glance.image_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
+            .AndReturn(self.images.list())
         self.mox.ReplayAll()
 
         res = self.client.get(INDEX_URL)
         self.assertTemplateUsed(res, 'admin/instances/index.html')
         instances = res.context['table'].data
         self.assertItemsEqual(instances, servers)
+        self.assertMessageCount(res, error=1)
 
-    @test.create_stubs({api.nova: ('flavor_list', 'flavor_get',
-                                   'server_list', 'extension_supported', ),
+    @test.create_stubs({api.nova: ('flavor_list_by_ids', 'server_list',
+                                   'extension_supported', ),
                         api.keystone: ('tenant_list',),
+                        api.glance: ('image_list_by_ids',),
                         api.network: ('servers_update_addresses',)})
-    def test_index_flavor_get_exception(self):
+    def test_index_flavor_not_found(self):
         servers = self.servers.list()
         flavors = self.flavors.list()
         tenants = self.tenants.list()
@@ -115,23 +118,24 @@ class InstanceViewTest(test.BaseAdminViewTests):
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)). \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest),
+                                    IsA(tuple)). \
             AndReturn(flavors)
         api.keystone.tenant_list(IsA(http.HttpRequest)).\
             AndReturn([tenants, False])
-        for server in servers:
-            api.nova.flavor_get(IsA(http.HttpRequest), server.flavor["id"]). \
-                AndRaise(self.exceptions.nova)
+        api.glance.image_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
+            .AndReturn(self.images.list())
         self.mox.ReplayAll()
 
         res = self.client.get(INDEX_URL)
         instances = res.context['table'].data
         self.assertTemplateUsed(res, 'admin/instances/index.html')
+        self.assertItemsEqual(instances, servers)
+        for instance in instances:
+            self.assertFalse(hasattr(instance, 'full_flavor'))
         # Since error messages produced for each instance are identical,
-        # there will be only one error message for all instances
-        # (messages de-duplication).
+        # there will be only one error message for all instances.
         self.assertMessageCount(res, error=1)
-        self.assertItemsEqual(instances, servers)
 
     @test.create_stubs({api.nova: ('server_list',)})
     def test_index_server_list_exception(self):
@@ -183,9 +187,10 @@ class InstanceViewTest(test.BaseAdminViewTests):
         self.assertContains(res, "Active", 1, 200)
         self.assertContains(res, "Running", 1, 200)
 
-    @test.create_stubs({api.nova: ('flavor_list', 'server_list',
+    @test.create_stubs({api.nova: ('flavor_list_by_ids', 'server_list',
                                    'extension_supported', ),
                         api.keystone: ('tenant_list',),
+                        api.glance: ('image_list_by_ids',),
                         api.network: ('servers_update_addresses',)})
     def test_index_options_before_migrate(self):
         servers = self.servers.list()
@@ -201,8 +206,11 @@ class InstanceViewTest(test.BaseAdminViewTests):
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)).\
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest),
+                                    IsA(tuple)).\
             AndReturn(self.flavors.list())
+        api.glance.image_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
+            .AndReturn(self.images.list())
         self.mox.ReplayAll()
 
         res = self.client.get(INDEX_URL)
@@ -210,9 +218,10 @@ class InstanceViewTest(test.BaseAdminViewTests):
         self.assertNotContains(res, "instances__confirm")
         self.assertNotContains(res, "instances__revert")
 
-    @test.create_stubs({api.nova: ('flavor_list', 'server_list',
+    @test.create_stubs({api.nova: ('flavor_list_by_ids', 'server_list',
                                    'extension_supported', ),
                         api.keystone: ('tenant_list',),
+                        api.glance: ('image_list_by_ids',),
                         api.network: ('servers_update_addresses',)})
     def test_index_options_after_migrate(self):
         servers = self.servers.list()
@@ -232,8 +241,11 @@ class InstanceViewTest(test.BaseAdminViewTests):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
-        api.nova.flavor_list(IsA(http.HttpRequest)).\
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest),
+                                    IsA(tuple)).\
             AndReturn(self.flavors.list())
+        api.glance.image_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
+            .AndReturn(self.images.list())
         self.mox.ReplayAll()
 
         res = self.client.get(INDEX_URL)
@@ -26,6 +26,7 @@ from horizon import workflows
 from openstack_dashboard import api
 
 from openstack_dashboard.dashboards.identity.domains import constants
+from openstack_dashboard.dashboards.identity.projects import membership
 
 LOG = logging.getLogger(__name__)
 
@@ -80,14 +81,26 @@ class UpdateDomainUsersAction(workflows.MembershipAction):
         self.fields[default_role_name] = forms.CharField(required=False)
         self.fields[default_role_name].initial = default_role.id
 
+        # Figure out users & roles
+        users_roles = {}
+        if domain_id:
+            try:
+                users_roles = api.keystone.get_domain_users_roles(request,
+                                                                  domain_id)
+            except Exception:
+                exceptions.handle(request,
+                                  _('Unable to retrieve user domain role '
+                                    'assignments.'),
+                                  redirect=reverse(
+                                      constants.DOMAINS_INDEX_URL))
+
         # Get list of available users
-        all_users = []
+        users_list = []
         try:
-            all_users = api.keystone.user_list(request,
-                                               domain=domain_id)
+            users_list = membership.get_user_choices(self, domain_id,
+                                                     users_roles)
         except Exception:
             exceptions.handle(request, _('Unable to retrieve user list.'))
-        users_list = [(user.id, user.name) for user in all_users]
 
         # Get list of roles
         role_list = []
@@ -105,18 +118,7 @@ class UpdateDomainUsersAction(workflows.MembershipAction):
             self.fields[field_name].choices = users_list
             self.fields[field_name].initial = []
 
-        # Figure out users & roles
         if domain_id:
-            try:
-                users_roles = api.keystone.get_domain_users_roles(request,
-                                                                  domain_id)
-            except Exception:
-                exceptions.handle(request,
-                                  _('Unable to retrieve user domain role '
-                                    'assignments.'),
-                                  redirect=reverse(
-                                      constants.DOMAINS_INDEX_URL))
-
             for user_id in users_roles:
                 roles_ids = users_roles[user_id]
                 for role_id in roles_ids:
@@ -135,6 +137,11 @@ class UpdateDomainUsers(workflows.UpdateMembersStep):
     no_available_text = _("No users found.")
     no_members_text = _("No users.")
 
+    @property
+    def search_url(self):
+        return membership.get_user_search_url(
+            self.workflow.context.get('domain_id'))
+
     def contribute(self, data, context):
         context = super(UpdateDomainUsers, self).contribute(data, context)
         if data:
@@ -48,8 +48,9 @@ class GroupsViewTests(test.BaseAdminViewTests):
         domain_id = self._get_domain_id()
         groups = self._get_groups(domain_id)
 
-        api.keystone.group_list(IgnoreArg(), domain=domain_id) \
-            .AndReturn(groups)
+        api.keystone.group_list(IgnoreArg(), domain=domain_id, filters={},
+                                paginate=True, marker=None) \
+            .AndReturn([groups, False])
 
         self.mox.ReplayAll()
 
@@ -77,8 +78,9 @@ class GroupsViewTests(test.BaseAdminViewTests):
         domain_id = self._get_domain_id()
         groups = self._get_groups(domain_id)
 
-        api.keystone.group_list(IgnoreArg(), domain=domain_id) \
-            .AndReturn(groups)
+        api.keystone.group_list(IgnoreArg(), domain=domain_id, filters={},
+                                paginate=True, marker=None) \
+            .AndReturn([groups, False])
         api.keystone.keystone_can_edit_group() \
             .MultipleTimes().AndReturn(False)
 
@@ -148,8 +150,9 @@ class GroupsViewTests(test.BaseAdminViewTests):
         domain_id = self._get_domain_id()
         group = self.groups.get(id="2")
 
-        api.keystone.group_list(IgnoreArg(), domain=domain_id) \
-            .AndReturn(self.groups.list())
+        api.keystone.group_list(IgnoreArg(), domain=domain_id, filters={},
+                                paginate=True, marker=None) \
+            .AndReturn([self.groups.list(), False])
         api.keystone.group_delete(IgnoreArg(), group.id)
 
         self.mox.ReplayAll()
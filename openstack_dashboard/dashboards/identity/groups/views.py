@@ -25,6 +25,7 @@ from horizon.utils import memoized
 from openstack_dashboard import api
 from openstack_dashboard import policy
 
+from openstack_dashboard.dashboards.identity import utils as identity_utils
 from openstack_dashboard.dashboards.identity.groups import constants
 from openstack_dashboard.dashboards.identity.groups \
     import forms as project_forms
@@ -32,19 +33,36 @@ from openstack_dashboard.dashboards.identity.groups \
     import tables as project_tables
 
 
-class IndexView(tables.DataTableView):
+class IndexView(identity_utils.FilterMixin, tables.DataTableView):
+    """Lists the groups a page at a time.
+
+    Keystone v3 has no marker based pagination, so with it every page is
+    cut from a full listing of the matching groups (see
+    :func:`openstack_dashboard.api.keystone._paginate`): each page costs as
+    much as listing all of them, unless a filter narrows the listing down.
+    """
     table_class = project_tables.GroupsTable
     template_name = constants.GROUPS_INDEX_VIEW_TEMPLATE
     page_title = _("Groups")
 
+    def has_more_data(self, table):
+        return self._more
+
     def get_data(self):
         groups = []
+        marker = self.request.GET.get(
+            project_tables.GroupsTable._meta.pagination_param, None)
         domain_context = self.request.session.get('domain_context', None)
+        self._more = False
         if policy.check((("identity", "identity:list_groups"),),
                         self.request):
             try:
-                groups = api.keystone.group_list(self.request,
-                                                 domain=domain_context)
+                groups, self._more = api.keystone.group_list(
+                    self.request,
+                    domain=domain_context,
+                    filters=self.get_filters(),
+                    paginate=True,
+                    marker=marker)
             except Exception:
                 exceptions.handle(self.request,
                                   _('Unable to retrieve group list.'))
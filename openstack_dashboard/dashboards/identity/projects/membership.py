@@ -0,0 +1,269 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Diff-based role assignment changes for project membership.
+
+The project workflows describe the desired membership of a project as a set
+of (user or group, role) assignments. :class:`ProjectMembership` reads the
+current assignments once, computes the grants and revokes needed to get from
+one to the other and then issues them on a bounded pool of worker threads.
+"""
+
+import collections
+import functools
+import logging
+import sys
+import time
+
+from django.conf import settings
+from django.core.urlresolvers import reverse
+from django.utils import http
+from keystoneclient import exceptions as keystone_exceptions
+import six
+
+from horizon.utils import concurrency
+from horizon.utils import functions
+
+from openstack_dashboard import api
+
+
+LOG = logging.getLogger(__name__)
+
+USER = 'user'
+GROUP = 'group'
+
+GRANT = 'grant'
+REVOKE = 'revoke'
+
+# Errors which are worth retrying: Keystone (or something in front of it)
+# was temporarily unable to serve the request.
+TRANSIENT_ERRORS = (
+    keystone_exceptions.ConnectionRefused,
+    keystone_exceptions.RequestTimeout,
+    keystone_exceptions.BadGateway,
+    keystone_exceptions.ServiceUnavailable,
+    keystone_exceptions.GatewayTimeout,
+)
+
+DEFAULT_RETRIES = 2
+RETRY_DELAY = 0.5
+
+
+Assignment = collections.namedtuple('Assignment',
+                                    ['actor_type', 'actor_id', 'role_id'])
+
+
+class Operation(object):
+    """A single grant or revoke and its outcome."""
+
+    def __init__(self, action, assignment):
+        self.action = action
+        self.assignment = assignment
+        self.attempts = 0
+        self.exc_info = None
+
+    @property
+    def succeeded(self):
+        return self.attempts > 0 and self.exc_info is None
+
+    @property
+    def error(self):
+        if self.exc_info is not None:
+            return self.exc_info[1]
+        return None
+
+    def __repr__(self):
+        return '<Operation: %s %s %s role %s>' % (
+            self.action, self.assignment.actor_type,
+            self.assignment.actor_id, self.assignment.role_id)
+
+
+class MembershipResult(object):
+    """A summary of the operations issued by :meth:`ProjectMembership.apply`.
+
+    ``skipped`` holds the revokes which were computed but deliberately not
+    issued, e.g. because they would remove the current user's admin role.
+    """
+
+    def __init__(self, operations, skipped=()):
+        self.operations = list(operations)
+        self.skipped = list(skipped)
+
+    @property
+    def succeeded(self):
+        return [op for op in self.operations if op.succeeded]
+
+    @property
+    def failed(self):
+        return [op for op in self.operations if op.exc_info is not None]
+
+    def failed_actors(self, actor_type):
+        return set(op.assignment.actor_id for op in self.failed
+                   if op.assignment.actor_type == actor_type)
+
+    def raise_for_failure(self):
+        """Re-raises the error of the first failed operation, if any."""
+        for op in self.failed:
+            six.reraise(*op.exc_info)
+
+    def __len__(self):
+        return len(self.operations)
+
+
+class ProjectMembership(object):
+    """Computes and applies role assignment changes on a single project.
+
+    :param include_groups: whether group assignments are managed too. When
+        ``False`` existing group assignments are left untouched.
+    :param max_workers: the size of the worker pool; defaults to the
+        ``CONCURRENT_API_WORKERS`` setting.
+    :param retries: how many times an operation failing with one of
+        ``TRANSIENT_ERRORS`` is retried.
+    """
+
+    def __init__(self, request, project_id, include_groups=False,
+                 max_workers=None, retries=DEFAULT_RETRIES):
+        self.request = request
+        self.project_id = project_id
+        self.include_groups = include_groups
+        self.max_workers = max_workers
+        self.retries = retries
+
+    def get_current(self):
+        """Returns the set of :class:`Assignment` currently on the project.
+
+        With Keystone v3 this is a single ``role_assignments_list`` call.
+        """
+        if api.keystone.VERSIONS.active < 3:
+            users_roles = api.keystone.get_project_users_roles(
+                self.request, project=self.project_id)
+            return set(Assignment(USER, user_id, role_id)
+                       for user_id, role_ids in users_roles.items()
+                       for role_id in role_ids)
+
+        current = set()
+        role_assignments = api.keystone.role_assignments_list(
+            self.request, project=self.project_id)
+        for role_assignment in role_assignments:
+            if hasattr(role_assignment, 'user'):
+                current.add(Assignment(USER, role_assignment.user['id'],
+                                       role_assignment.role['id']))
+            elif self.include_groups and hasattr(role_assignment, 'group'):
+                current.add(Assignment(GROUP, role_assignment.group['id'],
+                                       role_assignment.role['id']))
+        return current
+
+    @staticmethod
+    def diff(desired, current):
+        """Returns the ``(grants, revokes)`` needed to reach ``desired``.
+
+        Both are sorted lists of :class:`Assignment` so that the calls are
+        always issued in the same order.
+        """
+        desired = set(desired)
+        current = set(current)
+        return sorted(desired - current), sorted(current - desired)
+
+    def apply(self, grants, revokes, skipped=()):
+        """Issues the grants and revokes concurrently.
+
+        Every operation is attempted regardless of the others failing.
+
+        :returns: a :class:`MembershipResult`.
+        """
+        operations = ([Operation(GRANT, a) for a in grants] +
+                      [Operation(REVOKE, a) for a in revokes])
+        calls = [(op, functools.partial(self._run, op))
+                 for op in operations]
+        if calls:
+            concurrency.run_concurrently(calls, max_workers=self.max_workers,
+                                         return_exceptions=True)
+        return MembershipResult(operations, skipped)
+
+    def _run(self, op):
+        while True:
+            op.attempts += 1
+            try:
+                self._call(op.action, op.assignment)
+            except TRANSIENT_ERRORS:
+                if op.attempts <= self.retries:
+                    LOG.debug("Retrying %r after a transient error.", op)
+                    time.sleep(RETRY_DELAY * op.attempts)
+                    continue
+                op.exc_info = sys.exc_info()
+            except Exception:
+                op.exc_info = sys.exc_info()
+            return
+
+    def _call(self, action, assignment):
+        if assignment.actor_type == USER:
+            if action == GRANT:
+                fn = api.keystone.add_tenant_user_role
+            else:
+                fn = api.keystone.remove_tenant_user_role
+            return fn(self.request, project=self.project_id,
+                      user=assignment.actor_id, role=assignment.role_id)
+        if action == GRANT:
+            fn = api.keystone.add_group_role
+        else:
+            fn = api.keystone.remove_group_role
+        return fn(self.request, role=assignment.role_id,
+                  group=assignment.actor_id, project=self.project_id)
+
+
+def user_search_enabled():
+    return getattr(settings, 'OPENSTACK_KEYSTONE_MEMBERSHIP_SEARCH', False)
+
+
+def get_user_search_url(domain_id=None):
+    """Returns the URL the user membership steps search users at, if any."""
+    if not user_search_enabled():
+        return None
+    url = reverse('horizon:identity:users:search')
+    if domain_id:
+        url += '?' + http.urlencode({'domain_id': domain_id})
+    return url
+
+
+def _get_user(request, user_id):
+    try:
+        return api.keystone.user_get(request, user_id)
+    except keystone_exceptions.NotFound:
+        return None
+
+
+def get_user_choices(action, domain_id, member_ids=()):
+    """Returns the ``(id, name)`` user choices of a membership action.
+
+    Every user of the domain is listed, unless user search is enabled by
+    ``OPENSTACK_KEYSTONE_MEMBERSHIP_SEARCH``. Only the current members and
+    the users submitted to ``action`` are listed then, the other ones being
+    searched for as needed by the step. Keystone can't list users by id, so
+    up to a page worth of them are fetched one by one, and more with one
+    listing of the domain.
+    """
+    if not user_search_enabled():
+        users = api.keystone.user_list(action.request, domain=domain_id)
+        return [(user.id, user.name) for user in users]
+
+    user_ids = set(member_ids)
+    prefix = action.get_member_field_name('')
+    for field in action.data:
+        if field.startswith(prefix):
+            user_ids.update(action.data.getlist(field))
+    if len(user_ids) > functions.get_page_size(action.request):
+        users = api.keystone.user_list(action.request, domain=domain_id)
+        return [(user.id, user.name) for user in users
+                if user.id in user_ids]
+    users = concurrency.concurrent_map(
+        functools.partial(_get_user, action.request), sorted(user_ids))
+    return [(user.id, user.name) for user in users if user is not None]
@@ -20,10 +20,13 @@ import os
 import django
 from django.core.urlresolvers import reverse
 from django import http
+from django.http import QueryDict
 from django.test.utils import override_settings
 from django.utils import timezone
 from django.utils import unittest
 
+from keystoneclient import exceptions as keystone_exceptions
+import mock
 from mox3.mox import IgnoreArg  # noqa
 from mox3.mox import IsA  # noqa
 
@@ -31,6 +34,7 @@ from horizon import exceptions
 from horizon.workflows import views
 
 from openstack_dashboard import api
+from openstack_dashboard.dashboards.identity.projects import membership
 from openstack_dashboard.dashboards.identity.projects import workflows
 from openstack_dashboard import policy_backend
 from openstack_dashboard.test import helpers as test
@@ -57,7 +61,8 @@ class TenantsViewTests(test.BaseAdminViewTests):
         api.keystone.tenant_list(IsA(http.HttpRequest),
                                  domain=None,
                                  paginate=True,
-                                 marker=None) \
+                                 marker=None,
+                                 filters={}) \
             .AndReturn([self.tenants.list(), False])
         self.mox.ReplayAll()
 
@@ -75,7 +80,8 @@ class TenantsViewTests(test.BaseAdminViewTests):
         api.keystone.tenant_list(IsA(http.HttpRequest),
                                  domain=domain.id,
                                  paginate=True,
-                                 marker=None) \
+                                 marker=None,
+                                 filters={}) \
                     .AndReturn([domain_tenants, False])
         self.mox.ReplayAll()
 
@@ -93,6 +99,7 @@ class ProjectsViewNonAdminTests(test.TestCase):
                                  user=self.user.id,
                                  paginate=True,
                                  marker=None,
+                                 filters={},
                                  admin=False) \
             .AndReturn([self.tenants.list(), False])
         self.mox.ReplayAll()
@@ -780,42 +787,29 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             api.keystone.role_assignments_list(IsA(http.HttpRequest),
                                                project=self.tenant.id) \
                .AndReturn(role_assignments)
+            # Groups 2 and 3 have no roles yet; group 1 keeps role 2
+            for group_id in ('2', '3'):
+                for role_id in ('1', '2'):
+                    api.keystone.add_group_role(IsA(http.HttpRequest),
+                                                role=role_id,
+                                                group=group_id,
+                                                project=self.tenant.id)
             # Give user 1 role 2
             api.keystone.add_tenant_user_role(IsA(http.HttpRequest),
                                               project=self.tenant.id,
                                               user='1',
                                               role='2',)
-            # remove role 2 from user 2
-            api.keystone.remove_tenant_user_role(IsA(http.HttpRequest),
-                                                 project=self.tenant.id,
-                                                 user='2',
-                                                 role='2')
-
             # Give user 3 role 1
             api.keystone.add_tenant_user_role(IsA(http.HttpRequest),
                                               project=self.tenant.id,
                                               user='3',
                                               role='1',)
-            api.keystone.group_list(IsA(http.HttpRequest),
-                                    domain=self.domain.id,
-                                    project=self.tenant.id) \
-                .AndReturn(groups)
-            api.keystone.roles_for_group(IsA(http.HttpRequest),
-                                         group='1',
-                                         project=self.tenant.id) \
-                .AndReturn(roles)
-            api.keystone.remove_group_role(IsA(http.HttpRequest),
-                                           project=self.tenant.id,
-                                           group='1',
-                                           role='1')
-            api.keystone.roles_for_group(IsA(http.HttpRequest),
-                                         group='2',
-                                         project=self.tenant.id) \
-                .AndReturn(roles)
-            api.keystone.roles_for_group(IsA(http.HttpRequest),
-                                         group='3',
-                                         project=self.tenant.id) \
-                .AndReturn(roles)
+            # remove role 2 from user 2, removing role 1 (admin) from
+            # user 1 is skipped
+            api.keystone.remove_tenant_user_role(IsA(http.HttpRequest),
+                                                 project=self.tenant.id,
+                                                 user='2',
+                                                 role='2')
         else:
             api.keystone.user_list(IsA(http.HttpRequest),
                                    project=self.tenant.id) \
@@ -1505,6 +1499,97 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
                 logging.disable(logging.NOTSET)
 
 
+class ProjectMembershipTests(test.BaseAdminViewTests):
+    def test_diff(self):
+        user_1 = membership.Assignment(membership.USER, '1', '1')
+        user_2 = membership.Assignment(membership.USER, '2', '1')
+        group_1 = membership.Assignment(membership.GROUP, '1', '2')
+
+        grants, revokes = membership.ProjectMembership.diff(
+            [user_1, group_1], [user_1, user_2])
+
+        self.assertEqual([group_1], grants)
+        self.assertEqual([user_2], revokes)
+
+    @test.create_stubs({api.keystone: ('add_tenant_user_role',
+                                       'remove_group_role')})
+    @mock.patch.object(membership, 'RETRY_DELAY', 0)
+    def test_apply_retries_transient_errors(self):
+        grant = membership.Assignment(membership.USER, '1', '2')
+        revoke = membership.Assignment(membership.GROUP, '1', '2')
+        api.keystone.add_tenant_user_role(IsA(http.HttpRequest),
+                                          project=self.tenant.id,
+                                          user='1',
+                                          role='2') \
+            .AndRaise(keystone_exceptions.ServiceUnavailable())
+        api.keystone.add_tenant_user_role(IsA(http.HttpRequest),
+                                          project=self.tenant.id,
+                                          user='1',
+                                          role='2')
+        api.keystone.remove_group_role(IsA(http.HttpRequest),
+                                       role='2',
+                                       group='1',
+                                       project=self.tenant.id) \
+            .AndRaise(self.exceptions.keystone)
+        self.mox.ReplayAll()
+
+        engine = membership.ProjectMembership(self.request, self.tenant.id,
+                                              include_groups=True)
+        result = engine.apply([grant], [revoke])
+
+        self.assertEqual(2, len(result))
+        [succeeded] = result.succeeded
+        self.assertEqual(grant, succeeded.assignment)
+        self.assertEqual(2, succeeded.attempts)
+        [failed] = result.failed
+        self.assertEqual(revoke, failed.assignment)
+        self.assertEqual(1, failed.attempts)
+        self.assertEqual(set(['1']), result.failed_actors(membership.GROUP))
+        self.assertRaises(type(self.exceptions.keystone),
+                          result.raise_for_failure)
+
+    @test.create_stubs({api.keystone: ('user_get',)})
+    @test.update_settings(OPENSTACK_KEYSTONE_MEMBERSHIP_SEARCH=True)
+    def test_get_user_choices_with_search(self):
+        user_1 = self.users.get(id='1')
+        user_3 = self.users.get(id='3')
+        action = mock.Mock(
+            request=self.request,
+            data=QueryDict('update_members_role_2=3&update_members_role_2=4'),
+            get_member_field_name=lambda role_id: (
+                'update_members_role_' + role_id))
+        api.keystone.user_get(IsA(http.HttpRequest), '1').AndReturn(user_1)
+        api.keystone.user_get(IsA(http.HttpRequest), '3').AndReturn(user_3)
+        api.keystone.user_get(IsA(http.HttpRequest), '4') \
+            .AndRaise(keystone_exceptions.NotFound())
+        self.mox.ReplayAll()
+
+        # Only the current and submitted members are listed.
+        choices = membership.get_user_choices(action, None, {'1': ['2']})
+        self.assertEqual([(user_1.id, user_1.name), (user_3.id, user_3.name)],
+                         choices)
+
+    @test.create_stubs({api.keystone: ('user_list',)})
+    @test.update_settings(OPENSTACK_KEYSTONE_MEMBERSHIP_SEARCH=True,
+                          API_RESULT_PAGE_SIZE=2)
+    def test_get_user_choices_with_search_many_members(self):
+        users = self.users.list()
+        action = mock.Mock(
+            request=self.request,
+            data=QueryDict('update_members_role_2=3&update_members_role_2=4'),
+            get_member_field_name=lambda role_id: (
+                'update_members_role_' + role_id))
+        api.keystone.user_list(IsA(http.HttpRequest), domain='1') \
+            .AndReturn(users)
+        self.mox.ReplayAll()
+
+        # More members than a page are found with one listing.
+        choices = membership.get_user_choices(action, '1', {'1': ['2']})
+        self.assertEqual([(user.id, user.name) for user in users
+                          if user.id in ('1', '3', '4')],
+                         choices)
+
+
 class UsageViewTests(test.BaseAdminViewTests):
     def _stub_nova_api_calls(self, nova_stu_enabled=True):
         self.mox.StubOutWithMock(api.nova, 'usage_get')
@@ -1612,7 +1697,8 @@ class SeleniumTests(test.SeleniumAdminTestCase):
         api.keystone.tenant_list(IgnoreArg(),
                                  domain=None,
                                  marker=None,
-                                 paginate=True) \
+                                 paginate=True,
+                                 filters={}) \
             .AndReturn([self.tenants.list(), False])
         # Edit mod
         api.keystone.tenant_get(IgnoreArg(),
@@ -1693,7 +1779,8 @@ class SeleniumTests(test.SeleniumAdminTestCase):
         api.keystone.tenant_list(IgnoreArg(),
                                  domain=None,
                                  marker=None,
-                                 paginate=True) \
+                                 paginate=True,
+                                 filters={}) \
             .AndReturn([self.tenants.list(), False])
         # Edit mod
         api.keystone.tenant_get(IgnoreArg(),
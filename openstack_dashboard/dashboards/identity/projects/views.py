@@ -32,6 +32,7 @@ from openstack_dashboard import policy
 from openstack_dashboard import usage
 from openstack_dashboard.usage import quotas
 
+from openstack_dashboard.dashboards.identity import utils as identity_utils
 from openstack_dashboard.dashboards.identity.projects \
     import tables as project_tables
 from openstack_dashboard.dashboards.identity.projects \
@@ -65,7 +66,14 @@ class TenantContextMixin(object):
         return context
 
 
-class IndexView(tables.DataTableView):
+class IndexView(identity_utils.FilterMixin, tables.DataTableView):
+    """Lists the projects a page at a time.
+
+    Keystone v3 has no marker based pagination, so with it every page is
+    cut from a full listing of the matching projects (see
+    :func:`openstack_dashboard.api.keystone._paginate`): each page costs as
+    much as listing all of them, unless a filter narrows the listing down.
+    """
     table_class = project_tables.TenantsTable
     template_name = 'identity/projects/index.html'
     page_title = _("Projects")
@@ -86,7 +94,8 @@ class IndexView(tables.DataTableView):
                     self.request,
                     domain=domain_context,
                     paginate=True,
-                    marker=marker)
+                    marker=marker,
+                    filters=self.get_filters())
             except Exception:
                 exceptions.handle(self.request,
                                   _("Unable to retrieve project list."))
@@ -98,6 +107,7 @@ class IndexView(tables.DataTableView):
                     user=self.request.user.id,
                     paginate=True,
                     marker=marker,
+                    filters=self.get_filters(),
                     admin=False)
             except Exception:
                 exceptions.handle(self.request,
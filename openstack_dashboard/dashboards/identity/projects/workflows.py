@@ -16,6 +16,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import logging
 
 from django.conf import settings
 from django.core.urlresolvers import reverse
@@ -34,8 +35,11 @@ from openstack_dashboard.api import base
 from openstack_dashboard.api import cinder
 from openstack_dashboard.api import keystone
 from openstack_dashboard.api import nova
+from openstack_dashboard.dashboards.identity.projects import membership
 from openstack_dashboard.usage import quotas
 
+LOG = logging.getLogger(__name__)
+
 INDEX_URL = "horizon:identity:projects:index"
 ADD_USER_URL = "horizon:identity:projects:create_user"
 PROJECT_GROUP_ENABLED = keystone.VERSIONS.active >= 3
@@ -210,14 +214,24 @@ class UpdateProjectMembersAction(workflows.MembershipAction):
         self.fields[default_role_name] = forms.CharField(required=False)
         self.fields[default_role_name].initial = default_role.id
 
+        # Figure out users & roles
+        users_roles = {}
+        if project_id:
+            try:
+                users_roles = api.keystone.get_project_users_roles(request,
+                                                                   project_id)
+            except Exception:
+                exceptions.handle(request,
+                                  err_msg,
+                                  redirect=reverse(INDEX_URL))
+
         # Get list of available users
-        all_users = []
+        users_list = []
         try:
-            all_users = api.keystone.user_list(request,
-                                               domain=domain_id)
+            users_list = membership.get_user_choices(self, domain_id,
+                                                     users_roles)
         except Exception:
             exceptions.handle(request, err_msg)
-        users_list = [(user.id, user.name) for user in all_users]
 
         # Get list of roles
         role_list = []
@@ -235,16 +249,7 @@ class UpdateProjectMembersAction(workflows.MembershipAction):
             self.fields[field_name].choices = users_list
             self.fields[field_name].initial = []
 
-        # Figure out users & roles
         if project_id:
-            try:
-                users_roles = api.keystone.get_project_users_roles(request,
-                                                                   project_id)
-            except Exception:
-                exceptions.handle(request,
-                                  err_msg,
-                                  redirect=reverse(INDEX_URL))
-
             for user_id in users_roles:
                 roles_ids = users_roles[user_id]
                 for role_id in roles_ids:
@@ -263,6 +268,11 @@ class UpdateProjectMembers(workflows.UpdateMembersStep):
     no_available_text = _("No users found.")
     no_members_text = _("No users.")
 
+    @property
+    def search_url(self):
+        return membership.get_user_search_url(
+            self.workflow.context.get('domain_id'))
+
     def contribute(self, data, context):
         if data:
             try:
@@ -629,38 +639,18 @@ class UpdateProject(CommonQuotaWorkflow):
             exceptions.handle(request, ignore=True)
             return
 
-    def _add_roles_to_users(self, request, data, project_id, user_id,
-                            role_ids, available_roles):
-        member_step = self.get_step(PROJECT_USER_MEMBER_SLUG)
-        current_role_ids = list(role_ids)
-
+    def _get_desired_assignments(self, data, step_slug, actor_type,
+                                 available_roles):
+        member_step = self.get_step(step_slug)
+        desired = set()
+        if member_step is None:
+            return desired
         for role in available_roles:
             field_name = member_step.get_member_field_name(role.id)
-            # Check if the user is in the list of users with this role.
-            if user_id in data[field_name]:
-                # Add it if necessary
-                if role.id not in current_role_ids:
-                    # user role has changed
-                    api.keystone.add_tenant_user_role(
-                        request,
-                        project=project_id,
-                        user=user_id,
-                        role=role.id)
-                else:
-                    # User role is unchanged, so remove it from the
-                    # remaining roles list to avoid removing it later.
-                    index = current_role_ids.index(role.id)
-                    current_role_ids.pop(index)
-        return current_role_ids
-
-    def _remove_roles_from_user(self, request, project_id, user_id,
-                                current_role_ids):
-        for id_to_delete in current_role_ids:
-            api.keystone.remove_tenant_user_role(
-                request,
-                project=project_id,
-                user=user_id,
-                role=id_to_delete)
+            for actor_id in data[field_name]:
+                desired.add(membership.Assignment(actor_type, actor_id,
+                                                  role.id))
+        return desired
 
     def _is_removing_self_admin_role(self, request, project_id, user_id,
                                      available_roles, current_role_ids):
@@ -689,52 +679,45 @@ class UpdateProject(CommonQuotaWorkflow):
             return False
 
     def _update_project_members(self, request, data, project_id):
-        # update project members
-        users_to_modify = 0
-        # Project-user member step
-        member_step = self.get_step(PROJECT_USER_MEMBER_SLUG)
+        # update project members, and groups if enabled, in a single pass
+        members_to_modify = 0
+        engine = membership.ProjectMembership(
+            request, project_id, include_groups=PROJECT_GROUP_ENABLED)
         try:
             # Get our role options
             available_roles = self._get_available_roles(request)
-            # Get the users currently associated with this project so we
-            # can diff against it.
-            users_roles = api.keystone.get_project_users_roles(
-                request, project=project_id)
-            users_to_modify = len(users_roles)
-
-            for user_id in users_roles.keys():
-                # Check if there have been any changes in the roles of
-                # Existing project members.
-                current_role_ids = list(users_roles[user_id])
-                modified_role_ids = self._add_roles_to_users(
-                    request, data, project_id, user_id,
-                    current_role_ids, available_roles)
-                # Prevent admins from doing stupid things to themselves.
-                removing_admin = self._is_removing_self_admin_role(
-                    request, project_id, user_id, available_roles,
-                    modified_role_ids)
-                # Otherwise go through and revoke any removed roles.
-                if not removing_admin:
-                    self._remove_roles_from_user(request, project_id, user_id,
-                                                 modified_role_ids)
-                users_to_modify -= 1
-
-            # Grant new roles on the project.
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                # Count how many users may be added for exception handling.
-                users_to_modify += len(data[field_name])
-            for role in available_roles:
-                users_added = 0
-                field_name = member_step.get_member_field_name(role.id)
-                for user_id in data[field_name]:
-                    if user_id not in users_roles:
-                        api.keystone.add_tenant_user_role(request,
-                                                          project=project_id,
-                                                          user=user_id,
-                                                          role=role.id)
-                    users_added += 1
-                users_to_modify -= users_added
+            desired = self._get_desired_assignments(
+                data, PROJECT_USER_MEMBER_SLUG, membership.USER,
+                available_roles)
+            if PROJECT_GROUP_ENABLED:
+                desired |= self._get_desired_assignments(
+                    data, PROJECT_GROUP_MEMBER_SLUG, membership.GROUP,
+                    available_roles)
+            # Diff against the assignments currently on this project.
+            grants, revokes = engine.diff(desired, engine.get_current())
+            members_to_modify = len(set(
+                (a.actor_type, a.actor_id) for a in grants + revokes))
+
+            # Prevent admins from doing stupid things to themselves.
+            own_revokes = [a for a in revokes
+                           if a.actor_type == membership.USER and
+                           a.actor_id == request.user.id]
+            skipped = []
+            if own_revokes and self._is_removing_self_admin_role(
+                    request, project_id, request.user.id, available_roles,
+                    [a.role_id for a in own_revokes]):
+                skipped = own_revokes
+                revokes = [a for a in revokes if a not in skipped]
+
+            result = engine.apply(grants, revokes, skipped=skipped)
+            self.membership_result = result
+            LOG.debug("Updated members of project %s: %d succeeded, "
+                      "%d failed, %d skipped.", project_id,
+                      len(result.succeeded), len(result.failed),
+                      len(result.skipped))
+            members_to_modify = (len(result.failed_actors(membership.USER)) +
+                                 len(result.failed_actors(membership.GROUP)))
+            result.raise_for_failure()
             return True
         except Exception:
             if PROJECT_GROUP_ENABLED:
@@ -745,86 +728,12 @@ class UpdateProject(CommonQuotaWorkflow):
                               _('Failed to modify %(users_to_modify)s'
                                 ' project members%(group_msg)s and '
                                 'update project quotas.')
-                              % {'users_to_modify': users_to_modify,
+                              % {'users_to_modify': members_to_modify,
                                  'group_msg': group_msg})
             return False
         finally:
             auth_utils.remove_project_cache(request.user.token.unscoped_token)
 
-    def _update_project_groups(self, request, data, project_id, domain_id):
-        # update project groups
-        groups_to_modify = 0
-        member_step = self.get_step(PROJECT_GROUP_MEMBER_SLUG)
-        try:
-            available_roles = self._get_available_roles(request)
-            # Get the groups currently associated with this project so we
-            # can diff against it.
-            project_groups = api.keystone.group_list(request,
-                                                     domain=domain_id,
-                                                     project=project_id)
-            groups_to_modify = len(project_groups)
-            for group in project_groups:
-                # Check if there have been any changes in the roles of
-                # Existing project members.
-                current_roles = api.keystone.roles_for_group(
-                    self.request,
-                    group=group.id,
-                    project=project_id)
-                current_role_ids = [role.id for role in current_roles]
-                for role in available_roles:
-                    # Check if the group is in the list of groups with
-                    # this role.
-                    field_name = member_step.get_member_field_name(role.id)
-                    if group.id in data[field_name]:
-                        # Add it if necessary
-                        if role.id not in current_role_ids:
-                            # group role has changed
-                            api.keystone.add_group_role(
-                                request,
-                                role=role.id,
-                                group=group.id,
-                                project=project_id)
-                        else:
-                            # Group role is unchanged, so remove it from
-                            # the remaining roles list to avoid removing it
-                            # later.
-                            index = current_role_ids.index(role.id)
-                            current_role_ids.pop(index)
-
-                # Revoke any removed roles.
-                for id_to_delete in current_role_ids:
-                    api.keystone.remove_group_role(request,
-                                                   role=id_to_delete,
-                                                   group=group.id,
-                                                   project=project_id)
-                groups_to_modify -= 1
-
-            # Grant new roles on the project.
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                # Count how many groups may be added for error handling.
-                groups_to_modify += len(data[field_name])
-            for role in available_roles:
-                groups_added = 0
-                field_name = member_step.get_member_field_name(role.id)
-                for group_id in data[field_name]:
-                    if not filter(lambda x: group_id == x.id,
-                                  project_groups):
-                        api.keystone.add_group_role(request,
-                                                    role=role.id,
-                                                    group=group_id,
-                                                    project=project_id)
-                    groups_added += 1
-                groups_to_modify -= groups_added
-            return True
-        except Exception:
-            exceptions.handle(request,
-                              _('Failed to modify %s project '
-                                'members, update project groups '
-                                'and update project quotas.')
-                              % groups_to_modify)
-            return False
-
     def _update_project_quota(self, request, data, project_id):
         try:
             super(UpdateProject, self)._update_project_quota(
@@ -837,28 +746,16 @@ class UpdateProject(CommonQuotaWorkflow):
             return False
 
     def handle(self, request, data):
-        # FIXME(gabriel): This should be refactored to use Python's built-in
-        # sets and do this all in a single "roles to add" and "roles to remove"
-        # pass instead of the multi-pass thing happening now.
-
         project = self._update_project(request, data)
         if not project:
             return False
 
         project_id = data['project_id']
-        # Use the domain_id from the project if available
-        domain_id = getattr(project, "domain_id", '')
 
         ret = self._update_project_members(request, data, project_id)
         if not ret:
             return False
 
-        if PROJECT_GROUP_ENABLED:
-            ret = self._update_project_groups(request, data,
-                                              project_id, domain_id)
-            if not ret:
-                return False
-
         ret = self._update_project_quota(request, data, project_id)
         if not ret:
             return False
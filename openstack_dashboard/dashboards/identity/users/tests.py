@@ -16,6 +16,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
 from socket import timeout as socket_timeout  # noqa
 
 from django.core.urlresolvers import reverse
@@ -35,6 +36,7 @@ USER_UPDATE_URL = reverse('horizon:identity:users:update', args=[1])
 USER_DETAIL_URL = reverse('horizon:identity:users:detail', args=[1])
 USER_CHANGE_PASSWORD_URL = reverse('horizon:identity:users:change_password',
                                    args=[1])
+USER_SEARCH_URL = reverse('horizon:identity:users:search')
 
 
 class UsersViewTests(test.BaseAdminViewTests):
@@ -59,7 +61,10 @@ class UsersViewTests(test.BaseAdminViewTests):
         domain_id = domain.id
         users = self._get_users(domain_id)
         api.keystone.user_list(IgnoreArg(),
-                               domain=domain_id).AndReturn(users)
+                               domain=domain_id,
+                               filters={},
+                               paginate=True,
+                               marker=None).AndReturn([users, False])
 
         self.mox.ReplayAll()
         res = self.client.get(USERS_INDEX_URL)
@@ -76,6 +81,48 @@ class UsersViewTests(test.BaseAdminViewTests):
                               domain_context_name=domain.name)
         self.test_index()
 
+    @test.create_stubs({api.keystone: ('user_list',)})
+    def test_index_filtered(self):
+        domain_id = self._get_default_domain().id
+        users = self.users.list()[:1]
+        self.setSessionValues(users__filter__q='test_user',
+                              users__filter__q_field='name')
+        api.keystone.user_list(IgnoreArg(),
+                               domain=domain_id,
+                               filters={'name__icontains': 'test_user'},
+                               paginate=True,
+                               marker=None).AndReturn([users, True])
+
+        self.mox.ReplayAll()
+        res = self.client.get(USERS_INDEX_URL)
+        self.assertItemsEqual(users, res.context['table'].data)
+        self.assertTrue(res.context['table'].has_more_data())
+
+    @test.create_stubs({api.keystone: ('user_search',)})
+    def test_search(self):
+        users = self.users.list()[1:3]
+        api.keystone.user_search(IgnoreArg(), 'user_t', domain='1') \
+            .AndReturn(users)
+
+        self.mox.ReplayAll()
+        res = self.client.get(USER_SEARCH_URL, {'q': 'user_t',
+                                                'domain_id': '1'})
+        self.assertEqual({'items': [{'id': user.id, 'name': user.name}
+                                    for user in users]},
+                         json.loads(res.content))
+
+    @test.create_stubs({api.keystone: ('user_search',)})
+    def test_search_error(self):
+        api.keystone.user_search(IgnoreArg(), 'user_t', domain='1') \
+            .AndRaise(self.exceptions.keystone)
+
+        self.mox.ReplayAll()
+        res = self.client.get(USER_SEARCH_URL, {'q': 'user_t',
+                                                'domain_id': '1'})
+        self.assertEqual(200, res.status_code)
+        self.assertEqual({'items': [], 'error': 'Unable to search users.'},
+                         json.loads(res.content))
+
     @test.create_stubs({api.keystone: ('user_create',
                                        'get_default_domain',
                                        'tenant_list',
@@ -496,7 +543,9 @@ class UsersViewTests(test.BaseAdminViewTests):
         users = self._get_users(domain_id)
         user.enabled = False
 
-        api.keystone.user_list(IgnoreArg(), domain=domain_id).AndReturn(users)
+        api.keystone.user_list(IgnoreArg(), domain=domain_id, filters={},
+                               paginate=True, marker=None) \
+            .AndReturn([users, False])
         api.keystone.user_update_enabled(IgnoreArg(),
                                          user.id,
                                          True).AndReturn(user)
@@ -517,8 +566,9 @@ class UsersViewTests(test.BaseAdminViewTests):
 
         self.assertTrue(user.enabled)
 
-        api.keystone.user_list(IgnoreArg(), domain=domain_id) \
-            .AndReturn(users)
+        api.keystone.user_list(IgnoreArg(), domain=domain_id, filters={},
+                               paginate=True, marker=None) \
+            .AndReturn([users, False])
         api.keystone.user_update_enabled(IgnoreArg(),
                                          user.id,
                                          False).AndReturn(user)
@@ -538,8 +588,9 @@ class UsersViewTests(test.BaseAdminViewTests):
         users = self._get_users(domain_id)
         user.enabled = False
 
-        api.keystone.user_list(IgnoreArg(), domain=domain_id) \
-            .AndReturn(users)
+        api.keystone.user_list(IgnoreArg(), domain=domain_id, filters={},
+                               paginate=True, marker=None) \
+            .AndReturn([users, False])
         api.keystone.user_update_enabled(IgnoreArg(), user.id, True) \
                     .AndRaise(self.exceptions.keystone)
         self.mox.ReplayAll()
@@ -555,8 +606,9 @@ class UsersViewTests(test.BaseAdminViewTests):
         domain_id = domain.id
         users = self._get_users(domain_id)
         for i in range(0, 2):
-            api.keystone.user_list(IgnoreArg(), domain=domain_id) \
-                .AndReturn(users)
+            api.keystone.user_list(IgnoreArg(), domain=domain_id,
+                                   filters={}, paginate=True, marker=None) \
+                .AndReturn([users, False])
 
         self.mox.ReplayAll()
 
@@ -573,8 +625,9 @@ class UsersViewTests(test.BaseAdminViewTests):
         domain_id = domain.id
         users = self._get_users(domain_id)
         for i in range(0, 2):
-            api.keystone.user_list(IgnoreArg(), domain=domain_id) \
-                .AndReturn(users)
+            api.keystone.user_list(IgnoreArg(), domain=domain_id,
+                                   filters={}, paginate=True, marker=None) \
+                .AndReturn([users, False])
 
         self.mox.ReplayAll()
 
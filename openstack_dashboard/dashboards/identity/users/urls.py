@@ -31,6 +31,7 @@ urlpatterns = patterns(
     url(r'^(?P<user_id>[^/]+)/update/$',
         views.UpdateView.as_view(), name='update'),
     url(r'^create/$', views.CreateView.as_view(), name='create'),
+    url(r'^search/$', views.SearchView.as_view(), name='search'),
     url(r'^(?P<user_id>[^/]+)/detail/$',
         views.DetailView.as_view(), name='detail'),
     url(r'^(?P<user_id>[^/]+)/change_password/$',
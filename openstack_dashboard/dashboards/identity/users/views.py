@@ -16,14 +16,18 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
 import logging
 import operator
 
+from django import http
 from django.core.urlresolvers import reverse
 from django.core.urlresolvers import reverse_lazy
 from django.utils.decorators import method_decorator  # noqa
+from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 from django.views.decorators.debug import sensitive_post_parameters  # noqa
+from django.views import generic
 
 from horizon import exceptions
 from horizon import forms
@@ -35,6 +39,7 @@ from horizon import views
 from openstack_dashboard import api
 from openstack_dashboard import policy
 
+from openstack_dashboard.dashboards.identity import utils as identity_utils
 from openstack_dashboard.dashboards.identity.users \
     import forms as project_forms
 from openstack_dashboard.dashboards.identity.users \
@@ -43,19 +48,36 @@ from openstack_dashboard.dashboards.identity.users \
 LOG = logging.getLogger(__name__)
 
 
-class IndexView(tables.DataTableView):
+class IndexView(identity_utils.FilterMixin, tables.DataTableView):
+    """Lists the users a page at a time.
+
+    Keystone v3 has no marker based pagination, so with it every page is
+    cut from a full listing of the matching users (see
+    :func:`openstack_dashboard.api.keystone._paginate`): each page costs as
+    much as listing all of them, unless a filter narrows the listing down.
+    """
     table_class = project_tables.UsersTable
     template_name = 'identity/users/index.html'
     page_title = _("Users")
 
+    def has_more_data(self, table):
+        return self._more
+
     def get_data(self):
         users = []
+        marker = self.request.GET.get(
+            project_tables.UsersTable._meta.pagination_param, None)
         domain_context = self.request.session.get('domain_context', None)
+        self._more = False
         if policy.check((("identity", "identity:list_users"),),
                         self.request):
             try:
-                users = api.keystone.user_list(self.request,
-                                               domain=domain_context)
+                users, self._more = api.keystone.user_list(
+                    self.request,
+                    domain=domain_context,
+                    filters=self.get_filters(),
+                    paginate=True,
+                    marker=marker)
             except Exception:
                 exceptions.handle(self.request,
                                   _('Unable to retrieve user list.'))
@@ -254,3 +276,29 @@ class ChangePasswordView(forms.ModalFormView):
         user = self.get_object()
         return {'id': self.kwargs['user_id'],
                 'name': user.name}
+
+
+class SearchView(generic.View):
+    """Returns the users whose name contains the ``q`` parameter as JSON.
+
+    This backs the user search of the membership workflow steps.
+    """
+
+    def get(self, request):
+        query = request.GET.get('q', '').strip()
+        domain_id = request.GET.get('domain_id',
+                                    request.session.get('domain_context'))
+        users = []
+        data = {}
+        if query and policy.check((("identity", "identity:list_users"),),
+                                  request):
+            try:
+                users = api.keystone.user_search(request, query,
+                                                 domain=domain_id)
+            except Exception:
+                exceptions.handle(request, ignore=True)
+                data['error'] = force_text(_('Unable to search users.'))
+        data['items'] = [{'id': user.id, 'name': user.name}
+                         for user in users]
+        return http.HttpResponse(json.dumps(data),
+                                 content_type='application/json')
@@ -17,6 +17,7 @@ from collections import defaultdict
 from django.conf import settings
 from django.core.urlresolvers import reverse
 from django.template import defaultfilters as filters
+from django.utils.html import format_html
 from django.utils.http import urlencode
 from django.utils.translation import pgettext_lazy
 from django.utils.translation import ugettext_lazy as _
@@ -29,6 +30,8 @@ from openstack_dashboard import api
 from openstack_dashboard.api import base
 
 NOT_LAUNCHABLE_FORMATS = ['aki', 'ari']
+# Statuses of an image whose data may still be uploaded by Horizon.
+UPLOADING_STATUSES = ('queued', 'saving')
 
 
 class LaunchImage(tables.LinkAction):
@@ -262,6 +265,8 @@ class UpdateRow(tables.Row):
 
     def get_data(self, request, image_id):
         image = api.glance.image_get(request, image_id)
+        if image.status in UPLOADING_STATUSES:
+            image.upload = api.glance.image_upload_status(request, image_id)
         return image
 
     def load_cells(self, image=None):
@@ -272,6 +277,30 @@ class UpdateRow(tables.Row):
         image_categories = get_image_categories(image, my_tenant_id)
         for category in image_categories:
             self.classes.append('category-' + category)
+        if image.status in UPLOADING_STATUSES:
+            self.attrs['data-upload-status-url'] = reverse(
+                "horizon:project:images:images:upload_status",
+                args=(self.table.get_object_id(image),))
+
+
+class ImageStatusColumn(tables.Column):
+    """Status column which also shows the progress of local uploads.
+
+    The progress is kept up to date by ``horizon.images.js``, which polls
+    the ``data-upload-status-url`` of the row.
+    """
+
+    def get_data(self, datum):
+        data = super(ImageStatusColumn, self).get_data(datum)
+        if getattr(datum, 'status', None) not in UPLOADING_STATUSES:
+            return data
+        progress = ''
+        upload = getattr(datum, 'upload', None)
+        if upload and upload.get('status') == 'uploading' and \
+                upload.get('total_bytes'):
+            progress = _("(%s%%)") % upload.get('progress', 0)
+        return format_html('{0} <span class="upload-progress">{1}</span>',
+                           data, progress)
 
 
 class ImagesTable(tables.DataTable):
@@ -303,11 +332,11 @@ class ImagesTable(tables.DataTable):
     image_type = tables.Column(get_image_type,
                                verbose_name=_("Type"),
                                display_choices=TYPE_CHOICES)
-    status = tables.Column("status",
-                           verbose_name=_("Status"),
-                           status=True,
-                           status_choices=STATUS_CHOICES,
-                           display_choices=STATUS_DISPLAY_CHOICES)
+    status = ImageStatusColumn("status",
+                               verbose_name=_("Status"),
+                               status=True,
+                               status_choices=STATUS_CHOICES,
+                               display_choices=STATUS_DISPLAY_CHOICES)
     public = tables.Column("is_public",
                            verbose_name=_("Public"),
                            empty_value=False,
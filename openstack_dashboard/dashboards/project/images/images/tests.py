@@ -16,6 +16,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
 import tempfile
 
 from django.conf import settings
@@ -24,6 +25,7 @@ from django.core.urlresolvers import reverse
 from django.forms.widgets import HiddenInput  # noqa
 from django import http
 from django.test.utils import override_settings
+from django.utils.http import urlencode
 
 from mox3.mox import IsA  # noqa
 
@@ -381,6 +383,59 @@ class ImageViewTests(test.TestCase):
                             html=True,
                             msg_prefix="The is_public checkbox is not checked")
 
+    @test.create_stubs({api.glance: ('image_upload_status',)})
+    def test_image_upload_status(self):
+        image = self.images.first()
+        status = {'image_id': image.id, 'status': 'uploading',
+                  'bytes_uploaded': 512, 'total_bytes': 1024,
+                  'progress': 50, 'error': None}
+        api.glance.image_upload_status(IsA(http.HttpRequest),
+                                       str(image.id)).AndReturn(status)
+        self.mox.ReplayAll()
+
+        res = self.client.get(
+            reverse('horizon:project:images:images:upload_status',
+                    args=[image.id]))
+        self.assertEqual(200, res.status_code)
+        self.assertEqual(status, json.loads(res.content.decode('utf-8')))
+
+    @test.create_stubs({api.glance: ('image_upload_status',)})
+    def test_image_upload_status_unknown(self):
+        image = self.images.first()
+        api.glance.image_upload_status(IsA(http.HttpRequest),
+                                       str(image.id)).AndReturn(None)
+        self.mox.ReplayAll()
+
+        res = self.client.get(
+            reverse('horizon:project:images:images:upload_status',
+                    args=[image.id]))
+        self.assertEqual(404, res.status_code)
+
+    @test.create_stubs({api.glance: ('image_get', 'image_upload_status')})
+    def test_row_update_upload_progress(self):
+        image = self.images.first()
+        image.status = 'saving'
+        status = {'image_id': image.id, 'status': 'uploading',
+                  'bytes_uploaded': 512, 'total_bytes': 1024,
+                  'progress': 50, 'error': None}
+        api.glance.image_get(IsA(http.HttpRequest), image.id) \
+            .AndReturn(image)
+        api.glance.image_upload_status(IsA(http.HttpRequest), image.id) \
+            .AndReturn(status)
+        self.mox.ReplayAll()
+
+        params = {'action': 'row_update', 'table': 'images',
+                  'obj_id': image.id}
+        res = self.client.get('?'.join((IMAGES_INDEX_URL,
+                                        urlencode(params))),
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertContains(res, 'Saving <span class="upload-progress">'
+                                 '(50%)</span>')
+        self.assertContains(
+            res, 'data-upload-status-url="%s"' %
+            reverse('horizon:project:images:images:upload_status',
+                    args=[image.id]))
+
 
 class OwnerFilterTests(test.TestCase):
     def setUp(self):
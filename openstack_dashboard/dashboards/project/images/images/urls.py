@@ -30,5 +30,7 @@ urlpatterns = patterns(
     url(r'^create/$', views.CreateView.as_view(), name='create'),
     url(r'^(?P<image_id>[^/]+)/update/$',
         views.UpdateView.as_view(), name='update'),
+    url(r'^(?P<image_id>[^/]+)/upload_status/$',
+        views.UploadStatusView.as_view(), name='upload_status'),
     url(r'^(?P<image_id>[^/]+)/$', views.DetailView.as_view(), name='detail'),
 )
@@ -19,9 +19,13 @@
 """
 Views for managing images.
 """
+import json
+
 from django.core.urlresolvers import reverse
 from django.core.urlresolvers import reverse_lazy
+from django import http
 from django.utils.translation import ugettext_lazy as _
+from django.views import generic
 
 from horizon import exceptions
 from horizon import forms
@@ -151,3 +155,14 @@ class DetailView(tabs.TabView):
     def get_tabs(self, request, *args, **kwargs):
         image = self.get_data()
         return self.tab_group_class(request, image=image, **kwargs)
+
+
+class UploadStatusView(generic.View):
+    """Returns the progress of a local image upload as JSON."""
+
+    def get(self, request, image_id):
+        status = api.glance.image_upload_status(request, image_id)
+        if status is None:
+            raise http.Http404()
+        return http.HttpResponse(json.dumps(status),
+                                 content_type='application/json')
@@ -58,12 +58,12 @@ SNAPSHOT_SEARCH_OPTS = dict(status=AVAILABLE)
 class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({
         api.nova: (
-            'flavor_list',
+            'flavor_list_by_ids',
             'server_list',
             'tenant_absolute_limits',
             'extension_supported',
         ),
-        api.glance: ('image_list_detailed',),
+        api.glance: ('image_list_by_ids',),
         api.network: (
             'floating_ip_simple_associate_supported',
             'floating_ip_supported',
@@ -77,10 +77,11 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -125,17 +126,15 @@ class InstanceTests(helpers.TestCase):
         self.assertMessageCount(res, error=1)
 
     @helpers.create_stubs({
-        api.nova: ('flavor_list', 'server_list', 'flavor_get',
+        api.nova: ('flavor_list_by_ids', 'server_list',
                    'tenant_absolute_limits', 'extension_supported',),
-        api.glance: ('image_list_detailed',),
+        api.glance: ('image_list_by_ids',),
         api.network: ('floating_ip_simple_associate_supported',
                       'floating_ip_supported',
                       'servers_update_addresses',),
     })
     def test_index_flavor_list_exception(self):
         servers = self.servers.list()
-        flavors = self.flavors.list()
-        full_flavors = OrderedDict([(f.id, f) for f in flavors])
         search_opts = {'marker': None, 'paginate': True}
         api.nova.extension_supported('AdminActions',
                                      IsA(http.HttpRequest)) \
@@ -145,13 +144,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndRaise(self.exceptions.nova)
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
-        for server in servers:
-            api.nova.flavor_get(IsA(http.HttpRequest), server.flavor["id"]). \
-                AndReturn(full_flavors[server.flavor["id"]])
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         api.nova.tenant_absolute_limits(IsA(http.HttpRequest), reserved=True) \
            .MultipleTimes().AndReturn(self.limits['absolute'])
         api.network.floating_ip_supported(IsA(http.HttpRequest)) \
@@ -169,9 +166,9 @@ class InstanceTests(helpers.TestCase):
         self.assertItemsEqual(instances, self.servers.list())
 
     @helpers.create_stubs({
-        api.nova: ('flavor_list', 'server_list', 'tenant_absolute_limits',
-                   'extension_supported',),
-        api.glance: ('image_list_detailed',),
+        api.nova: ('flavor_list_by_ids', 'server_list',
+                   'tenant_absolute_limits', 'extension_supported',),
+        api.glance: ('image_list_by_ids',),
         api.network: ('floating_ip_simple_associate_supported',
                       'floating_ip_supported',
                       'servers_update_addresses',),
@@ -188,10 +185,11 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -238,9 +236,9 @@ class InstanceTests(helpers.TestCase):
                 self.assertNotIsInstance(action, tables.ConsoleLink)
 
     @helpers.create_stubs({api.nova: ('server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'server_delete',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_terminate_instance(self):
         servers = self.servers.list()
@@ -250,9 +248,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
-        api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
+            .AndReturn(self.flavors.list())
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         api.nova.server_delete(IsA(http.HttpRequest), server.id)
         self.mox.ReplayAll()
 
@@ -262,9 +262,9 @@ class InstanceTests(helpers.TestCase):
         self.assertRedirectsNoFollow(res, INDEX_URL)
 
     @helpers.create_stubs({api.nova: ('server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'server_delete',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_terminate_instance_exception(self):
         servers = self.servers.list()
@@ -274,9 +274,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
-        api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
+            .AndReturn(self.flavors.list())
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         api.nova.server_delete(IsA(http.HttpRequest), server.id) \
             .AndRaise(self.exceptions.nova)
 
@@ -289,9 +291,9 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_pause',
                                       'server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_pause_instance(self):
         servers = self.servers.list()
@@ -300,10 +302,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.extension_supported('AdminActions',
                                      IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -319,9 +322,9 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_pause',
                                       'server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_pause_instance_exception(self):
         servers = self.servers.list()
@@ -330,10 +333,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.extension_supported('AdminActions',
                                      IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -350,9 +354,9 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_unpause',
                                       'server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_unpause_instance(self):
         servers = self.servers.list()
@@ -361,10 +365,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.extension_supported('AdminActions',
                                      IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -380,9 +385,9 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_unpause',
                                       'server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_unpause_instance_exception(self):
         servers = self.servers.list()
@@ -392,10 +397,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.extension_supported('AdminActions',
                                      IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -412,16 +418,17 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_reboot',
                                       'server_list',
-                                      'flavor_list',),
-                           api.glance: ('image_list_detailed',),
+                                      'flavor_list_by_ids',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_reboot_instance(self):
         servers = self.servers.list()
         server = servers[0]
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -438,17 +445,18 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_reboot',
                                       'server_list',
-                                      'flavor_list',),
-                           api.glance: ('image_list_detailed',),
+                                      'flavor_list_by_ids',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_reboot_instance_exception(self):
         servers = self.servers.list()
         server = servers[0]
 
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -466,17 +474,18 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_reboot',
                                       'server_list',
-                                      'flavor_list',),
-                           api.glance: ('image_list_detailed',),
+                                      'flavor_list_by_ids',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_soft_reboot_instance(self):
         servers = self.servers.list()
         server = servers[0]
 
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -493,9 +502,9 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_suspend',
                                       'server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_suspend_instance(self):
         servers = self.servers.list()
@@ -504,10 +513,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.extension_supported('AdminActions',
                                      IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -524,9 +534,9 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_suspend',
                                       'server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_suspend_instance_exception(self):
         servers = self.servers.list()
@@ -535,10 +545,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.extension_supported('AdminActions',
                                      IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -555,9 +566,9 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_resume',
                                       'server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_resume_instance(self):
         servers = self.servers.list()
@@ -567,10 +578,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.extension_supported('AdminActions',
                                      IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -586,9 +598,9 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_resume',
                                       'server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_resume_instance_exception(self):
         servers = self.servers.list()
@@ -598,10 +610,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.extension_supported('AdminActions',
                                      IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -619,9 +632,9 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_shelve',
                                       'server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_shelve_instance(self):
         servers = self.servers.list()
@@ -629,10 +642,11 @@ class InstanceTests(helpers.TestCase):
 
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -648,9 +662,9 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_shelve',
                                       'server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_shelve_instance_exception(self):
         servers = self.servers.list()
@@ -658,10 +672,11 @@ class InstanceTests(helpers.TestCase):
 
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -679,9 +694,9 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_unshelve',
                                       'server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_unshelve_instance(self):
         servers = self.servers.list()
@@ -690,10 +705,11 @@ class InstanceTests(helpers.TestCase):
 
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -710,9 +726,9 @@ class InstanceTests(helpers.TestCase):
 
     @helpers.create_stubs({api.nova: ('server_unshelve',
                                       'server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_unshelve_instance_exception(self):
         servers = self.servers.list()
@@ -721,10 +737,11 @@ class InstanceTests(helpers.TestCase):
 
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -743,7 +760,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({api.nova: ('server_lock',
                                       'server_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_lock_instance(self):
         servers = self.servers.list()
@@ -751,8 +768,9 @@ class InstanceTests(helpers.TestCase):
 
         api.nova.extension_supported('AdminActions', IsA(
             http.HttpRequest)).MultipleTimes().AndReturn(True)
-        api.glance.image_list_detailed(IgnoreArg()).AndReturn((
-            self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(
             IsA(http.HttpRequest),
@@ -770,7 +788,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({api.nova: ('server_lock',
                                       'server_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_lock_instance_exception(self):
         servers = self.servers.list()
@@ -778,8 +796,9 @@ class InstanceTests(helpers.TestCase):
 
         api.nova.extension_supported('AdminActions', IsA(
             http.HttpRequest)).MultipleTimes().AndReturn(True)
-        api.glance.image_list_detailed(IgnoreArg()).AndReturn((
-            self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(
             IsA(http.HttpRequest),
@@ -798,15 +817,16 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({api.nova: ('server_unlock',
                                       'server_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_unlock_instance(self):
         servers = self.servers.list()
         server = servers[0]
         api.nova.extension_supported('AdminActions', IsA(
             http.HttpRequest)).MultipleTimes().AndReturn(True)
-        api.glance.image_list_detailed(IgnoreArg()).AndReturn((
-            self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(
             IsA(http.HttpRequest),
@@ -824,7 +844,7 @@ class InstanceTests(helpers.TestCase):
     @helpers.create_stubs({api.nova: ('server_unlock',
                                       'server_list',
                                       'extension_supported',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_unlock_instance_exception(self):
         servers = self.servers.list()
@@ -832,8 +852,9 @@ class InstanceTests(helpers.TestCase):
 
         api.nova.extension_supported('AdminActions', IsA(
             http.HttpRequest)).MultipleTimes().AndReturn(True)
-        api.glance.image_list_detailed(IgnoreArg()).AndReturn((
-            self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(
             IsA(http.HttpRequest),
@@ -1259,9 +1280,9 @@ class InstanceTests(helpers.TestCase):
         self._test_instances_index_retrieve_password_action()
 
     @helpers.create_stubs({
-        api.nova: ('flavor_list', 'server_list', 'tenant_absolute_limits',
-                   'extension_supported',),
-        api.glance: ('image_list_detailed',),
+        api.nova: ('flavor_list_by_ids', 'server_list',
+                   'tenant_absolute_limits', 'extension_supported',),
+        api.glance: ('image_list_by_ids',),
         api.network: ('floating_ip_simple_associate_supported',
                       'floating_ip_supported',
                       'servers_update_addresses',),
@@ -1273,10 +1294,11 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -1475,7 +1497,8 @@ class InstanceTests(helpers.TestCase):
                                      IsA(http.HttpRequest)) \
             .AndReturn(block_device_mapping_v2)
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn([])
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
@@ -1513,8 +1536,6 @@ class InstanceTests(helpers.TestCase):
             .AndReturn(self.limits['absolute'])
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.keypair_list(IsA(http.HttpRequest)) \
             .AndReturn(self.keypairs.list())
         api.network.security_group_list(IsA(http.HttpRequest)) \
@@ -1698,7 +1719,8 @@ class InstanceTests(helpers.TestCase):
         volumes = [v for v in self.volumes.list()
                    if (v.status == AVAILABLE and v.bootable == 'true')]
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn(volumes)
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
@@ -1737,8 +1759,6 @@ class InstanceTests(helpers.TestCase):
             .AndReturn(self.limits['absolute'])
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.keypair_list(IsA(http.HttpRequest)) \
             .AndReturn(self.keypairs.list())
         api.network.security_group_list(IsA(http.HttpRequest)) \
@@ -1855,7 +1875,8 @@ class InstanceTests(helpers.TestCase):
         api.nova.extension_supported(
             'ConfigDrive', IsA(http.HttpRequest)).AndReturn(config_drive)
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn([])
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
@@ -1885,8 +1906,6 @@ class InstanceTests(helpers.TestCase):
                                config_drive=config_drive_value)
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -2007,15 +2026,14 @@ class InstanceTests(helpers.TestCase):
         api.nova.extension_supported('ConfigDrive',
                                      IsA(http.HttpRequest)).AndReturn(True)
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
               .AndReturn([])
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
               .AndReturn([])
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
               .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -2156,8 +2174,6 @@ class InstanceTests(helpers.TestCase):
         api.neutron.network_list(IsA(http.HttpRequest),
                                  shared=True) \
             .AndReturn(self.networks.list()[1:])
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         if test_with_profile:
             policy_profiles = self.policy_profiles.list()
             policy_profile_id = self.policy_profiles.first().id
@@ -2178,7 +2194,8 @@ class InstanceTests(helpers.TestCase):
         volumes = [v for v in self.volumes.list()
                    if (v.status == AVAILABLE and v.bootable == 'true')]
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn(volumes)
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
@@ -2299,8 +2316,6 @@ class InstanceTests(helpers.TestCase):
         api.neutron.network_list(IsA(http.HttpRequest),
                                  shared=True) \
             .AndReturn(self.networks.list()[1:])
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         if test_with_profile:
             policy_profiles = self.policy_profiles.list()
             policy_profile_id = self.policy_profiles.first().id
@@ -2321,7 +2336,8 @@ class InstanceTests(helpers.TestCase):
         volumes = [v for v in self.volumes.list()
                    if (v.status == AVAILABLE and v.bootable == 'true')]
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn(volumes)
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
@@ -2427,8 +2443,6 @@ class InstanceTests(helpers.TestCase):
         api.neutron.network_list(IsA(http.HttpRequest),
                                  shared=True) \
             .AndReturn(self.networks.list()[1:])
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         if test_with_profile:
             policy_profiles = self.policy_profiles.list()
             api.neutron.profile_list(IsA(http.HttpRequest),
@@ -2438,8 +2452,6 @@ class InstanceTests(helpers.TestCase):
             .AndReturn(True)
         api.nova.extension_supported('ConfigDrive',
                                      IsA(http.HttpRequest)).AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.keypair_list(IsA(http.HttpRequest)) \
             .AndReturn(self.keypairs.list())
         api.network.security_group_list(IsA(http.HttpRequest)) \
@@ -2447,7 +2459,8 @@ class InstanceTests(helpers.TestCase):
         api.nova.availability_zone_list(IsA(http.HttpRequest)) \
             .AndReturn(self.availability_zones.list())
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn([])
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
@@ -2558,8 +2571,6 @@ class InstanceTests(helpers.TestCase):
         api.neutron.network_list(IsA(http.HttpRequest),
                                  shared=True) \
             .AndReturn(self.networks.list()[1:])
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         if test_with_profile:
             policy_profiles = self.policy_profiles.list()
             policy_profile_id = self.policy_profiles.first().id
@@ -2580,7 +2591,8 @@ class InstanceTests(helpers.TestCase):
         snapshots = [v for v in self.cinder_volume_snapshots.list()
                      if (v.status == AVAILABLE)]
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn([])
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
@@ -2689,8 +2701,6 @@ class InstanceTests(helpers.TestCase):
         api.neutron.network_list(IsA(http.HttpRequest),
                                  shared=True) \
             .AndReturn(self.networks.list()[1:])
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.keypair_list(IsA(http.HttpRequest)) \
             .AndReturn(self.keypairs.list())
         api.network.security_group_list(IsA(http.HttpRequest)) \
@@ -2704,7 +2714,8 @@ class InstanceTests(helpers.TestCase):
                                      IsA(http.HttpRequest)).AndReturn(True)
 
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn([])
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
@@ -2755,7 +2766,8 @@ class InstanceTests(helpers.TestCase):
                                      IsA(http.HttpRequest)) \
             .AndReturn(True)
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn([])
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
@@ -2789,8 +2801,6 @@ class InstanceTests(helpers.TestCase):
             .AndReturn(self.limits['absolute'])
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndRaise(self.exceptions.nova)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndRaise(self.exceptions.nova)
         api.nova.keypair_list(IsA(http.HttpRequest)) \
             .AndReturn(self.keypairs.list())
         api.network.security_group_list(IsA(http.HttpRequest)) \
@@ -2842,7 +2852,8 @@ class InstanceTests(helpers.TestCase):
         volumes = [v for v in self.volumes.list()
                    if (v.status == AVAILABLE and v.bootable == 'true')]
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn(volumes)
         volumes = [v for v in self.volumes.list()
                    if (v.status == AVAILABLE)]
@@ -2908,8 +2919,6 @@ class InstanceTests(helpers.TestCase):
             api.neutron.port_delete(IsA(http.HttpRequest), port.id)
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -3010,20 +3019,17 @@ class InstanceTests(helpers.TestCase):
         volumes = [v for v in self.volumes.list()
                    if (v.status == AVAILABLE and v.bootable == 'true')]
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn(volumes)
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
             .AndReturn([])
 
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
            .AndReturn(self.limits['absolute'])
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -3117,20 +3123,17 @@ class InstanceTests(helpers.TestCase):
         volumes = [v for v in self.volumes.list()
                    if (v.status == AVAILABLE and v.bootable == 'true')]
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn(volumes)
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
             .AndReturn([])
 
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
            .AndReturn(self.limits['absolute'])
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -3242,20 +3245,17 @@ class InstanceTests(helpers.TestCase):
         volumes = [v for v in self.volumes.list()
                    if (v.status == AVAILABLE and v.bootable == 'true')]
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn(volumes)
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
             .AndReturn([])
 
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.tenant_absolute_limits(IsA(http.HttpRequest)) \
            .AndReturn(self.limits['absolute'])
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -3378,19 +3378,16 @@ class InstanceTests(helpers.TestCase):
         volumes = [v for v in self.volumes.list()
                    if (v.status == AVAILABLE and v.bootable == 'true')]
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn(volumes)
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
             .AndReturn([])
-        api.nova.flavor_list(
-            IsA(http.HttpRequest)).AndReturn(self.flavors.list())
         api.nova.tenant_absolute_limits(
             IsA(http.HttpRequest)).AndReturn(self.limits['absolute'])
         quotas.tenant_quota_usages(
             IsA(http.HttpRequest)).AndReturn(quota_usages)
-        api.nova.flavor_list(
-            IsA(http.HttpRequest)).AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -3464,9 +3461,6 @@ class InstanceTests(helpers.TestCase):
         quota_usages['cores']['available'] = 2000
         if volumes is not None:
             quota_usages['volumes']['available'] = volumes
-        else:
-            api.nova.flavor_list(IsA(http.HttpRequest)) \
-                .AndReturn(self.flavors.list())
 
         api.nova.extension_supported('BlockDeviceMappingV2Boot',
                                      IsA(http.HttpRequest)) \
@@ -3505,7 +3499,8 @@ class InstanceTests(helpers.TestCase):
         volumes = [v for v in self.volumes.list()
                    if (v.status == AVAILABLE and v.bootable == 'true')]
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn(volumes)
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
@@ -3517,8 +3512,6 @@ class InstanceTests(helpers.TestCase):
             .AndReturn(self.limits['absolute'])
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -3578,9 +3571,9 @@ class InstanceTests(helpers.TestCase):
             test_with_profile=True)
 
     @helpers.create_stubs({
-        api.nova: ('flavor_list', 'server_list', 'tenant_absolute_limits',
-                   'extension_supported',),
-        api.glance: ('image_list_detailed',),
+        api.nova: ('flavor_list_by_ids', 'server_list',
+                   'tenant_absolute_limits', 'extension_supported',),
+        api.glance: ('image_list_by_ids',),
         api.network: ('floating_ip_simple_associate_supported',
                       'floating_ip_supported',
                       'servers_update_addresses',),
@@ -3595,10 +3588,11 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -3701,14 +3695,13 @@ class InstanceTests(helpers.TestCase):
         volumes = [v for v in self.volumes.list()
                    if (v.status == AVAILABLE and v.bootable == 'true')]
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn(volumes)
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
             .AndReturn([])
 
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
 
@@ -3753,9 +3746,9 @@ class InstanceTests(helpers.TestCase):
         self.assertNoFormErrors(res)
 
     @helpers.create_stubs({
-        api.nova: ('flavor_list', 'server_list', 'tenant_absolute_limits',
-                   'extension_supported',),
-        api.glance: ('image_list_detailed',),
+        api.nova: ('flavor_list_by_ids', 'server_list',
+                   'tenant_absolute_limits', 'extension_supported',),
+        api.glance: ('image_list_by_ids',),
         api.network: ('floating_ip_simple_associate_supported',
                       'floating_ip_supported',
                       'servers_update_addresses',),
@@ -3769,10 +3762,11 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
@@ -3806,7 +3800,8 @@ class InstanceTests(helpers.TestCase):
         keypair = self.keypairs.first()
 
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn([])
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=SNAPSHOT_SEARCH_OPTS) \
@@ -3843,8 +3838,6 @@ class InstanceTests(helpers.TestCase):
                                      IsA(http.HttpRequest)).AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
         api.nova.keypair_list(IsA(http.HttpRequest)) \
             .AndReturn([keypair])
         api.network.security_group_list(IsA(http.HttpRequest)) \
@@ -3871,9 +3864,9 @@ class InstanceTests(helpers.TestCase):
                                          'tenant_floating_ip_allocate',
                                          'floating_ip_associate',
                                          'servers_update_addresses',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.nova: ('server_list',
-                                      'flavor_list')})
+                                      'flavor_list_by_ids')})
     def test_associate_floating_ip(self):
         servers = self.servers.list()
         server = servers[0]
@@ -3883,9 +3876,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
-        api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
+            .AndReturn(self.flavors.list())
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         api.network.floating_ip_target_get_by_instance(
             IsA(http.HttpRequest),
             server.id).AndReturn(server.id)
@@ -3905,9 +3900,9 @@ class InstanceTests(helpers.TestCase):
                                          'tenant_floating_ip_list',
                                          'floating_ip_disassociate',
                                          'servers_update_addresses',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.nova: ('server_list',
-                                      'flavor_list')})
+                                      'flavor_list_by_ids')})
     def test_disassociate_floating_ip(self):
         servers = self.servers.list()
         server = servers[0]
@@ -3918,9 +3913,11 @@ class InstanceTests(helpers.TestCase):
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
-        api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
+            .AndReturn(self.flavors.list())
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         api.network.floating_ip_target_list_by_instance(
             IsA(http.HttpRequest),
             server.id).AndReturn([server.id, ])
@@ -4306,9 +4303,9 @@ class InstanceTests(helpers.TestCase):
 
     @django.test.utils.override_settings(API_RESULT_PAGE_SIZE=2)
     @helpers.create_stubs({
-        api.nova: ('flavor_list', 'server_list', 'tenant_absolute_limits',
-                   'extension_supported',),
-        api.glance: ('image_list_detailed',),
+        api.nova: ('flavor_list_by_ids', 'server_list',
+                   'tenant_absolute_limits', 'extension_supported',),
+        api.glance: ('image_list_by_ids',),
         api.network: ('floating_ip_simple_associate_supported',
                       'floating_ip_supported',
                       'servers_update_addresses',),
@@ -4325,10 +4322,11 @@ class InstanceTests(helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
             .MultipleTimes().AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .MultipleTimes().AndReturn((self.images.list(), False, False))
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .MultipleTimes().AndReturn(self.images.list())
 
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -4370,9 +4368,9 @@ class InstanceTests(helpers.TestCase):
 
     @django.test.utils.override_settings(API_RESULT_PAGE_SIZE=2)
     @helpers.create_stubs({api.nova: ('server_list',
-                                      'flavor_list',
+                                      'flavor_list_by_ids',
                                       'server_delete',),
-                           api.glance: ('image_list_detailed',),
+                           api.glance: ('image_list_by_ids',),
                            api.network: ('servers_update_addresses',)})
     def test_terminate_instance_with_pagination(self):
         """Instance should be deleted from
@@ -4387,9 +4385,11 @@ class InstanceTests(helpers.TestCase):
             .AndReturn([servers[page_size:], False])
         api.network.servers_update_addresses(IsA(http.HttpRequest),
                                              servers[page_size:])
-        api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
-            .AndReturn((self.images.list(), False, False))
+        api.nova.flavor_list_by_ids(IsA(http.HttpRequest), IsA(tuple)) \
+            .AndReturn(self.flavors.list())
+        api.glance.image_list_by_ids(IsA(http.HttpRequest),
+                                     IsA(tuple)) \
+            .AndReturn(self.images.list())
         api.nova.server_delete(IsA(http.HttpRequest), server.id)
         self.mox.ReplayAll()
 
@@ -4827,7 +4827,8 @@ class ConsoleManagerTests(helpers.TestCase):
                                                       and v.bootable ==
                                                       'true')]
         cinder.volume_list(IsA(http.HttpRequest),
-                           search_opts=VOLUME_SEARCH_OPTS) \
+                           search_opts=VOLUME_SEARCH_OPTS,
+                           with_transfers=False) \
             .AndReturn(volumes)
         volumes = [v for v in self.volumes.list() if (v.status == AVAILABLE)]
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
@@ -4889,8 +4890,6 @@ class ConsoleManagerTests(helpers.TestCase):
         api.neutron.port_delete(IsA(http.HttpRequest), port.id)
         quotas.tenant_quota_usages(IsA(http.HttpRequest)) \
             .AndReturn(quota_usages)
-        api.nova.flavor_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.flavors.list())
 
         self.mox.ReplayAll()
 
@@ -17,6 +17,8 @@ from django.utils.translation import ugettext_lazy as _
 import six
 
 from horizon import exceptions
+from horizon import messages
+from horizon.utils import concurrency
 
 from openstack_dashboard import api
 
@@ -33,6 +35,75 @@ def flavor_list(request):
         return []
 
 
+def enrich_instances(request, instances, flavor_error_message=None):
+    """Attaches full image and flavor objects to a page of instances.
+
+    Only the images and flavors referenced by ``instances`` are retrieved,
+    images and flavors at the same time. The image of an instance is
+    replaced by the image object, and its flavor is set as ``full_flavor``.
+
+    If ``flavor_error_message`` is given, it is shown to the user when the
+    flavor of any of the instances could not be retrieved.
+    """
+    image_ids = set()
+    flavor_ids = set()
+    for instance in instances:
+        image = getattr(instance, 'image', None)
+        if isinstance(image, dict) and image.get('id'):
+            image_ids.add(image['id'])
+        flavor = getattr(instance, 'flavor', None)
+        if isinstance(flavor, dict) and flavor.get('id'):
+            flavor_ids.add(flavor['id'])
+
+    def get_images():
+        if not image_ids:
+            return []
+        try:
+            return api.glance.image_list_by_ids(request,
+                                                tuple(sorted(image_ids)))
+        except Exception:
+            exceptions.handle(request, ignore=True)
+
+    def get_flavors():
+        if not flavor_ids:
+            return []
+        try:
+            return api.nova.flavor_list_by_ids(request,
+                                               tuple(sorted(flavor_ids)))
+        except Exception:
+            exceptions.handle(request, ignore=True)
+
+    results = concurrency.run_concurrently([('images', get_images),
+                                            ('flavors', get_flavors)])
+    images = results['images']
+    flavors = results['flavors']
+    image_map = dict((str(image.id), image) for image in images or [])
+    flavor_map = dict((str(flavor.id), flavor) for flavor in flavors or [])
+
+    missing_flavor = False
+    for instance in instances:
+        image = getattr(instance, 'image', None)
+        if isinstance(image, dict) and image.get('id'):
+            if image['id'] in image_map:
+                instance.image = image_map[image['id']]
+            elif images is not None and 'name' not in image:
+                # The image is gone, don't let Server.image_name look for
+                # it again.
+                image['name'] = _("-")
+
+        flavor = getattr(instance, 'flavor', None)
+        if isinstance(flavor, dict) and flavor.get('id'):
+            if flavor['id'] in flavor_map:
+                instance.full_flavor = flavor_map[flavor['id']]
+            else:
+                missing_flavor = True
+                LOG.info('Unable to retrieve flavor "%s" for instance "%s".',
+                         flavor['id'], instance.id)
+    if missing_flavor and flavor_error_message:
+        messages.error(request, flavor_error_message)
+    return instances
+
+
 def sort_flavor_list(request, flavors):
     """Utility method to sort a list of flavors.
         By default, returns the available flavors, sorted by RAM
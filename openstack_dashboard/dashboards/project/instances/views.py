@@ -47,6 +47,8 @@ from openstack_dashboard.dashboards.project.instances \
     import tables as project_tables
 from openstack_dashboard.dashboards.project.instances \
     import tabs as project_tabs
+from openstack_dashboard.dashboards.project.instances \
+    import utils as instance_utils
 from openstack_dashboard.dashboards.project.instances \
     import workflows as project_workflows
 
@@ -85,47 +87,9 @@ class IndexView(tables.DataTableView):
                     message=_('Unable to retrieve IP addresses from Neutron.'),
                     ignore=True)
 
-            # Gather our flavors and images and correlate our instances to them
-            try:
-                flavors = api.nova.flavor_list(self.request)
-            except Exception:
-                flavors = []
-                exceptions.handle(self.request, ignore=True)
-
-            try:
-                # TODO(gabriel): Handle pagination.
-                images, more, prev = api.glance.image_list_detailed(
-                    self.request)
-            except Exception:
-                images = []
-                exceptions.handle(self.request, ignore=True)
-
-            full_flavors = OrderedDict([(str(flavor.id), flavor)
-                                       for flavor in flavors])
-            image_map = OrderedDict([(str(image.id), image)
-                                    for image in images])
-
-            # Loop through instances to get flavor info.
-            for instance in instances:
-                if hasattr(instance, 'image'):
-                    # Instance from image returns dict
-                    if isinstance(instance.image, dict):
-                        if instance.image.get('id') in image_map:
-                            instance.image = image_map[instance.image['id']]
-
-                try:
-                    flavor_id = instance.flavor["id"]
-                    if flavor_id in full_flavors:
-                        instance.full_flavor = full_flavors[flavor_id]
-                    else:
-                        # If the flavor_id is not in full_flavors list,
-                        # get it via nova api.
-                        instance.full_flavor = api.nova.flavor_get(
-                            self.request, flavor_id)
-                except Exception:
-                    msg = ('Unable to retrieve flavor "%s" for instance "%s".'
-                           % (flavor_id, instance.id))
-                    LOG.info(msg)
+            # Gather the flavors and images of this page of instances and
+            # correlate our instances to them
+            instance_utils.enrich_instances(self.request, instances)
         return instances
 
     def get_filters(self, filters):
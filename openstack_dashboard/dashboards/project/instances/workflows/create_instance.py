@@ -16,6 +16,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import functools
 import json
 import logging
 import operator
@@ -140,7 +141,6 @@ class SetInstanceDetailsAction(workflows.Action):
                               "_launch_details_help.html")
 
     def __init__(self, request, context, *args, **kwargs):
-        self._init_images_cache()
         self.request = request
         self.context = context
         super(SetInstanceDetailsAction, self).__init__(
@@ -159,8 +159,7 @@ class SetInstanceDetailsAction(workflows.Action):
             source_type_choices.append(("volume_id", _("Boot from volume")))
 
             try:
-                if api.nova.extension_supported("BlockDeviceMappingV2Boot",
-                                                request):
+                if self.get_prefetched("block_device_mapping_v2"):
                     source_type_choices.append(
                         ("volume_image_id",
                          _("Boot from image (creates a new volume)")))
@@ -173,14 +172,51 @@ class SetInstanceDetailsAction(workflows.Action):
                  _("Boot from volume snapshot (creates a new volume)")))
         self.fields['source_type'].choices = source_type_choices
 
+    @classmethod
+    def get_prefetch_calls(cls, request, context):
+        calls = [
+            ("flavors", functools.partial(instance_utils.flavor_list,
+                                          request)),
+            ("availability_zones",
+             functools.partial(api.nova.availability_zone_list, request)),
+            ("images", functools.partial(image_utils.get_available_images,
+                                         request, context.get('project_id'),
+                                         {})),
+        ]
+        if base.is_service_enabled(request, 'volume'):
+            calls.append(("block_device_mapping_v2",
+                          functools.partial(api.nova.extension_supported,
+                                            "BlockDeviceMappingV2Boot",
+                                            request)))
+        if (base.is_service_enabled(request, 'volume')
+                or base.is_service_enabled(request, 'volumev2')):
+            available = api.cinder.VOLUME_STATE_AVAILABLE
+            calls.append(("volumes", functools.partial(
+                cinder.volume_list, request,
+                search_opts=dict(status=available, bootable=1),
+                with_transfers=False)))
+            calls.append(("volume_snapshots", functools.partial(
+                cinder.volume_snapshot_list, request,
+                search_opts=dict(status=available))))
+        # The quota usages are only needed to render the help text.
+        if request.method == "GET":
+            calls.append(("usages", functools.partial(
+                api.nova.tenant_absolute_limits, request)))
+        return calls
+
+    def _get_flavors(self):
+        return self.get_prefetched("flavors")
+
+    def _get_available_images(self):
+        return self.get_prefetched("images")
+
     @memoized.memoized_method
     def _get_flavor(self, flavor_id):
         try:
-            # We want to retrieve details for a given flavor,
-            # however flavor_list uses a memoized decorator
-            # so it is used instead of flavor_get to reduce the number
-            # of API calls.
-            flavors = instance_utils.flavor_list(self.request)
+            # We want to retrieve details for a given flavor, however
+            # the flavor list has already been retrieved, so it is used
+            # instead of flavor_get to reduce the number of API calls.
+            flavors = self._get_flavors()
             flavor = [x for x in flavors if x.id == flavor_id][0]
         except IndexError:
             flavor = None
@@ -189,14 +225,10 @@ class SetInstanceDetailsAction(workflows.Action):
     @memoized.memoized_method
     def _get_image(self, image_id):
         try:
-            # We want to retrieve details for a given image,
-            # however get_available_images uses a cache of image list,
-            # so it is used instead of image_get to reduce the number
-            # of API calls.
-            images = image_utils.get_available_images(
-                self.request,
-                self.context.get('project_id'),
-                self._images_cache)
+            # We want to retrieve details for a given image, however
+            # the image list has already been retrieved, so it is used
+            # instead of image_get to reduce the number of API calls.
+            images = self._get_available_images()
             image = [x for x in images if x.id == image_id][0]
         except IndexError:
             image = None
@@ -370,11 +402,14 @@ class SetInstanceDetailsAction(workflows.Action):
         return cleaned_data
 
     def populate_flavor_choices(self, request, context):
-        return instance_utils.flavor_field_data(request, False)
+        flavors = self._get_flavors()
+        if flavors:
+            return instance_utils.sort_flavor_list(request, flavors)
+        return []
 
     def populate_availability_zone_choices(self, request, context):
         try:
-            zones = api.nova.availability_zone_list(request)
+            zones = self.get_prefetched("availability_zones")
         except Exception:
             zones = []
             exceptions.handle(request,
@@ -392,13 +427,13 @@ class SetInstanceDetailsAction(workflows.Action):
     def get_help_text(self, extra_context=None):
         extra = {} if extra_context is None else dict(extra_context)
         try:
-            extra['usages'] = api.nova.tenant_absolute_limits(self.request)
+            extra['usages'] = self.get_prefetched(
+                "usages", functools.partial(api.nova.tenant_absolute_limits,
+                                            self.request))
             extra['usages_json'] = json.dumps(extra['usages'])
-            flavors = json.dumps([f._info for f in
-                                  instance_utils.flavor_list(self.request)])
+            flavors = json.dumps([f._info for f in self._get_flavors()])
             extra['flavors'] = flavors
-            images = image_utils.get_available_images(
-                self.request, self.initial['project_id'], self._images_cache)
+            images = self._get_available_images()
             if images is not None:
                 attrs = [{'id': i.id,
                           'min_disk': getattr(i, 'min_disk', 0),
@@ -412,10 +447,6 @@ class SetInstanceDetailsAction(workflows.Action):
                               _("Unable to retrieve quota information."))
         return super(SetInstanceDetailsAction, self).get_help_text(extra)
 
-    def _init_images_cache(self):
-        if not hasattr(self, '_images_cache'):
-            self._images_cache = {}
-
     def _get_volume_display_name(self, volume):
         if hasattr(volume, "volume_id"):
             vol_type = "snap"
@@ -431,9 +462,7 @@ class SetInstanceDetailsAction(workflows.Action):
 
     def populate_image_id_choices(self, request, context):
         choices = []
-        images = image_utils.get_available_images(request,
-                                                  context.get('project_id'),
-                                                  self._images_cache)
+        images = self._get_available_images()
         for image in images:
             image.bytes = getattr(image, 'virtual_size', None) or image.size
             image.volume_size = max(
@@ -450,9 +479,7 @@ class SetInstanceDetailsAction(workflows.Action):
         return choices
 
     def populate_instance_snapshot_id_choices(self, request, context):
-        images = image_utils.get_available_images(request,
-                                                  context.get('project_id'),
-                                                  self._images_cache)
+        images = self._get_available_images()
         choices = [(image.id, image.name)
                    for image in images
                    if image.properties.get("image_type", '') == "snapshot"]
@@ -468,10 +495,8 @@ class SetInstanceDetailsAction(workflows.Action):
         try:
             if (base.is_service_enabled(request, 'volume')
                     or base.is_service_enabled(request, 'volumev2')):
-                available = api.cinder.VOLUME_STATE_AVAILABLE
                 volumes = [self._get_volume_display_name(v)
-                           for v in cinder.volume_list(self.request,
-                           search_opts=dict(status=available, bootable=1))]
+                           for v in self.get_prefetched("volumes")]
         except Exception:
             exceptions.handle(self.request,
                               _('Unable to retrieve list of volumes.'))
@@ -486,10 +511,8 @@ class SetInstanceDetailsAction(workflows.Action):
         try:
             if (base.is_service_enabled(request, 'volume')
                     or base.is_service_enabled(request, 'volumev2')):
-                available = api.cinder.VOLUME_STATE_AVAILABLE
                 snapshots = [self._get_volume_display_name(s)
-                             for s in cinder.volume_snapshot_list(
-                             self.request, search_opts=dict(status=available))]
+                             for s in self.get_prefetched("volume_snapshots")]
         except Exception:
             exceptions.handle(self.request,
                               _('Unable to retrieve list of volume '
@@ -571,15 +594,24 @@ class SetAccessControlsAction(workflows.Action):
             del self.fields['confirm_admin_pass']
         self.fields['keypair'].required = api.nova.requires_keypair()
 
+    @classmethod
+    def get_prefetch_calls(cls, request, context):
+        return [
+            ("keypairs", functools.partial(instance_utils.keypair_field_data,
+                                           request, True)),
+            ("security_groups",
+             functools.partial(api.network.security_group_list, request)),
+        ]
+
     def populate_keypair_choices(self, request, context):
-        keypairs = instance_utils.keypair_field_data(request, True)
+        keypairs = self.get_prefetched("keypairs")
         if len(keypairs) == 2:
             self.fields['keypair'].initial = keypairs[1][0]
         return keypairs
 
     def populate_groups_choices(self, request, context):
         try:
-            groups = api.network.security_group_list(request)
+            groups = self.get_prefetched("security_groups")
             if base.is_service_enabled(request, 'network'):
                 security_group_list = [(sg.id, sg.name) for sg in groups]
             else:
@@ -733,8 +765,19 @@ class SetNetworkAction(workflows.Action):
         permissions = ('openstack.services.network',)
         help_text = _("Select networks for your instance.")
 
+    @classmethod
+    def get_prefetch_calls(cls, request, context):
+        calls = [("networks",
+                  functools.partial(instance_utils.network_field_data,
+                                    request))]
+        if api.neutron.is_port_profiles_supported():
+            calls.append(("policy_profiles",
+                          functools.partial(api.neutron.profile_list,
+                                            request, 'policy')))
+        return calls
+
     def populate_network_choices(self, request, context):
-        return instance_utils.network_field_data(request)
+        return self.get_prefetched("networks")
 
     def get_policy_profile_choices(self, request):
         profile_choices = [('', _("Select a profile"))]
@@ -745,7 +788,9 @@ class SetNetworkAction(workflows.Action):
     def _get_profiles(self, request, type_p):
         profiles = []
         try:
-            profiles = api.neutron.profile_list(request, type_p)
+            profiles = self.get_prefetched(
+                "%s_profiles" % type_p,
+                functools.partial(api.neutron.profile_list, request, type_p))
         except Exception:
             msg = _('Network Profiles could not be retrieved.')
             exceptions.handle(request, msg)
@@ -793,7 +838,7 @@ class SetAdvancedAction(workflows.Action):
         super(SetAdvancedAction, self).__init__(request, context,
                                                 *args, **kwargs)
         try:
-            if not api.nova.extension_supported("DiskConfig", request):
+            if not self.get_prefetched("disk_config"):
                 del self.fields['disk_config']
             else:
                 # Set our disk_config choices
@@ -804,12 +849,23 @@ class SetAdvancedAction(workflows.Action):
             # workflow (not Resize Instance) and only if the extension
             # is supported.
             if context.get('workflow_slug') != 'launch_instance' or (
-                    not api.nova.extension_supported("ConfigDrive", request)):
+                    not self.get_prefetched("config_drive")):
                 del self.fields['config_drive']
         except Exception:
             exceptions.handle(request, _('Unable to retrieve extensions '
                                          'information.'))
 
+    @classmethod
+    def get_prefetch_calls(cls, request, context):
+        calls = [("disk_config",
+                  functools.partial(api.nova.extension_supported,
+                                    "DiskConfig", request))]
+        if context.get('workflow_slug') == 'launch_instance':
+            calls.append(("config_drive",
+                          functools.partial(api.nova.extension_supported,
+                                            "ConfigDrive", request)))
+        return calls
+
     class Meta(object):
         name = _("Advanced Options")
         help_text_template = ("project/instances/"
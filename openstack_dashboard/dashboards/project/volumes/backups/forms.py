@@ -73,7 +73,7 @@ class RestoreBackupForm(forms.SelfHandlingForm):
         super(RestoreBackupForm, self).__init__(request, *args, **kwargs)
 
         try:
-            volumes = api.cinder.volume_list(request)
+            volumes = api.cinder.volume_list(request, with_transfers=False)
         except Exception:
             msg = _('Unable to lookup volume or backup information.')
             redirect = reverse('horizon:project:volumes:index')
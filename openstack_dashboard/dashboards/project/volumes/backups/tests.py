@@ -65,13 +65,15 @@ class VolumeBackupsViewTests(test.TestCase):
             MultipleTimes().AndReturn(True)
         api.cinder.volume_backup_list(IsA(http.HttpRequest)). \
             AndReturn(vol_backups)
-        api.cinder.volume_list(IsA(http.HttpRequest)). \
+        api.cinder.volume_list(IsA(http.HttpRequest),
+                               with_transfers=False). \
             AndReturn(volumes)
         api.cinder.volume_backup_delete(IsA(http.HttpRequest), backup.id)
 
         api.cinder.volume_backup_list(IsA(http.HttpRequest)). \
             AndReturn(vol_backups)
-        api.cinder.volume_list(IsA(http.HttpRequest)). \
+        api.cinder.volume_list(IsA(http.HttpRequest),
+                               with_transfers=False). \
             AndReturn(volumes)
         self.mox.ReplayAll()
 
@@ -155,7 +157,8 @@ class VolumeBackupsViewTests(test.TestCase):
         backup = self.cinder_volume_backups.first()
         volumes = self.cinder_volumes.list()
 
-        api.cinder.volume_list(IsA(http.HttpRequest)). \
+        api.cinder.volume_list(IsA(http.HttpRequest),
+                               with_transfers=False). \
             AndReturn(volumes)
         api.cinder.volume_backup_restore(IsA(http.HttpRequest),
                                          backup.id,
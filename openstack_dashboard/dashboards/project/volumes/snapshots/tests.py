@@ -118,13 +118,15 @@ class VolumeSnapshotsViewTests(test.TestCase):
             MultipleTimes().AndReturn(True)
         api.cinder.volume_snapshot_list(IsA(http.HttpRequest)). \
             AndReturn(vol_snapshots)
-        api.cinder.volume_list(IsA(http.HttpRequest)). \
+        api.cinder.volume_list(IsA(http.HttpRequest),
+                               with_transfers=False). \
             AndReturn(volumes)
 
         api.cinder.volume_snapshot_delete(IsA(http.HttpRequest), snapshot.id)
         api.cinder.volume_snapshot_list(IsA(http.HttpRequest)). \
             AndReturn([])
-        api.cinder.volume_list(IsA(http.HttpRequest)). \
+        api.cinder.volume_list(IsA(http.HttpRequest),
+                               with_transfers=False). \
             AndReturn(volumes)
         self.mox.ReplayAll()
 
@@ -106,7 +106,8 @@ class SnapshotTab(tabs.TableTab):
         if api.base.is_service_enabled(self.request, 'volume'):
             try:
                 snapshots = api.cinder.volume_snapshot_list(self.request)
-                volumes = api.cinder.volume_list(self.request)
+                volumes = api.cinder.volume_list(self.request,
+                                                 with_transfers=False)
                 volumes = dict((v.id, v) for v in volumes)
             except Exception:
                 snapshots = []
@@ -136,7 +137,8 @@ class BackupsTab(tabs.TableTab, VolumeTableMixIn):
     def get_volume_backups_data(self):
         try:
             backups = api.cinder.volume_backup_list(self.request)
-            volumes = api.cinder.volume_list(self.request)
+            volumes = api.cinder.volume_list(self.request,
+                                             with_transfers=False)
             volumes = dict((v.id, v) for v in volumes)
             for backup in backups:
                 backup.volume = volumes.get(backup.volume_id)
@@ -49,11 +49,13 @@ class VolumeAndSnapshotsTests(test.TestCase):
             IsA(http.HttpRequest), search_opts=None).AndReturn(vol_snaps)
         api.cinder.volume_snapshot_list(IsA(http.HttpRequest)).\
             AndReturn(vol_snaps)
-        api.cinder.volume_list(IsA(http.HttpRequest)).AndReturn(volumes)
+        api.cinder.volume_list(IsA(http.HttpRequest),
+                               with_transfers=False).AndReturn(volumes)
         if backup_supported:
             api.cinder.volume_backup_list(IsA(http.HttpRequest)).\
                 AndReturn(vol_backups)
-            api.cinder.volume_list(IsA(http.HttpRequest)).AndReturn(volumes)
+            api.cinder.volume_list(IsA(http.HttpRequest),
+                                   with_transfers=False).AndReturn(volumes)
         api.cinder.tenant_absolute_limits(IsA(http.HttpRequest)).\
             MultipleTimes().AndReturn(self.cinder_limits['absolute'])
         self.mox.ReplayAll()
@@ -300,7 +300,8 @@ class CreateForm(forms.SelfHandlingForm):
         try:
             available = api.cinder.VOLUME_STATE_AVAILABLE
             volumes = cinder.volume_list(self.request,
-                                         search_opts=dict(status=available))
+                                         search_opts=dict(status=available),
+                                         with_transfers=False)
         except Exception:
             exceptions.handle(request,
                               _('Unable to retrieve list of volumes.'))
@@ -319,7 +319,8 @@ class VolumeViewTests(test.TestCase):
                     'volume_source_type': 'volume_source',
                     'volume_source': volume.id}
 
-        cinder.volume_list(IsA(http.HttpRequest), search_opts=SEARCH_OPTS).\
+        cinder.volume_list(IsA(http.HttpRequest), search_opts=SEARCH_OPTS,
+                           with_transfers=False).\
             AndReturn(self.cinder_volumes.list())
         cinder.volume_type_list(IsA(http.HttpRequest)).\
             AndReturn(self.volume_types.list())
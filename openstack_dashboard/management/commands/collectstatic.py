@@ -0,0 +1,32 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from django.conf import settings
+from django.contrib.staticfiles.management.commands import collectstatic
+
+from horizon.utils import file_discovery
+
+
+class Command(collectstatic.Command):
+    help = (collectstatic.Command.help +
+            " Also writes the STATIC_FILES_MANIFEST cache of the JavaScript"
+            " files and templates discovered by the settings.")
+
+    def handle(self, **options):
+        output = super(Command, self).handle(**options)
+        manifest_path = getattr(settings, 'STATIC_FILES_MANIFEST', None)
+        if manifest_path and not self.dry_run:
+            file_discovery.get_manifest(manifest_path).save()
+            if self.verbosity >= 1:
+                self.stdout.write("Wrote the static files manifest to %s." %
+                                  manifest_path)
+        return output
@@ -0,0 +1,45 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from django.core.management.base import BaseCommand  # noqa
+from django.core.management.base import CommandError  # noqa
+
+from openstack_dashboard.utils import warmup
+
+
+class Command(BaseCommand):
+    args = "[step step ...]"
+    help = ("Does the work of the first requests of a dashboard process "
+            "(building the URLconf, compiling the panel templates, loading "
+            "the policy files and importing the API clients) and reports "
+            "how long each step took. The steps are: %s." %
+            ", ".join(name for name, step in warmup.STEPS))
+
+    def handle(self, *steps, **options):
+        names = [name for name, step in warmup.STEPS]
+        unknown = [step for step in steps if step not in names]
+        if unknown:
+            raise CommandError("Unknown warm-up steps: %s. The steps are: "
+                               "%s." % (", ".join(unknown), ", ".join(names)))
+        results = warmup.warm_up(steps or None)
+        failed = False
+        for name, (elapsed, result) in results.items():
+            if isinstance(result, Exception):
+                failed = True
+                result = "failed: %s" % result
+            elif result is None:
+                result = "done"
+            else:
+                result = "%s loaded" % result
+            self.stdout.write("%-10s %8.3f s  %s" % (name, elapsed, result))
+        if failed:
+            raise CommandError("Some warm-up steps failed.")
@@ -13,8 +13,10 @@
 
 """Policy engine for Horizon"""
 
+import collections
 import logging
 import os.path
+import threading
 
 from django.conf import settings
 from openstack_auth import utils as auth_utils
@@ -33,6 +35,9 @@ CONF = cfg.CONF
 CONF.policy_dirs = []
 
 _ENFORCER = None
+_STATS = collections.Counter()
+_STATS_LOCK = threading.Lock()
+_GENERATION = 0
 _BASE_PATH = getattr(settings, 'POLICY_FILES_PATH', '')
 
 
@@ -59,6 +64,118 @@ def _get_enforcer():
 def reset():
     global _ENFORCER
     _ENFORCER = None
+    with _STATS_LOCK:
+        _STATS.clear()
+    _rules_changed()
+
+
+def load():
+    """Loads the rules of all the policy files.
+
+    They are otherwise loaded when they are first checked. Returns how many
+    policy files were loaded.
+    """
+    enforcers = _get_enforcer()
+    for enforcer in enforcers.values():
+        enforcer.load_rules()
+    return len(enforcers)
+
+
+def _rules_changed():
+    # Decisions made with the previous rules are forgotten.
+    global _GENERATION
+    _GENERATION += 1
+
+
+def get_stats():
+    """Returns the decision cache counters, for debugging.
+
+    ``hits`` and ``misses`` count the decisions served from and added to
+    the per-request caches, ``reloads`` the policy files (re)loaded because
+    their modification time changed.
+    """
+    with _STATS_LOCK:
+        stats = dict((key, _STATS[key])
+                     for key in ('hits', 'misses', 'reloads'))
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_rate'] = float(stats['hits']) / lookups if lookups else 0.0
+    return stats
+
+
+def _count(key):
+    with _STATS_LOCK:
+        _STATS[key] += 1
+
+
+class _RequestPolicy(object):
+    """The policy state kept for the lifetime of a single request.
+
+    It holds the user and credentials, so they are only built once, the
+    policy scopes whose files have been checked for changes and the
+    decisions made so far.
+    """
+
+    def __init__(self, request):
+        self.user = auth_utils.get_user(request)
+        self.credentials = _user_to_credentials(request, self.user)
+        self.loaded = set()
+        self.decisions = {}
+        self.generation = _GENERATION
+
+    def get_decisions(self):
+        if self.generation != _GENERATION:
+            self.decisions.clear()
+            self.generation = _GENERATION
+        return self.decisions
+
+    @classmethod
+    def get(cls, request):
+        state = getattr(request, '_policy_state', None)
+        if not isinstance(state, cls):
+            state = cls(request)
+            try:
+                request._policy_state = state
+            except AttributeError:
+                pass
+        return state
+
+    def get_rules(self, enforcer):
+        """Returns the rules of ``enforcer``.
+
+        The policy file is reloaded if its modification time changed, which
+        is only checked the first time an enforcer is used during the
+        request.
+        """
+        if enforcer not in self.loaded:
+            rules = enforcer.rules
+            enforcer.load_rules()
+            if enforcer.rules is not rules:
+                _count('reloads')
+                if rules:
+                    _rules_changed()
+            self.loaded.add(enforcer)
+        return enforcer.rules
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _enforce(rules, rule, target, credentials, enforcer):
+    # This is what Enforcer.enforce() does, without checking the policy
+    # file for changes on every call.
+    if not rules:
+        # No rules to reference means we're going to fail closed
+        return False
+    try:
+        return rules[rule](target, credentials, enforcer)
+    except KeyError:
+        LOG.debug('Rule [%s] does not exist', rule)
+        return False
 
 
 def check(actions, request, target=None):
@@ -101,7 +218,8 @@ def check(actions, request, target=None):
 
     if target is None:
         target = {}
-    user = auth_utils.get_user(request)
+    state = _RequestPolicy.get(request)
+    user = state.user
 
     # Several service policy engines default to a project id check for
     # ownership. Since the user is already scoped to a project, if a
@@ -122,23 +240,37 @@ def check(actions, request, target=None):
     if target.get('domain_id') is None:
         target['domain_id'] = user.domain_id
 
-    credentials = _user_to_credentials(request, user)
+    decisions = state.get_decisions()
+    key = (_freeze(actions), _freeze(target))
+    try:
+        result = decisions[key]
+    except KeyError:
+        _count('misses')
+        result = decisions[key] = _check(state, actions, target)
+    except TypeError:
+        # Some part of the target can't be used in a cache key.
+        result = _check(state, actions, target)
+    else:
+        _count('hits')
+    return result
+
 
+def _check(state, actions, target):
+    credentials = state.credentials
     enforcer = _get_enforcer()
 
     for action in actions:
         scope, action = action[0], action[1]
         if scope in enforcer:
+            rules = state.get_rules(enforcer[scope])
             # if any check fails return failure
-            if not enforcer[scope].enforce(action, target, credentials):
+            if not _enforce(rules, action, target, credentials,
+                            enforcer[scope]):
                 # to match service implementations, if a rule is not found,
                 # use the default rule for that service policy
-                #
-                # waiting to make the check because the first call to
-                # enforce loads the rules
-                if action not in enforcer[scope].rules:
-                    if not enforcer[scope].enforce('default',
-                                                   target, credentials):
+                if action not in rules:
+                    if not _enforce(rules, 'default', target, credentials,
+                                    enforcer[scope]):
                         return False
                 else:
                     return False
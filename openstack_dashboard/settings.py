@@ -26,6 +26,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from openstack_dashboard import exceptions
 from openstack_dashboard.static_settings import find_static_files  # noqa
+from openstack_dashboard.static_settings import get_static_files_manifest  # noqa
 from openstack_dashboard.static_settings import get_staticfiles_dirs  # noqa
 
 
@@ -76,6 +77,10 @@ HORIZON_CONFIG = {
 # See documentation for deployment considerations.
 HORIZON_IMAGES_ALLOW_UPLOAD = True
 
+# The number of image uploads that are sent to glance at the same time by
+# every Horizon server process. Further uploads wait for a free worker.
+HORIZON_IMAGES_UPLOAD_WORKERS = 4
+
 # The OPENSTACK_IMAGE_BACKEND settings can be used to customize features
 # in the OpenStack Dashboard related to the Image service, such as the list
 # of supported image formats.
@@ -186,6 +191,11 @@ SESSION_TIMEOUT = 1800
 # performance of the infrastructure.
 TOKEN_TIMEOUT_MARGIN = 10
 
+# The maximum number of worker threads used to issue independent API calls
+# concurrently while handling a single request. Set to 1 to disable
+# concurrency.
+CONCURRENT_API_WORKERS = 10
+
 # When using cookie-based sessions, log error when the session cookie exceeds
 # the following size (common browsers drop cookies above a certain size):
 SESSION_COOKIE_MAX_SIZE = 4093
@@ -261,6 +271,16 @@ SECURITY_GROUP_RULES = {
 
 ADD_INSTALLED_APPS = []
 
+# Whether the WSGI script builds the URLconf, compiles the templates, loads
+# the policy files and imports the API clients when it's loaded, rather than
+# each process doing so on its first requests.
+WSGI_WARM_UP = False
+
+# The static files found when loading the settings are cached in this file,
+# which is written by the collectstatic command. None disables the cache.
+STATIC_FILES_MANIFEST = os.path.join(ROOT_PATH, 'local',
+                                     '.static_files_manifest')
+
 # directory for custom theme, set as default.
 # It can be overridden in local_settings.py
 DEFAULT_THEME_PATH = 'themes/default'
@@ -325,7 +345,8 @@ if os.path.exists(os.path.join(CUSTOM_THEME, 'img')):
 
 # populate HORIZON_CONFIG with auto-discovered JavaScript sources, mock files,
 # specs files and external templates.
-find_static_files(HORIZON_CONFIG)
+_static_files_manifest = get_static_files_manifest(STATIC_FILES_MANIFEST)
+find_static_files(HORIZON_CONFIG, _static_files_manifest)
 
 # Load the pluggable dashboard settings
 import openstack_dashboard.enabled
@@ -340,6 +361,7 @@ settings.update_dashboards(
     ],
     HORIZON_CONFIG,
     INSTALLED_APPS,
+    static_files_manifest=_static_files_manifest,
 )
 INSTALLED_APPS[0:0] = ADD_INSTALLED_APPS
 
@@ -368,6 +390,15 @@ COMPRESS_OFFLINE_CONTEXT = {
 if DEBUG:
     logging.basicConfig(level=logging.DEBUG)
 
+# Keep the templates compiled by the warm-up in memory, unless debugging or
+# the template loaders are configured already.
+if WSGI_WARM_UP and not DEBUG and not any(
+        isinstance(template_loader, (list, tuple))
+        for template_loader in TEMPLATE_LOADERS):
+    TEMPLATE_LOADERS = (
+        ('django.template.loaders.cached.Loader', TEMPLATE_LOADERS),
+    )
+
 # during django reloads and an active user is logged in, the monkey
 # patch below will not otherwise be applied in time - resulting in developers
 # appearing to be logged out.  In typical production deployments this section
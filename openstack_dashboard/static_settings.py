@@ -139,7 +139,18 @@ def get_staticfiles_dirs(webroot='/'):
     return STATICFILES_DIRS
 
 
-def find_static_files(HORIZON_CONFIG):
+def get_static_files_manifest(manifest_path):
+    """Returns the manifest of static files kept at ``manifest_path``.
+
+    Returns ``None`` (so that the static files are always discovered) if
+    ``manifest_path`` is ``None``.
+    """
+    if manifest_path is None:
+        return None
+    return file_discovery.get_manifest(manifest_path)
+
+
+def find_static_files(HORIZON_CONFIG, manifest=None):
     import horizon
     import openstack_dashboard
     os_dashboard_home_dir = openstack_dashboard.__path__[0]
@@ -149,7 +160,8 @@ def find_static_files(HORIZON_CONFIG):
     # leading "/"
     file_discovery.populate_horizon_config(
         HORIZON_CONFIG,
-        os.path.join(horizon_home_dir, 'static/')
+        os.path.join(horizon_home_dir, 'static/'),
+        manifest=manifest
     )
 
     # filter out non-angular javascript code and lib
@@ -161,5 +173,6 @@ def find_static_files(HORIZON_CONFIG):
     file_discovery.populate_horizon_config(
         HORIZON_CONFIG,
         os.path.join(os_dashboard_home_dir, 'static/'),
-        sub_path='app/'
+        sub_path='app/',
+        manifest=manifest
     )
@@ -19,6 +19,7 @@
 from __future__ import absolute_import
 
 from django.conf import settings
+import mock
 
 from horizon import exceptions
 
@@ -241,6 +242,55 @@ class ApiHelperTests(test.TestCase):
             url = api_base.url_for(self.request, 'image')
 
 
+class EndpointIndexTests(test.TestCase):
+    def _get_request(self, catalog, token_id='token'):
+        request = mock.Mock()
+        request.user.service_catalog = catalog
+        request.user.services_region = 'RegionOne'
+        request.user.token.id = token_id
+        request.user._endpoint_index = None
+        return request
+
+    def test_lookups(self):
+        index = api_base.EndpointIndex(self.service_catalog)
+
+        self.assertEqual('http://public.nova2.example.com:8774/v2',
+                         index.url_for('compute', 'RegionTwo', 'publicURL'))
+        self.assertIsNone(index.url_for('image', 'RegionTwo', 'publicURL'))
+        self.assertIsNone(index.url_for('notAnApi', 'RegionOne',
+                                        'publicURL'))
+        self.assertTrue(index.is_enabled('compute', 'RegionTwo'))
+        self.assertTrue(index.is_enabled('identity', 'bogus_value'))
+        self.assertFalse(index.is_enabled('image', 'RegionTwo'))
+        self.assertFalse(index.is_enabled('notAnApi', 'RegionOne'))
+
+    def test_fallback_endpoint_type(self):
+        index = api_base.EndpointIndex(self.service_catalog)
+
+        self.assertEqual('http://admin.glance.example.com:9292/v1',
+                         index.url_for('image', 'RegionOne', 'bogusURL',
+                                       'adminURL'))
+
+    def test_index_cached_per_token(self):
+        request = self._get_request(self.service_catalog)
+
+        index = api_base.get_endpoint_index(request)
+        self.assertIs(index, api_base.get_endpoint_index(request))
+
+        request.user.token.id = 'other-token'
+        self.assertIsNot(index, api_base.get_endpoint_index(request))
+
+    def test_url_for_scans_catalog_once(self):
+        request = self._get_request(self.service_catalog)
+
+        with mock.patch.object(api_base, 'get_url_for_service',
+                               wraps=api_base.get_url_for_service) as get_url:
+            for i in range(3):
+                api_base.url_for(request, 'compute')
+                api_base.is_service_enabled(request, 'compute')
+        self.assertEqual(1, get_url.call_count)
+
+
 class QuotaSetTests(test.TestCase):
 
     def test_quotaset_add_with_plus(self):
@@ -0,0 +1,124 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+import json
+import threading
+
+from django.test.utils import override_settings
+import mock
+
+from openstack_dashboard.api.rest import batch
+from openstack_dashboard.api.rest import keystone
+from openstack_dashboard.test import helpers as test
+
+
+class BatchRestTestCase(test.TestCase):
+    def batch_request(self, calls):
+        request = self.factory.post('/api/batch/', json.dumps(calls),
+                                    content_type='application/json',
+                                    HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        request.user = mock.Mock(**{'is_authenticated.return_value': True})
+        return request
+
+    @mock.patch.object(keystone.api, 'keystone')
+    def test_batch(self, kc):
+        kc.get_version.return_value = '3'
+        kc.user_get.return_value.to_dict.return_value = {'name': 'Ni!'}
+        kc.domain_delete.side_effect = keystone.rest_utils.AjaxError(
+            409, 'in use')
+        request = self.batch_request([
+            {'path': '/api/keystone/version/'},
+            {'path': 'keystone/users/abc123', 'query': {'admin': 'true'}},
+            {'path': '/api/keystone/domains/', 'method': 'DELETE',
+             'body': ['id1']},
+            {'path': '/api/keystone/users/', 'method': 'PUT'},
+            {'path': '/api/nothing/here/'},
+        ])
+
+        response = batch.Batch().post(request)
+        self.assertStatusCode(response, 200)
+        self.assertEqual([
+            {'status': 200, 'body': {'version': '3'}},
+            {'status': 200, 'body': {'name': 'Ni!'}},
+            {'status': 409,
+             'body': {'id1': {'status': 409, 'error': 'in use'}}},
+            {'status': 405, 'body': ''},
+            {'status': 404, 'body': 'not found: /api/nothing/here/'},
+        ], json.loads(response.content))
+
+        sub_request = kc.user_get.call_args[0][0]
+        self.assertIsNot(request, sub_request)
+        self.assertIs(request.user, sub_request.user)
+        self.assertEqual('true', sub_request.GET['admin'])
+        kc.user_get.assert_called_once_with(sub_request, 'abc123')
+        self.assertEqual(['id1'], kc.domain_delete.call_args[0][0].DATA)
+
+    def test_batch_not_nested(self):
+        request = self.batch_request([{'path': '/api/batch/',
+                                       'method': 'POST', 'body': []}])
+        response = batch.Batch().post(request)
+        self.assertStatusCode(response, 200)
+        self.assertEqual([{'status': 400,
+                           'body': 'batch requests cannot be nested'}],
+                         json.loads(response.content))
+
+    def test_batch_requires_list(self):
+        response = batch.Batch().post(self.batch_request({'path': 'x'}))
+        self.assertStatusCode(response, 400)
+
+    @mock.patch.object(batch, 'MAX_REQUESTS', 1)
+    def test_batch_limit(self):
+        request = self.batch_request([{'path': 'keystone/version/'}] * 2)
+        response = batch.Batch().post(request)
+        self.assertStatusCode(response, 400)
+
+    @mock.patch.object(batch.rest_utils, 'STREAMING_THRESHOLD', 2)
+    @mock.patch.object(keystone.api, 'keystone')
+    def test_batch_streamed_response(self, kc):
+        role = mock.Mock(**{'to_dict.return_value': {'name': 'admin'}})
+        kc.role_list.return_value = [role, role]
+        request = self.batch_request([{'path': 'keystone/roles/'}])
+        response = batch.Batch().post(request)
+        self.assertEqual([{'status': 200,
+                           'body': {'items': [{'name': 'admin'},
+                                              {'name': 'admin'}]}}],
+                         json.loads(response.content))
+
+    def test_batch_ignores_validators(self):
+        request = self.batch_request([{'path': 'settings/'}])
+        request.META['HTTP_IF_NONE_MATCH'] = '*'
+        response = batch.Batch().post(request)
+        self.assertEqual(200, json.loads(response.content)[0]['status'])
+
+    @override_settings(CONCURRENT_API_WORKERS=2)
+    @mock.patch.object(keystone.api, 'keystone')
+    def test_batch_changes_in_request_thread(self, kc):
+        threads = {'get': [], 'delete': []}
+
+        def record(name):
+            def call(*args, **kwargs):
+                threads[name].append(threading.current_thread())
+            return call
+        kc.get_version.side_effect = record('get')
+        kc.domain_delete.side_effect = record('delete')
+        request = self.batch_request([
+            {'path': '/api/keystone/version/'},
+            {'path': '/api/keystone/domains/', 'method': 'DELETE',
+             'body': ['id1']},
+            {'path': '/api/keystone/version/'},
+        ])
+
+        response = batch.Batch().post(request)
+        self.assertStatusCode(response, 200)
+        self.assertEqual([200, 204, 200],
+                         [r['status'] for r in json.loads(response.content)])
+        self.assertEqual([threading.current_thread()], threads['delete'])
+        self.assertNotIn(threading.current_thread(), threads['get'])
@@ -16,6 +16,7 @@ from django.test.utils import override_settings
 import six
 
 import cinderclient as cinder_client
+from cinderclient.v2 import volumes
 
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
@@ -40,6 +41,43 @@ class CinderApiTests(test.APITestCase):
         # No assertions are necessary. Verification is handled by mox.
         api.cinder.volume_list(self.request, search_opts=search_opts)
 
+    def test_volume_list_without_transfers(self):
+        volumes = self.cinder_volumes.list()
+        cinderclient = self.stub_cinderclient()
+        cinderclient.volumes = self.mox.CreateMockAnything()
+        cinderclient.volumes.list(search_opts=None).AndReturn(volumes)
+        self.mox.ReplayAll()
+
+        ret_val = api.cinder.volume_list(self.request, with_transfers=False)
+        self.assertEqual(len(volumes), len(ret_val))
+        for volume in ret_val:
+            self.assertIsNone(volume.transfer)
+
+    @test.create_stubs({api.nova: ('server_get',)})
+    def test_volume_get(self):
+        server = self.servers.first()
+        transfer = self.cinder_volume_transfers.first()
+        volume = volumes.Volume(
+            volumes.VolumeManager(None),
+            {'id': transfer.volume_id,
+             'status': 'awaiting-transfer',
+             'attachments': [{'id': '1', 'server_id': server.id},
+                             {'id': '2', 'server_id': server.id},
+                             {'id': '3'}]})
+        cinderclient = self.stub_cinderclient()
+        cinderclient.volumes = self.mox.CreateMockAnything()
+        cinderclient.volumes.get(volume.id).AndReturn(volume)
+        cinderclient.transfers = self.mox.CreateMockAnything()
+        cinderclient.transfers.list(detailed=True, search_opts=None) \
+            .AndReturn(self.cinder_volume_transfers.list())
+        api.nova.server_get(self.request, server.id).AndReturn(server)
+        self.mox.ReplayAll()
+
+        ret_val = api.cinder.volume_get(self.request, volume.id)
+        self.assertEqual([server.name, server.name, 'Unknown instance'],
+                         [a['instance_name'] for a in ret_val.attachments])
+        self.assertEqual(transfer.id, ret_val.transfer.id)
+
     def test_volume_snapshot_list(self):
         search_opts = {'all_tenants': 1}
         volume_snapshots = self.cinder_volume_snapshots.list()
@@ -0,0 +1,145 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from __future__ import absolute_import
+
+import mock
+import requests
+
+from horizon.utils import call_profiler
+
+from openstack_dashboard import api
+from openstack_dashboard.api import connection_pool
+from openstack_dashboard.test import helpers as test
+
+
+class ConnectionPoolTests(test.APITestCase):
+    def setUp(self):
+        super(ConnectionPoolTests, self).setUp()
+        connection_pool.clear()
+        self.addCleanup(connection_pool.clear)
+
+    def test_adapter_shared_per_endpoint(self):
+        adapter = connection_pool.get_adapter('http://nova:8774/v2/1')
+
+        self.assertIs(adapter,
+                      connection_pool.get_adapter('http://nova:8774/v2/2'))
+        self.assertIsNot(adapter,
+                         connection_pool.get_adapter('http://nova:8775/v2/1'))
+        self.assertIsNot(adapter,
+                         connection_pool.get_adapter('http://nova:8774/v2/1',
+                                                     insecure=True))
+        self.assertIsNot(adapter,
+                         connection_pool.get_adapter('http://nova:8774/v2/1',
+                                                     cacert='/ca.pem'))
+
+    def test_session_survives_close(self):
+        url = 'https://glance:9292/v1'
+        session = connection_pool.get_session(url, cacert='/ca.pem')
+        adapter = session.get_adapter(url)
+        session.close()
+
+        self.assertEqual('/ca.pem', session.verify)
+        self.assertIsInstance(adapter, connection_pool.PooledHTTPAdapter)
+        self.assertIs(adapter,
+                      connection_pool.get_session(
+                          url, cacert='/ca.pem').get_adapter(url))
+
+    @test.update_settings(OPENSTACK_CONNECTION_POOL={'enabled': False})
+    def test_disabled(self):
+        url = 'http://glance:9292/v1'
+        session = connection_pool.get_session(url)
+
+        self.assertIsNone(connection_pool.get_adapter(url))
+        self.assertNotIsInstance(session.get_adapter(url),
+                                 connection_pool.PooledHTTPAdapter)
+
+    def test_clients_share_adapters(self):
+        nova_url = api.base.url_for(self.request, 'compute')
+        image_url = api.base.url_for(self.request, 'image')
+        swift_url = api.base.url_for(self.request, 'object-store')
+        volume_url = api.base.url_for(self.request, 'volumev2')
+        network_url = api.base.url_for(self.request, 'network')
+        heat_url = api.base.url_for(self.request, 'orchestration')
+
+        nova = self._original_novaclient(self.request)
+        glance = self._original_glanceclient(self.request)
+        swift = api.swift.swift_api(self.request)
+        swift_conn = swift.http_connection()[1]
+        cinder = self._original_cinderclient(self.request)
+        neutron = self._original_neutronclient(self.request)
+        heat = self._original_heatclient(self.request)
+
+        for url, session in ((nova_url, nova.client.session.session),
+                             (image_url, glance.http_client.session),
+                             (swift_url, swift_conn.request_session),
+                             (volume_url, cinder.client.session.session),
+                             (network_url, neutron.httpclient.session.session),
+                             (heat_url, heat.http_client.session.session)):
+            self.assertIs(connection_pool.get_adapter(url),
+                          session.get_adapter(url))
+        # The token is still the one of the request.
+        for client in (nova.client, cinder.client, neutron.httpclient,
+                       heat.http_client):
+            self.assertEqual(self.request.user.token.id, client.auth.token)
+
+    def test_session_client_request(self):
+        url = api.base.url_for(self.request, 'compute')
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"flavors": []}'
+        nova = self._original_novaclient(self.request)
+
+        with mock.patch.object(connection_pool.PooledHTTPAdapter, 'send',
+                               return_value=response) as send:
+            self.assertEqual([], nova.flavors.list(detailed=False))
+
+        sent = send.call_args[0][0]
+        self.assertEqual(url + '/flavors', sent.url)
+        self.assertEqual(self.request.user.token.id,
+                         sent.headers['X-Auth-Token'])
+
+    @mock.patch.object(requests.adapters.HTTPAdapter, 'send')
+    def test_profiled_send(self, send):
+        url = api.base.url_for(self.request, 'compute') + '/servers/1'
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Length'] = '42'
+        response._content = b'{}'
+        send.return_value = response
+        adapter = connection_pool.ProfiledHTTPAdapter()
+        prepared = requests.Request('GET', url).prepare()
+
+        # Nothing is recorded unless the calls are being profiled.
+        self.assertIs(response, adapter.send(prepared))
+        with self.settings(API_CALL_PROFILER={'enabled': True}):
+            profile = call_profiler.start(self.request)
+        try:
+            self.assertIs(response, adapter.send(prepared, stream=True))
+            self.assertIs(response, adapter.send(prepared))
+            send.side_effect = requests.ConnectionError
+            self.assertRaises(requests.ConnectionError, adapter.send,
+                              requests.Request('POST', 'http://ks:5000/v3')
+                              .prepare())
+        finally:
+            call_profiler.finish()
+
+        streamed, first, second = profile.records
+        # The size of a streamed response is its Content-Length.
+        self.assertEqual(42, streamed.bytes)
+        self.assertEqual(('compute', 'GET', url, 200, 2),
+                         (first.service, first.method, first.url,
+                          first.status, first.bytes))
+        self.assertEqual('/v2/servers/{id}', first.url_template)
+        self.assertEqual(('ks:5000', 'POST', None, None),
+                         (second.service, second.method, second.status,
+                          second.bytes))
@@ -19,6 +19,13 @@ from neutronclient.v2_0.client import Client as neutronclient  # noqa
 
 
 class FwaasApiTests(test.APITestCase):
+    def _referenced_ids(self, items, key):
+        ids = set()
+        for item in items:
+            value = item[key]
+            ids.update(value if isinstance(value, list) else [value])
+        return sorted(i for i in ids if i)
+
     @test.create_stubs({neutronclient: ('create_firewall_rule',)})
     def test_rule_create(self):
         rule1 = self.fw_rules.first()
@@ -62,7 +69,10 @@ class FwaasApiTests(test.APITestCase):
         api_policies = {'firewall_policies': self.api_fw_policies.list()}
 
         neutronclient.list_firewall_rules().AndReturn(api_rules)
-        neutronclient.list_firewall_policies().AndReturn(api_policies)
+        neutronclient.list_firewall_policies(
+            id=self._referenced_ids(api_rules['firewall_rules'],
+                                    'firewall_policy_id')) \
+            .AndReturn(api_policies)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.rule_list(self.request)
@@ -82,7 +92,10 @@ class FwaasApiTests(test.APITestCase):
             shared=False).AndReturn({'firewall_rules': []})
         neutronclient.list_firewall_rules(shared=True) \
             .AndReturn(api_rules)
-        neutronclient.list_firewall_policies().AndReturn(api_policies)
+        neutronclient.list_firewall_policies(
+            id=self._referenced_ids(api_rules['firewall_rules'],
+                                    'firewall_policy_id')) \
+            .AndReturn(api_policies)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.rule_list_for_tenant(self.request, tenant_id)
@@ -183,7 +196,10 @@ class FwaasApiTests(test.APITestCase):
         rules_dict = {'firewall_rules': self.api_fw_rules.list()}
 
         neutronclient.list_firewall_policies().AndReturn(policies_dict)
-        neutronclient.list_firewall_rules().AndReturn(rules_dict)
+        neutronclient.list_firewall_rules(
+            id=self._referenced_ids(policies_dict['firewall_policies'],
+                                    'firewall_rules')) \
+            .AndReturn(rules_dict)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.policy_list(self.request)
@@ -203,7 +219,10 @@ class FwaasApiTests(test.APITestCase):
             shared=False).AndReturn({'firewall_policies': []})
         neutronclient.list_firewall_policies(
             shared=True).AndReturn(policies_dict)
-        neutronclient.list_firewall_rules().AndReturn(rules_dict)
+        neutronclient.list_firewall_rules(
+            id=self._referenced_ids(policies_dict['firewall_policies'],
+                                    'firewall_rules')) \
+            .AndReturn(rules_dict)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.policy_list_for_tenant(self.request, tenant_id)
@@ -356,7 +375,10 @@ class FwaasApiTests(test.APITestCase):
         policies_dict = {'firewall_policies': self.api_fw_policies.list()}
 
         neutronclient.list_firewalls().AndReturn(firewalls_dict)
-        neutronclient.list_firewall_policies().AndReturn(policies_dict)
+        neutronclient.list_firewall_policies(
+            id=self._referenced_ids(firewalls_dict['firewalls'],
+                                    'firewall_policy_id')) \
+            .AndReturn(policies_dict)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.firewall_list(self.request)
@@ -373,7 +395,10 @@ class FwaasApiTests(test.APITestCase):
 
         neutronclient.list_firewalls(tenant_id=tenant_id) \
             .AndReturn(firewalls_dict)
-        neutronclient.list_firewall_policies().AndReturn(policies_dict)
+        neutronclient.list_firewall_policies(
+            id=self._referenced_ids(firewalls_dict['firewalls'],
+                                    'firewall_policy_id')) \
+            .AndReturn(policies_dict)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.firewall_list_for_tenant(self.request, tenant_id)
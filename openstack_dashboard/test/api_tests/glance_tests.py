@@ -17,8 +17,14 @@
 #    under the License.
 
 from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test.utils import override_settings
 
+from glanceclient.common import exceptions as glance_exceptions
+from mox3.mox import IgnoreArg  # noqa
+
+from horizon.utils import concurrency
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 
@@ -247,3 +253,129 @@ class GlanceApiTests(test.APITestCase):
         self.mox.ReplayAll()
         image = api.glance.image_get(self.request, 'empty')
         self.assertIsNone(image.name)
+
+    def test_image_list_by_ids(self):
+        images = self.images.list()[:2]
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        glanceclient.images.get(images[0].id).AndReturn(images[0])
+        glanceclient.images.get('unknown') \
+            .AndRaise(glance_exceptions.NotFound())
+        glanceclient.images.get('private') \
+            .AndRaise(glance_exceptions.Forbidden())
+        glanceclient.images.get(images[1].id).AndReturn(images[1])
+        self.mox.ReplayAll()
+
+        ret_val = api.glance.image_list_by_ids(
+            self.request, (images[0].id, 'unknown', 'private', images[1].id))
+        self.assertEqual(images, ret_val)
+
+    def _upload_manager(self):
+        manager = api.glance.ImageUploadManager()
+        # Run the upload in the test's thread.
+        manager._get_pool = lambda: concurrency.ThreadPool(1)
+        return manager
+
+    def test_image_upload_manager(self):
+        image = self.images.first()
+        data = SimpleUploadedFile('image.img', b'x' * 1024)
+
+        def read_data(image_id, data=None, purge_props=None):
+            while data.read(256):
+                pass
+
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        glanceclient.images.update(image.id, data=IgnoreArg(),
+                                   purge_props=False) \
+            .WithSideEffects(read_data).AndReturn(image)
+        self.mox.ReplayAll()
+
+        manager = self._upload_manager()
+        manager.submit(self.request, image.id, data)
+        status = manager.get_status(image.id)
+        self.assertEqual('active', status['status'])
+        self.assertEqual(1024, status['bytes_uploaded'])
+        self.assertEqual(1024, status['total_bytes'])
+        self.assertEqual(100, status['progress'])
+
+    def test_image_upload_manager_failure(self):
+        image = self.images.first()
+        data = SimpleUploadedFile('image.img', b'x' * 1024)
+
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        glanceclient.images.update(image.id, data=IgnoreArg(),
+                                   purge_props=False) \
+            .AndRaise(self.exceptions.glance)
+        glanceclient.images.delete(image.id)
+        self.mox.ReplayAll()
+
+        manager = self._upload_manager()
+        manager.submit(self.request, image.id, data)
+        status = manager.get_status(image.id)
+        self.assertEqual('error', status['status'])
+        self.assertIsNotNone(status['error'])
+
+    def _stub_namespace_list(self, namespaces, resource_type):
+        limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
+        glanceclient = self.stub_glanceclient()
+        glanceclient.metadefs_namespace.list(
+            page_size=limit, limit=limit,
+            filters={'resource_types': [resource_type]},
+            sort_dir='asc', sort_key='namespace') \
+            .AndReturn(iter(namespaces))
+        return glanceclient
+
+    def test_metadefs_namespace_full_list(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        namespaces = self.metadata_defs.list()[:2]
+        resource_type = 'OS::Nova::Flavor'
+
+        glanceclient = self.stub_glanceclient()
+        glanceclient.metadefs_namespace = self.mox.CreateMockAnything()
+        for i in range(2):
+            self._stub_namespace_list(namespaces, resource_type)
+            if i == 0:
+                # The details are only fetched the first time.
+                for namespace in namespaces:
+                    glanceclient.metadefs_namespace.get(
+                        namespace.namespace, resource_type=resource_type) \
+                        .AndReturn(namespace)
+        self.mox.ReplayAll()
+
+        for i in range(2):
+            ret_val, has_more, has_prev = \
+                api.glance.metadefs_namespace_full_list(
+                    self.request, resource_type, filters={})
+            self.assertEqual([dict(namespace) for namespace in namespaces],
+                             ret_val)
+            self.assertFalse(has_more)
+            self.assertFalse(has_prev)
+
+    def test_metadefs_namespace_update_invalidates_cache(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        namespace = self.metadata_defs.first()
+        resource_type = 'OS::Nova::Flavor'
+
+        glanceclient = self.stub_glanceclient()
+        glanceclient.metadefs_namespace = self.mox.CreateMockAnything()
+        glanceclient.metadefs_namespace.get(
+            namespace.namespace, resource_type=resource_type) \
+            .AndReturn(namespace)
+        glanceclient.metadefs_namespace.update(
+            namespace.namespace, protected=True).AndReturn(namespace)
+        glanceclient.metadefs_namespace.get(
+            namespace.namespace, resource_type=resource_type) \
+            .AndReturn(namespace)
+        self.mox.ReplayAll()
+
+        for i in range(2):
+            api.glance.metadefs_namespace_get_many(
+                self.request, [namespace.namespace], resource_type)
+        api.glance.metadefs_namespace_update(
+            self.request, namespace.namespace, protected=True)
+        api.glance.metadefs_namespace_get_many(
+            self.request, [namespace.namespace], resource_type)
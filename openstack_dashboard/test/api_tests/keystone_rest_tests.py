@@ -18,6 +18,7 @@ from django.conf import settings
 from oslo_serialization import jsonutils
 
 from openstack_dashboard.api.rest import keystone
+from openstack_dashboard.api.rest import utils as rest_utils
 from openstack_dashboard.test import helpers as test
 
 
@@ -168,6 +169,23 @@ class KeystoneRestTestCase(test.TestCase):
             mock.call(request, 'id3'),
         ])
 
+    @mock.patch.object(keystone.api, 'keystone')
+    def test_user_delete_many_partial_failure(self, kc):
+        request = self.mock_rest_request(body='''
+            ["id1", "id2", "current_id"]
+        ''', **{'user.id': 'current_id'})
+        kc.user_delete.side_effect = [None, rest_utils.AjaxError(403, 'no')]
+
+        response = keystone.Users().delete(request)
+        self.assertStatusCode(response, 403)
+        self.assertEqual({'id1': {'status': 204, 'error': None},
+                          'id2': {'status': 403, 'error': 'no'}},
+                         jsonutils.loads(response.content))
+        kc.user_delete.assert_has_calls([
+            mock.call(request, 'id1'),
+            mock.call(request, 'id2'),
+        ])
+
     @mock.patch.object(keystone.api, 'keystone')
     def test_user_delete(self, kc):
         request = self.mock_rest_request()
@@ -635,6 +653,28 @@ class KeystoneRestTestCase(test.TestCase):
                                   sort_keys=settings.DEBUG)
         self.assertEqual(content, response.content)
 
+    def test_service_catalog_not_modified(self):
+        request = self.mock_rest_request(method='GET', META={}, **{
+            'user.token.id': 'token1',
+            'user.service_catalog': [{'type': 'compute'}]})
+        response = keystone.ServiceCatalog().get(request)
+        self.assertStatusCode(response, 200)
+        etag = response['ETag']
+
+        request = self.mock_rest_request(
+            method='GET', META={'HTTP_IF_NONE_MATCH': etag},
+            **{'user.token.id': 'token1'})
+        response = keystone.ServiceCatalog().get(request)
+        self.assertStatusCode(response, 304)
+
+        request = self.mock_rest_request(
+            method='GET', META={'HTTP_IF_NONE_MATCH': etag}, **{
+                'user.token.id': 'token2',
+                'user.service_catalog': [{'type': 'compute'}]})
+        response = keystone.ServiceCatalog().get(request)
+        self.assertStatusCode(response, 200)
+        self.assertNotEqual(etag, response['ETag'])
+
     #
     # User Session
     #
@@ -19,9 +19,13 @@
 from __future__ import absolute_import
 
 from keystoneclient.v2_0 import client as keystone_client
+import mock
 import six
 
+from horizon import exceptions
+
 from openstack_dashboard import api
+from openstack_dashboard import policy
 from openstack_dashboard.test import helpers as test
 
 
@@ -42,6 +46,47 @@ class ClientConnectionTests(test.TestCase):
         self.conn = FakeConnection()
 
 
+class AdminClientPolicyTests(test.APITestCase):
+    def setUp(self):
+        super(AdminClientPolicyTests, self).setUp()
+        self.conn = FakeConnection()
+
+    def _cache_admin_client(self):
+        self.conn.auth_token = self.request.user.token.id
+        self.request._keystoneclient_admin = self.conn
+
+    @mock.patch.object(policy, 'check', return_value=True)
+    def test_admin_policy_checked_once(self, policy_check):
+        self._cache_admin_client()
+
+        for i in range(3):
+            conn = self._original_keystoneclient(self.request, admin=True)
+
+        self.assertIs(self.conn, conn)
+        self.assertEqual(1, policy_check.call_count)
+
+    @mock.patch.object(policy, 'check', return_value=False)
+    def test_admin_policy_denied_once(self, policy_check):
+        self._cache_admin_client()
+
+        for i in range(2):
+            self.assertRaises(exceptions.NotAuthorized,
+                              self._original_keystoneclient,
+                              self.request, admin=True)
+        self.assertEqual(1, policy_check.call_count)
+
+    @mock.patch.object(policy, 'check', return_value=True)
+    def test_admin_policy_rechecked_for_new_token(self, policy_check):
+        self._cache_admin_client()
+
+        self._original_keystoneclient(self.request, admin=True)
+        self.request.user.token.id = 'new-token'
+        self._cache_admin_client()
+        self._original_keystoneclient(self.request, admin=True)
+
+        self.assertEqual(2, policy_check.call_count)
+
+
 class RoleAPITests(test.APITestCase):
     def setUp(self):
         super(RoleAPITests, self).setUp()
@@ -84,6 +129,62 @@ class RoleAPITests(test.APITestCase):
         role = api.keystone.get_default_role(self.request)
 
 
+class UserAPITests(test.APITestCase):
+    @test.update_settings(API_RESULT_PAGE_SIZE=2)
+    def test_user_list_paginate(self):
+        users = self.users.list()
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.users = self.mox.CreateMockAnything()
+        keystoneclient.users.list(project=None, domain='1', group=None,
+                                  name__icontains='USER_').AndReturn(users)
+        self.mox.ReplayAll()
+
+        page, has_more = api.keystone.user_list(
+            self.request, domain='1', filters={'name__icontains': 'USER_'},
+            paginate=True, marker=users[1].id)
+        self.assertEqual(users[2:4], page)
+        self.assertTrue(has_more)
+
+    def test_user_list_paginate_unknown_marker(self):
+        users = self.users.list()
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.users = self.mox.CreateMockAnything()
+        keystoneclient.users.list(project=None, domain='1',
+                                  group=None).AndReturn(users)
+        self.mox.ReplayAll()
+
+        self.assertRaises(exceptions.NotFound, api.keystone.user_list,
+                          self.request, domain='1', paginate=True,
+                          marker='deleted-user')
+
+    def test_user_list_filtered_by_email(self):
+        users = self.users.list()
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.users = self.mox.CreateMockAnything()
+        # Keystone ignoring the filter returns every user.
+        keystoneclient.users.list(project=None, domain='1', group=None,
+                                  email__icontains='T').AndReturn(users)
+        self.mox.ReplayAll()
+
+        found = api.keystone.user_list(self.request, domain='1',
+                                       filters={'email__icontains': 'T'})
+        self.assertEqual(['test_user', 'user_two', 'user_three'],
+                         [user.name for user in found])
+
+    def test_user_search(self):
+        users = self.users.list()
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.users = self.mox.CreateMockAnything()
+        # Keystone ignoring the inexact filter returns every user.
+        keystoneclient.users.list(project=None, domain='1', group=None,
+                                  name__icontains='USER_T').AndReturn(users)
+        self.mox.ReplayAll()
+
+        found = api.keystone.user_search(self.request, 'USER_T', domain='1')
+        self.assertEqual(['user_two', 'user_three'],
+                         [user.name for user in found])
+
+
 class ServiceAPITests(test.APITestCase):
     def test_service_wrapper(self):
         catalog = self.service_catalog
@@ -174,8 +174,13 @@ class LbaasApiTests(test.APITestCase):
         vips = {'vips': self.api_vips.list()}
 
         neutronclient.list_pools().AndReturn(pools)
-        api.neutron.subnet_list(self.request).AndReturn(subnets)
-        neutronclient.list_vips().AndReturn(vips)
+        api.neutron.subnet_list(
+            self.request,
+            id=sorted(set(p['subnet_id'] for p in pools['pools']))) \
+            .AndReturn(subnets)
+        neutronclient.list_vips(
+            id=sorted(set(p['vip_id'] for p in pools['pools']))) \
+            .AndReturn(vips)
         self.mox.ReplayAll()
 
         ret_val = api.lbaas.pool_list(self.request)
@@ -185,12 +190,15 @@ class LbaasApiTests(test.APITestCase):
 
     @test.create_stubs({neutronclient: ('show_pool', 'show_vip',
                                         'list_members',
-                                        'show_health_monitor',),
+                                        'list_health_monitors',),
                         api.neutron: ('subnet_get',)})
     def test_pool_get(self):
         pool = self.pools.first()
         subnet = self.subnets.first()
-        pool_dict = {'pool': self.api_pools.first()}
+        monitors = self.api_monitors.list()
+        monitor_ids = [m['id'] for m in monitors]
+        pool_dict = {'pool': dict(self.api_pools.first(),
+                                  health_monitors=monitor_ids)}
         vip_dict = {'vip': self.api_vips.first()}
 
         neutronclient.show_pool(pool.id).AndReturn(pool_dict)
@@ -198,10 +206,8 @@ class LbaasApiTests(test.APITestCase):
         neutronclient.show_vip(pool.vip_id).AndReturn(vip_dict)
         neutronclient.list_members(pool_id=pool.id).AndReturn(
             {'members': self.api_members.list()})
-        monitor = self.api_monitors.first()
-        for pool_mon in pool.health_monitors:
-            neutronclient.show_health_monitor(pool_mon).AndReturn(
-                {'health_monitor': monitor})
+        neutronclient.list_health_monitors(id=sorted(monitor_ids)) \
+            .AndReturn({'health_monitors': monitors})
         self.mox.ReplayAll()
 
         ret_val = api.lbaas.pool_get(self.request, pool.id)
@@ -212,8 +218,8 @@ class LbaasApiTests(test.APITestCase):
         self.assertEqual(ret_val.subnet.id, subnet.id)
         self.assertEqual(2, len(ret_val.members))
         self.assertIsInstance(ret_val.members[0], api.lbaas.Member)
-        self.assertEqual(len(pool.health_monitors),
-                         len(ret_val.health_monitors))
+        self.assertEqual(monitor_ids,
+                         [m.id for m in ret_val.health_monitors])
         self.assertIsInstance(ret_val.health_monitors[0],
                               api.lbaas.PoolMonitor)
 
@@ -332,7 +338,9 @@ class LbaasApiTests(test.APITestCase):
         pools = {'pools': self.api_pools.list()}
 
         neutronclient.list_members().AndReturn(members)
-        neutronclient.list_pools().AndReturn(pools)
+        neutronclient.list_pools(
+            id=sorted(set(m['pool_id'] for m in members['members']))) \
+            .AndReturn(pools)
         self.mox.ReplayAll()
 
         ret_val = api.lbaas.member_list(self.request)
@@ -12,7 +12,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 import copy
-
+import functools
 import uuid
 
 from django.test.utils import override_settings
@@ -579,3 +579,36 @@ class NeutronApiTests(test.APITestCase):
             request=self.request)
         self.assertEqual(10, len(ret_val))
         self.assertEqual(port_ids, [p.id for p in ret_val])
+
+    def test_expand_resources(self):
+        ports = self.api_ports.list()[:2]
+        port_ids = sorted(port['id'] for port in ports)
+        items = [{'port_id': ports[0]['id']},
+                 {'port_id': None},
+                 {'port_id': [ports[1]['id'], 'gone', ports[0]['id']]}]
+
+        neutronclient = self.stub_neutronclient()
+        neutronclient.list_ports(id=sorted(port_ids + ['gone'])) \
+            .AndReturn({'ports': ports})
+        self.mox.ReplayAll()
+
+        ret_val = api.neutron.expand_resources(
+            items, 'port_id', 'port',
+            functools.partial(api.neutron.port_list, self.request))
+        self.assertEqual(port_ids, sorted(ret_val))
+        self.assertEqual(ports[0]['id'], items[0]['port'].id)
+        self.assertIsNone(items[1]['port'])
+        self.assertEqual([ports[1]['id'], None, ports[0]['id']],
+                         [p and p.id for p in items[2]['port']])
+
+    def test_expand_resources_without_ids(self):
+        self.stub_neutronclient()
+        self.mox.ReplayAll()
+
+        items = [{'port_id': None}, {'port_id': []}]
+        ret_val = api.neutron.expand_resources(
+            items, 'port_id', 'port',
+            functools.partial(api.neutron.port_list, self.request))
+        self.assertEqual({}, ret_val)
+        self.assertIsNone(items[0]['port'])
+        self.assertEqual([], items[1]['port'])
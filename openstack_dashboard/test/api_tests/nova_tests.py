@@ -177,6 +177,21 @@ class ComputeApiTests(test.APITestCase):
         self.assertEqual(page_size, len(ret_val))
         self.assertTrue(has_more)
 
+    def test_flavor_list_by_ids(self):
+        flavors = self.flavors.list()
+        deleted = flavors[-1]
+        novaclient = self.stub_novaclient()
+        novaclient.flavors = self.mox.CreateMockAnything()
+        novaclient.flavors.list(is_public=None).AndReturn(flavors[:-1])
+        novaclient.flavors.get(deleted.id).AndReturn(deleted)
+        novaclient.flavors.get('unknown') \
+            .AndRaise(nova_exceptions.NotFound(404))
+        self.mox.ReplayAll()
+
+        flavor_ids = (flavors[0].id, deleted.id, 'unknown')
+        ret_val = api.nova.flavor_list_by_ids(self.request, flavor_ids)
+        self.assertEqual([flavors[0], deleted], ret_val)
+
     def test_usage_get(self):
         novaclient = self.stub_novaclient()
         novaclient.usage = self.mox.CreateMockAnything()
@@ -11,6 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
+
+import mock
+
 from openstack_dashboard.api.rest import json_encoder
 from openstack_dashboard.api.rest import utils
 from openstack_dashboard.test import helpers as test
@@ -168,6 +172,110 @@ class RestUtilsTestCase(test.TestCase):
         self.assertDictEqual({}, output_kwargs)
         self.assertDictEqual({}, output_filters)
 
+    @mock.patch.object(utils, 'log')
+    def test_bulk_call(self, log):
+        def f(id):
+            if id == 'id2':
+                raise utils.AjaxError(404, 'b0rk')
+            if id == 'id3':
+                raise ValueError('oops')
+
+        results = utils.bulk_call(f, ['id1', 'id2', 'id3'])
+        self.assertEqual(['id1', 'id2', 'id3'], list(results))
+        self.assertEqual({'status': 204, 'error': None}, results['id1'])
+        self.assertEqual({'status': 404, 'error': 'b0rk'}, results['id2'])
+        self.assertEqual({'status': 500, 'error': 'oops'}, results['id3'])
+
+    def test_bulk_response(self):
+        response = utils.BulkResponse(
+            utils.bulk_call(lambda id: None, ['id1', 'id2']))
+        self.assertStatusCode(response, 204)
+        self.assertEqual(response.content, '')
+
+    def test_bulk_response_failure(self):
+        def f(id):
+            if id != 'id1':
+                raise utils.AjaxError(409, 'conflict %s' % id)
+
+        response = utils.BulkResponse(
+            utils.bulk_call(f, ['id1', 'id2', 'id3']))
+        self.assertStatusCode(response, 409)
+        self.assertEqual({'id1': {'status': 204, 'error': None},
+                          'id2': {'status': 409, 'error': 'conflict id2'},
+                          'id3': {'status': 409, 'error': 'conflict id3'}},
+                         json.loads(response.content))
+
+    def test_conditional(self):
+        calls = []
+
+        @utils.conditional(max_age=60)
+        @utils.ajax()
+        def f(self, request):
+            calls.append(request)
+            return {'name': 'spam'}
+
+        request = self.mock_rest_request(method='GET', META={})
+        response = f(None, request)
+        self.assertStatusCode(response, 200)
+        self.assertEqual(response.content, '{"name": "spam"}')
+        etag = response['ETag']
+        self.assertEqual('private, max-age=60', response['Cache-Control'])
+
+        request = self.mock_rest_request(
+            method='GET', META={'HTTP_IF_NONE_MATCH': etag})
+        response = f(None, request)
+        self.assertStatusCode(response, 304)
+        self.assertEqual(response.content, '')
+        self.assertEqual(etag, response['ETag'])
+        self.assertEqual(2, len(calls))
+
+        request = self.mock_rest_request(
+            method='GET', META={'HTTP_IF_NONE_MATCH': '"other"'})
+        self.assertStatusCode(f(None, request), 200)
+
+    def test_conditional_etag_func(self):
+        calls = []
+
+        @utils.conditional(etag_func=lambda request, id: 'v-%s' % id)
+        @utils.ajax()
+        def f(self, request, id):
+            calls.append(id)
+            return {'id': id}
+
+        request = self.mock_rest_request(method='GET', META={})
+        response = f(None, request, '1')
+        self.assertStatusCode(response, 200)
+        self.assertEqual('"v-1"', response['ETag'])
+        self.assertEqual('private, max-age=0', response['Cache-Control'])
+
+        request = self.mock_rest_request(
+            method='GET', META={'HTTP_IF_NONE_MATCH': '"v-1"'})
+        response = f(None, request, '1')
+        self.assertStatusCode(response, 304)
+        self.assertEqual('"v-1"', response['ETag'])
+        self.assertEqual(['1'], calls)
+
+    def test_conditional_error_and_post(self):
+        @utils.conditional()
+        @utils.ajax()
+        def f(self, request):
+            raise utils.AjaxError(404, 'b0rk')
+
+        request = self.mock_rest_request(method='GET', META={})
+        response = f(None, request)
+        self.assertStatusCode(response, 404)
+        self.assertFalse(response.has_header('ETag'))
+
+        @utils.conditional()
+        @utils.ajax()
+        def g(self, request):
+            return 'ok'
+
+        request = self.mock_rest_request(method='POST', META={})
+        response = g(None, request)
+        self.assertStatusCode(response, 200)
+        self.assertFalse(response.has_header('ETag'))
+
 
 class JSONEncoderTestCase(test.TestCase):
     # NOTE(tsufiev): NaN numeric is "conventional" in a sense that the custom
@@ -175,6 +283,8 @@ class JSONEncoderTestCase(test.TestCase):
     # JSONEncoder encoder does
     conventional_data = {'key1': 'string', 'key2': 10, 'key4': [1, 'some'],
                          'key5': {'subkey': 7}, 'nanKey': float('nan')}
+    conventional_data_finite = {'key1': 'string', 'key2': 10.5,
+                                'key4': [1, 'some'], 'key5': {'subkey': 7}}
     data_nan = float('nan')
     data_inf = float('inf')
     data_neginf = -float('inf')
@@ -248,3 +358,73 @@ class JSONEncoderTestCase(test.TestCase):
 
         self.assertNotEqual(default_encoder_response.content,
                             custom_encoder_response.content)
+
+    def test_custom_encoder_fast_path(self):
+        encoder = json_encoder.NaNJSONEncoder()
+        with mock.patch.object(json_encoder.NaNJSONEncoder,
+                               'iterencode') as iterencode:
+            self.assertEqual(json.dumps(self.conventional_data_finite),
+                             encoder.encode(self.conventional_data_finite))
+        self.assertFalse(iterencode.called)
+        self.assertEqual('[1, NaN, 1e+999]',
+                         encoder.encode([1, self.data_nan, self.data_inf]))
+
+    def test_custom_encoder_not_allow_nan(self):
+        encoder = json_encoder.NaNJSONEncoder(allow_nan=False)
+        self.assertRaises(ValueError, encoder.encode, [self.data_nan])
+
+    def test_iterencode(self):
+        items = [{'id': i, 'name': 'item %d' % i} for i in range(7)]
+        for data in (items, {'items': items, 'has_more_data': True},
+                     {'items': [], 'count': {1: 2}}, 'spam', {1: items}):
+            for sort_keys in (False, True):
+                encoder = json.JSONEncoder(sort_keys=sort_keys)
+                chunks = list(json_encoder.iterencode(data, encoder,
+                                                      chunk_size=3))
+                self.assertEqual(json.dumps(data, sort_keys=sort_keys),
+                                 ''.join(chunks))
+        # '[', three chunks of items, their two separators and ']'.
+        self.assertEqual(7, len(list(json_encoder.iterencode(
+            items, encoder, chunk_size=3))))
+
+    def test_iterencode_nan(self):
+        encoder = json_encoder.NaNJSONEncoder()
+        chunks = json_encoder.iterencode({'items': [self.data_nan, 1]},
+                                         encoder)
+        self.assertEqual('{"items": [NaN, 1]}', ''.join(chunks))
+
+    @mock.patch.object(utils, 'STREAMING_THRESHOLD', 3)
+    def test_streamed_response(self):
+        @utils.ajax(json_encoder=json_encoder.NaNJSONEncoder)
+        def f(self, request, count):
+            return {'items': [self.data_nan] + list(range(count))}
+
+        request = self.mock_rest_request()
+        response = f(self, request, 1)
+        self.assertFalse(response.streaming)
+        self.assertEqual('{"items": [NaN, 0]}', response.content)
+
+        response = f(self, request, 2)
+        self.assertTrue(response.streaming)
+        self.assertStatusCode(response, 200)
+        self.assertEqual(response['content-type'], 'application/json')
+        self.assertEqual('{"items": [NaN, 0, 1]}',
+                         utils.get_content(response))
+
+    @mock.patch.object(utils, 'STREAMING_THRESHOLD', 3)
+    def test_streamed_response_encoding_error(self):
+        @utils.ajax(json_encoder=json_encoder.NaNJSONEncoder)
+        def f(self, request, items):
+            return {'items': items}
+
+        request = self.mock_rest_request()
+        # The first chunk is encoded by the view, which fails cleanly.
+        response = f(self, request, [self.data_nan, 1, object()])
+        self.assertStatusCode(response, 500)
+
+    @mock.patch.object(utils, 'log')
+    def test_streamed_response_late_encoding_error(self, log):
+        items = [1] * json_encoder.CHUNK_SIZE + [object()]
+        response = utils.StreamingJSONResponse({'items': items})
+        self.assertRaises(Exception, utils.get_content, response)
+        self.assertTrue(log.exception.called)
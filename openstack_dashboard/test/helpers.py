@@ -344,7 +344,8 @@ class APITestCase(TestCase):
         self._original_ceilometerclient = api.ceilometer.ceilometerclient
 
         # Replace the clients with our stubs.
-        api.glance.glanceclient = lambda request: self.stub_glanceclient()
+        api.glance.glanceclient = lambda request, version=None: \
+            self.stub_glanceclient()
         api.keystone.keystoneclient = fake_keystoneclient
         api.nova.novaclient = lambda request: self.stub_novaclient()
         api.neutron.neutronclient = lambda request: self.stub_neutronclient()
@@ -403,18 +404,18 @@ class APITestCase(TestCase):
 
     def stub_swiftclient(self, expected_calls=1):
         if not hasattr(self, "swiftclient"):
-            self.mox.StubOutWithMock(swift_client, 'Connection')
+            self.mox.StubOutWithMock(api.swift, 'PooledConnection')
             self.swiftclient = self.mox.CreateMock(swift_client.Connection)
             while expected_calls:
-                swift_client.Connection(None,
-                                        mox.IgnoreArg(),
-                                        None,
-                                        preauthtoken=mox.IgnoreArg(),
-                                        preauthurl=mox.IgnoreArg(),
-                                        cacert=None,
-                                        insecure=False,
-                                        auth_version="2.0") \
-                            .AndReturn(self.swiftclient)
+                api.swift.PooledConnection(None,
+                                           mox.IgnoreArg(),
+                                           None,
+                                           preauthtoken=mox.IgnoreArg(),
+                                           preauthurl=mox.IgnoreArg(),
+                                           cacert=None,
+                                           insecure=False,
+                                           auth_version="2.0") \
+                    .AndReturn(self.swiftclient)
                 expected_calls -= 1
         return self.swiftclient
 
@@ -10,6 +10,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import os
+import shutil
+import tempfile
+
 from django.test.utils import override_settings
 
 from openstack_dashboard import policy
@@ -69,6 +73,46 @@ class PolicyBackendTestCase(test.TestCase):
                              request=self.request)
         self.assertTrue(value)
 
+    @override_settings(POLICY_CHECK_FUNCTION=policy_backend.check)
+    def test_decisions_cached_per_request(self):
+        policy_backend.reset()
+        for i in range(3):
+            policy.check((("compute", "context_is_admin"),),
+                         request=self.request)
+        policy.check((("compute", "context_is_admin"),),
+                     request=self.request, target={'project_id': 'other'})
+
+        stats = policy_backend.get_stats()
+        self.assertEqual(2, stats['hits'])
+        self.assertEqual(2, stats['misses'])
+        self.assertEqual(0.5, stats['hit_rate'])
+
+    @override_settings(POLICY_CHECK_FUNCTION=policy_backend.check)
+    def test_policy_file_reloaded_when_modified(self):
+        policy_path = os.path.join(tempfile.mkdtemp(), 'policy.json')
+        self.addCleanup(shutil.rmtree, os.path.dirname(policy_path))
+        with open(policy_path, 'w') as f:
+            f.write('{"default": "!"}')
+        policy_backend.reset()
+        enforcer = policy_backend._get_enforcer()['identity']
+        enforcer.policy_path = policy_path
+
+        self.assertFalse(policy.check((("identity", "anything"),),
+                                      request=self.request))
+
+        with open(policy_path, 'w') as f:
+            f.write('{"default": "@"}')
+        mtime = os.path.getmtime(policy_path) + 10
+        os.utime(policy_path, (mtime, mtime))
+
+        # Files are only looked at again by the next request.
+        self.assertFalse(policy.check((("identity", "anything"),),
+                                      request=self.request))
+        del self.request._policy_state
+        self.assertTrue(policy.check((("identity", "anything"),),
+                                     request=self.request))
+        self.assertEqual(2, policy_backend.get_stats()['reloads'])
+
 
 class PolicyBackendTestCaseAdmin(test.BaseAdminViewTests):
     @override_settings(POLICY_CHECK_FUNCTION=policy_backend.check)
@@ -78,7 +78,8 @@ class QuotaTests(test.APITestCase):
                              all_tenants=True) \
             .AndReturn([servers, False])
         opts = {'all_tenants': 1, 'project_id': self.request.user.tenant_id}
-        cinder.volume_list(IsA(http.HttpRequest), opts) \
+        cinder.volume_list(IsA(http.HttpRequest), opts,
+                           with_transfers=False) \
             .AndReturn(self.volumes.list())
         cinder.volume_snapshot_list(IsA(http.HttpRequest), opts) \
             .AndReturn(self.cinder_volume_snapshots.list())
@@ -202,7 +203,8 @@ class QuotaTests(test.APITestCase):
                              all_tenants=True) \
             .AndReturn([servers, False])
         opts = {'all_tenants': 1, 'project_id': self.request.user.tenant_id}
-        cinder.volume_list(IsA(http.HttpRequest), opts) \
+        cinder.volume_list(IsA(http.HttpRequest), opts,
+                           with_transfers=False) \
             .AndReturn(self.volumes.list())
         cinder.volume_snapshot_list(IsA(http.HttpRequest), opts) \
             .AndReturn(self.cinder_volume_snapshots.list())
@@ -247,7 +249,8 @@ class QuotaTests(test.APITestCase):
                              all_tenants=True) \
             .AndReturn([servers, False])
         opts = {'all_tenants': 1, 'project_id': self.request.user.tenant_id}
-        cinder.volume_list(IsA(http.HttpRequest), opts) \
+        cinder.volume_list(IsA(http.HttpRequest), opts,
+                           with_transfers=False) \
             .AndReturn(self.volumes.list())
         cinder.volume_snapshot_list(IsA(http.HttpRequest), opts) \
             .AndReturn(self.cinder_volume_snapshots.list())
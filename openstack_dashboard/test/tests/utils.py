@@ -16,9 +16,15 @@
 import datetime
 import uuid
 
+import mock
+
+from django.test.utils import override_settings  # noqa
+
+from openstack_dashboard import policy_backend
 from openstack_dashboard.test import helpers as test
 from openstack_dashboard.utils import filters
 from openstack_dashboard.utils import metering
+from openstack_dashboard.utils import warmup
 
 
 class UtilsFilterTests(test.TestCase):
@@ -63,3 +69,34 @@ class UtilsMeteringTests(test.TestCase):
     def test_calc_date_args_invalid(self):
         self.assertRaises(
             ValueError, metering.calc_date_args, object, object, "other")
+
+
+class UtilsWarmUpTests(test.TestCase):
+
+    @override_settings(POLICY_CHECK_FUNCTION=policy_backend.check)
+    def test_warm_up(self):
+        results = warmup.warm_up()
+        self.assertEqual(['urlconf', 'templates', 'policies', 'api'],
+                         list(results))
+        for elapsed, result in results.values():
+            self.assertNotIsInstance(result, Exception)
+        self.assertGreater(results['templates'][1], 0)
+        self.assertEqual(len(policy_backend._get_enforcer()),
+                         results['policies'][1])
+        self.assertEqual(len(warmup.CLIENT_MODULES), results['api'][1])
+
+    @override_settings(POLICY_CHECK_FUNCTION=None)
+    def test_warm_up_steps(self):
+        results = warmup.warm_up(['policies'])
+        self.assertEqual(['policies'], list(results))
+        # The policy files aren't those checked.
+        self.assertEqual(0, results['policies'][1])
+
+    def test_warm_up_step_fails(self):
+        error = ValueError()
+        steps = (('broken', mock.Mock(side_effect=error)),
+                 ('working', mock.Mock(return_value=1)))
+        with mock.patch.object(warmup, 'STEPS', steps):
+            results = warmup.warm_up()
+        self.assertIs(error, results['broken'][1])
+        self.assertEqual(1, results['working'][1])
@@ -335,10 +335,11 @@ def _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id):
         try:
             if tenant_id:
                 opts = {'all_tenants': 1, 'project_id': tenant_id}
-                volumes = cinder.volume_list(request, opts)
+                volumes = cinder.volume_list(request, opts,
+                                             with_transfers=False)
                 snapshots = cinder.volume_snapshot_list(request, opts)
             else:
-                volumes = cinder.volume_list(request)
+                volumes = cinder.volume_list(request, with_transfers=False)
                 snapshots = cinder.volume_snapshot_list(request)
             usages.tally('gigabytes', sum([int(v.size) for v in volumes]))
             usages.tally('volumes', len(volumes))
@@ -387,7 +388,7 @@ def tenant_limit_usages(request):
     if base.is_service_enabled(request, 'volume'):
         try:
             limits.update(cinder.tenant_absolute_limits(request))
-            volumes = cinder.volume_list(request)
+            volumes = cinder.volume_list(request, with_transfers=False)
             snapshots = cinder.volume_snapshot_list(request)
             total_size = sum([getattr(volume, 'size', 0) for volume
                               in volumes])
@@ -57,7 +57,8 @@ def import_dashboard_config(modules):
                   key=lambda c: c[1]['__name__'].rsplit('.', 1))
 
 
-def update_dashboards(modules, horizon_config, installed_apps):
+def update_dashboards(modules, horizon_config, installed_apps,
+                      static_files_manifest=None):
     """Imports dashboard and panel configuration from modules and applies it.
 
     The submodules from specified modules are imported, and the configuration
@@ -121,7 +122,8 @@ def update_dashboards(modules, horizon_config, installed_apps):
             for _app in _apps:
                 module = importlib.import_module(_app)
                 base_path = os.path.join(module.__path__[0], 'static/')
-                fd.populate_horizon_config(horizon_config, base_path)
+                fd.populate_horizon_config(horizon_config, base_path,
+                                           manifest=static_files_manifest)
 
         add_exceptions = six.iteritems(config.get('ADD_EXCEPTIONS', {}))
         for category, exc_list in add_exceptions:
@@ -0,0 +1,144 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Does the work of the first requests of a process before it serves them.
+
+Run by the WSGI script before the server forks its workers (see the
+``WSGI_WARM_UP`` setting), the work is shared by all of them, copy-on-write,
+rather than done again by each one.
+"""
+
+import collections
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.core import urlresolvers
+from django.template import loader
+from django.utils.importlib import import_module  # noqa
+
+from horizon import base
+from horizon import loaders
+
+from openstack_dashboard import policy_backend
+
+
+LOG = logging.getLogger(__name__)
+
+# The API client modules only imported once a client is first created.
+CLIENT_MODULES = (
+    'ceilometerclient.v2.client',
+    'cinderclient.v2.client',
+    'glanceclient.v1.client',
+    'glanceclient.v2.client',
+    'heatclient.v1.client',
+    'keystoneclient.v2_0.client',
+    'keystoneclient.v3.client',
+    'novaclient.v2.client',
+)
+
+
+def _populate(resolver):
+    # Namespaced URLconfs are only populated when they are first used.
+    resolver.reverse_dict
+    for prefix, sub_resolver in resolver.namespace_dict.values():
+        patterns = sub_resolver.urlconf_name
+        if isinstance(patterns, base.LazyURLPattern) and not patterns.loaded:
+            # A panel loaded lazily (see "lazy_panels") stays so.
+            continue
+        _populate(sub_resolver)
+
+
+def build_urlconf():
+    """Builds the URLconf, discovering the dashboards and their panels."""
+    _populate(urlresolvers.get_resolver(None))
+
+
+def compile_templates():
+    """Compiles the templates of the panels.
+
+    The compiled templates are only kept if the template loaders are cached
+    (``django.template.loaders.cached.Loader``), as they are with
+    ``WSGI_WARM_UP`` unless ``DEBUG`` is set. Returns how many templates
+    were compiled.
+    """
+    count = 0
+    for key, template_dir in loaders.panel_template_dirs.items():
+        # Templates are looked up as "<dashboard>/<panel>/<path>" in the
+        # <panel> directory of the templates of the panel.
+        panel_dir = os.path.join(template_dir, os.path.basename(key))
+        for dirpath, dirnames, filenames in os.walk(panel_dir):
+            for filename in filenames:
+                path = os.path.relpath(os.path.join(dirpath, filename),
+                                       panel_dir)
+                name = '/'.join([key.replace(os.sep, '/')] +
+                                path.split(os.sep))
+                try:
+                    loader.get_template(name)
+                except Exception as e:
+                    LOG.debug("Could not compile template %s: %s", name, e)
+                else:
+                    count += 1
+    return count
+
+
+def load_policies():
+    """Loads the rules of the policy files. Returns how many were loaded."""
+    if getattr(settings, 'POLICY_CHECK_FUNCTION', None) is not \
+            policy_backend.check:
+        return 0
+    return policy_backend.load()
+
+
+def import_api_modules():
+    """Imports the API modules and their clients. Returns how many."""
+    import_module('openstack_dashboard.api')
+    count = 0
+    for module in CLIENT_MODULES:
+        try:
+            import_module(module)
+        except ImportError as e:
+            LOG.debug("Could not import %s: %s", module, e)
+        else:
+            count += 1
+    return count
+
+
+STEPS = (
+    ('urlconf', build_urlconf),
+    ('templates', compile_templates),
+    ('policies', load_policies),
+    ('api', import_api_modules),
+)
+
+
+def warm_up(steps=None):
+    """Runs the warm-up ``steps``, by default all of :data:`STEPS`.
+
+    A step failing is logged, but doesn't stop the other ones. Returns an
+    ordered dict mapping the name of each step to how long it took, in
+    seconds, and what it returned (or the exception it raised).
+    """
+    results = collections.OrderedDict()
+    for name, step in STEPS:
+        if steps is not None and name not in steps:
+            continue
+        start = time.time()
+        try:
+            result = step()
+        except Exception as e:
+            LOG.exception("Warming up the %s failed.", name)
+            result = e
+        results[name] = (time.time() - start, result)
+        LOG.debug("Warmed up the %s in %.3f s.", name, results[name][0])
+    return results
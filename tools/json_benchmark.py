@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Compares the ways the REST API can encode a large list response.
+
+Run from the top of the tree, e.g.::
+
+    python tools/json_benchmark.py --items 5000 --repeat 20
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'openstack_dashboard.settings')
+
+import django  # noqa
+django.setup()
+
+from oslo_serialization import jsonutils  # noqa
+
+from openstack_dashboard.api.rest import json_encoder  # noqa
+
+
+def make_data(count, nan=False):
+    items = [{'id': '%032x' % i,
+              'name': u'flavor-%d' % i,
+              'ram': 2048 * (i % 8 + 1),
+              'vcpus': i % 16 + 1,
+              'disk': 20.0 * (i % 4),
+              'is_public': bool(i % 2),
+              'extras': {'hw:cpu_policy': 'dedicated',
+                         'quota:disk_read_bytes_sec': str(i * 1024)}}
+             for i in range(count)]
+    if nan:
+        items[-1]['disk'] = float('nan')
+    return {'items': items}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=2000,
+                        help='number of items in the response')
+    parser.add_argument('--repeat', type=int, default=10,
+                        help='number of times each encoding is timed')
+    args = parser.parse_args()
+
+    data = make_data(args.items)
+    data_nan = make_data(args.items, nan=True)
+    nan_encoder = json_encoder.NaNJSONEncoder(
+        default=jsonutils.to_primitive)
+
+    paths = [
+        ('jsonutils.dumps (standard encoder)',
+         lambda: jsonutils.dumps(data)),
+        ('NaNJSONEncoder, pure Python iterencode()',
+         lambda: ''.join(nan_encoder.iterencode(data))),
+        ('NaNJSONEncoder.encode(), no NaN',
+         lambda: nan_encoder.encode(data)),
+        ('NaNJSONEncoder.encode(), with NaN',
+         lambda: nan_encoder.encode(data_nan)),
+        ('iterencode() streaming, standard encoder',
+         lambda: ''.join(json_encoder.iterencode(
+             data, json.JSONEncoder(default=jsonutils.to_primitive)))),
+        ('iterencode() streaming, NaNJSONEncoder',
+         lambda: ''.join(json_encoder.iterencode(data, nan_encoder))),
+    ]
+    print('%d items, best of %d runs' % (args.items, args.repeat))
+    for name, fn in paths:
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        print('%-45s %8.2f ms' % (name, best * 1000))
+
+
+if __name__ == '__main__':
+    main()